@@ -1,9 +1,23 @@
 from requirements import *
+from geometry import net_distance, net_angle, angle_change, angle_change_speed, model_goal_x
+from pbpstore import scan_season_pbp, scan_pbp_seasons, season_base_path, pbp_root, remote_pbp_root
+from pbpstore import scan_pbp_dataset, season_partition_dir, hive_root, list_season_deltas
+from pbptypes import cast_pbp_types, pbp_id_dtype
+from ipccache import read_cached
+from featurestore import code_fingerprint, frame_fingerprint, input_checksum, feature_key, read_features, save_features, feature_root, feature_strengths
+import geometry
+import pbptypes
+import modeling
+from functools import lru_cache
 
 #### CONSTANTS + FUNCTIONS ####
 st_yr = 2010
 end_yr = 2025
 
+# Streaming Build - Constants ###
+model_data_root = 'Model/parquet'   # stream_model_data writes {root}/{strength}/NHL_Model_{strength}_{season}.parquet
+model_strengths = ['EV', 'PP', 'SH', 'EN']
+
 # Event Type Constant ###
 xG_Events = ['GOAL', 'SHOT', 'MISSED_SHOT', 'BLOCKED_SHOT', 'FACEOFF', 'TAKEAWAY', 'GIVEAWAY', 'HIT']
 fenwick_events = ['SHOT', 'GOAL', 'MISSED_SHOT']
@@ -16,32 +30,178 @@ UE_STR_Codes = ["5v4", "4v5", "5v3", "3v5", "4v3", "3v4", "5vE", "Ev5", "4vE", "
 SH_STR_Codes = ['5v6', '4v5', '3v4', '4v6']
 
 
-# Load Rosters
+# Rosters (Read On First Use, Not At Import)
 roster_file = 'https://raw.githubusercontent.com/twinfield10/NHL-Data/main/Rosters/parquet/all/NHL_Roster_AllSeasons_Slim.parquet'
-ROSTER_DF_RAW = pl.read_parquet(roster_file)
-ROSTER_DF = (
-    ROSTER_DF_RAW
-    .rename({"player_id": "event_player_1_id"})
-    .with_columns([
-        pl.col("event_player_1_id").cast(pl.Utf8),
-        pl.when((pl.col('pos_F') == 0) & (pl.col('pos_G') == 0)).then(pl.lit(1)).otherwise(pl.lit(0)).alias('pos_D')
-        ])
-    .select(['event_player_1_id', 'hand_R', 'hand_L', 'pos_F', 'pos_D', 'pos_G'])
-    .unique()
-)
-
-# Create Goalie DF
-GOALIES = (
-    ROSTER_DF_RAW
-    .filter(pl.col('pos_G') == 1)
-    .with_columns([pl.col("player_id").cast(pl.Utf8)])
-    .select('player_id','hand_R', 'hand_L')
-    .unique()
-)
-GOALIES.columns = ['event_goalie_id', 'G_hand_R', 'G_hand_L']
+
+@lru_cache(maxsize=None)
+def roster_lookup():
+    """Shooter hand/position lookup joined in model_prep (memoized, roster_file is read the first time it is needed)"""
+    return (
+        read_cached(roster_file)
+        .rename({"player_id": "event_player_1_id"})
+        .with_columns([
+            pl.col("event_player_1_id").cast(pbp_id_dtype),
+            pl.when((pl.col('pos_F') == 0) & (pl.col('pos_G') == 0)).then(pl.lit(1)).otherwise(pl.lit(0)).alias('pos_D')
+            ])
+        .select(['event_player_1_id', 'hand_R', 'hand_L', 'pos_F', 'pos_D', 'pos_G'])
+        .unique()
+    )
+
+@lru_cache(maxsize=None)
+def goalie_lookup():
+    """Goalie hand lookup joined in model_prep (memoized like roster_lookup)"""
+    return (
+        read_cached(roster_file)
+        .filter(pl.col('pos_G') == 1)
+        .select(pl.col("player_id").cast(pbp_id_dtype).alias('event_goalie_id'), pl.col('hand_R').alias('G_hand_R'), pl.col('hand_L').alias('G_hand_L'))
+        .unique()
+    )
+
+## MODEL FEATURE REGISTRY ##
+# Every model_prep feature is defined once as (name, strengths it applies to, expression). compile_model_features turns the
+# entries for a strength into one deduplicated expression list that runs in a single with_columns pass, so batch loads and
+# single event scoring (any frame shaped like a split_by_strength output) build features from the same definitions.
+
+# Helper: 1/0 Flag From A Condition
+def flag(cond):
+    return pl.when(cond).then(pl.lit(1)).otherwise(pl.lit(0))
+
+# Helper: Shooting Team Is Up A Manpower State (home_state From The Home Team's View, away_state From The Away Team's)
+def team_state(home_state, away_state):
+    return flag(((pl.col('true_strength_state') == home_state) & (pl.col('event_team_type') == 'home')) |
+                ((pl.col('true_strength_state') == away_state) & (pl.col('event_team_type') == 'away')))
+
+# Helper: Prior Event Type By The Same (1) Or Opposing (0) Team
+def prior_event(event_type, same_team):
+    return (pl.col('event_type_last') == event_type) & (pl.col('same_team_last') == same_team)
+
+# Prior Events Used By The Play Type Flags (Kept As Expressions So Everything Fits In One Pass)
+prior_turnover = (prior_event('GIVEAWAY', 0) | prior_event('SHOT', 0) | prior_event('MISSED_SHOT', 0) |
+                  prior_event('BLOCKED_SHOT', 0) | prior_event('TAKEAWAY', 1))
+
+ALL_STR = ['EV', 'PP', 'SH', 'EN']
+model_feature_registry = [
+    # Target Variable
+    ('is_goal', ALL_STR, flag(pl.col('event_type') == "GOAL")),
+    # Game State
+    ('state_5v5', ['EV'], flag(pl.col('strength_state') == "5v5")),
+    ('state_4v4', ['EV'], flag(pl.col('strength_state') == "4v4")),
+    ('state_3v3', ['EV'], flag(pl.col('strength_state') == "3v3")),
+    ('state_5v4', ['PP'], team_state("5v4", "4v5")),
+    ('state_5v3', ['PP'], team_state("5v3", "3v5")),
+    ('state_4v3', ['PP'], team_state("4v3", "3v4")),
+    ('state_6v5', ['PP'], team_state("6v5", "5v6")),
+    ('state_6v4', ['PP'], team_state("6v4", "4v6")),
+    ('state_4v5', ['SH'], team_state("4v5", "5v4")),
+    ('state_3v5', ['SH'], team_state("3v5", "5v3")),
+    ('state_3v4', ['SH'], team_state("3v4", "4v3")),
+    ('state_Ev5', ['EN'], team_state("5vE", "Ev5")),
+    ('state_Ev4', ['EN'], team_state("4vE", "Ev4")),
+    ('state_Ev3', ['EN'], team_state("3vE", "Ev3")),
+    # Score State
+    ('score_down_4', ALL_STR, flag(pl.col('score_state') <= -4)),
+    ('score_down_3', ALL_STR, flag(pl.col('score_state') == -3)),
+    ('score_down_2', ALL_STR, flag(pl.col('score_state') == -2)),
+    ('score_down_1', ALL_STR, flag(pl.col('score_state') == -1)),
+    ('score_even', ALL_STR, flag(pl.col('score_state') == 0)),
+    ('score_up_1', ALL_STR, flag(pl.col('score_state') == 1)),
+    ('score_up_2', ALL_STR, flag(pl.col('score_state') == 2)),
+    ('score_up_3', ALL_STR, flag(pl.col('score_state') == 3)),
+    ('score_up_4', ALL_STR, flag(pl.col('score_state') >= 4)),
+    # Prior Shot Outcome
+    ('prior_shot_same', ALL_STR, flag(prior_event('SHOT', 1))),
+    ('prior_miss_same', ALL_STR, flag(prior_event('MISSED_SHOT', 1))),
+    ('prior_block_same', ALL_STR, flag(prior_event('BLOCKED_SHOT', 1))),
+    ('prior_shot_opp', ALL_STR, flag(prior_event('SHOT', 0))),
+    ('prior_miss_opp', ALL_STR, flag(prior_event('MISSED_SHOT', 0))),
+    ('prior_block_opp', ALL_STR, flag(prior_event('BLOCKED_SHOT', 0))),
+    # Prior Event - Non Shot
+    ('prior_give_opp', ALL_STR, flag(prior_event('GIVEAWAY', 0))),
+    ('prior_give_same', ALL_STR, flag(prior_event('GIVEAWAY', 1))),
+    ('prior_take_opp', ALL_STR, flag(prior_event('TAKEAWAY', 0))),
+    ('prior_take_same', ALL_STR, flag(prior_event('TAKEAWAY', 1))),
+    ('prior_hit_opp', ALL_STR, flag(prior_event('HIT', 0))),
+    ('prior_hit_same', ALL_STR, flag(prior_event('HIT', 1))),
+    ('prior_face_win', ALL_STR, flag(prior_event('FACEOFF', 1))),
+    ('prior_face_lose', ALL_STR, flag(prior_event('FACEOFF', 0))),
+    # Handiness
+    ('off_wing', ALL_STR, flag(((pl.col('hand_R') == 1) & (pl.col('y_abs') > 0) & (pl.col('event_angle') > 10)) |
+                               ((pl.col('hand_L') == 1) & (pl.col('y_abs') < 0) & (pl.col('event_angle') > 10)))),
+    # Rebound Flags
+    ('is_rebound', ALL_STR, flag(prior_event('SHOT', 1) & (pl.col('seconds_since_last') <= 3))),
+    ('is_post_miss_shot', ALL_STR, flag((prior_event('MISSED_SHOT', 1) | prior_event('BLOCKED_SHOT', 1)) & (pl.col('seconds_since_last') <= 3))),
+    # Set Play (Faceoff Win + Shot In 3 Seconds)
+    ('is_set_play', ALL_STR, flag(prior_event('FACEOFF', 1) & (pl.col('x_abs_last') > 25) & (pl.col('seconds_since_last') <= 3))),
+    # Rush (Transition Play after Turnover)
+    ('is_rush_play', ALL_STR, flag((pl.col('x_abs_last') < 0) & (pl.col('seconds_since_last') <= 5) & prior_turnover)),
+    ('is_fast_rush_play', ALL_STR, flag((pl.col('x_abs_last') < 25) & (pl.col('seconds_since_last') <= 3) & prior_turnover))
+]
+
+# Columns Carried Into Each Model Frame Ahead Of The Registry Features (Order Matches The Saved Model Frames)
+model_base_columns = {
+    'EV': ['season', 'game_id', 'event_idx', 'secondary_type', 'event_player_1_id', 'event_goalie_id',
+           'is_goal',
+           'period', 'game_seconds','is_home', 'is_overtime', 'is_playoff',
+           'x_abs', 'y_abs', 'event_distance', 'event_angle',
+           'event_angle_change', 'event_angle_change_speed',
+           'seconds_since_last', 'distance_from_last', 'x_abs_last', 'y_abs_last', 'puck_speed_since_last',
+           'pos_F', 'pos_D', 'pos_G', 'hand_R', 'hand_L', 'G_hand_R', 'G_hand_L',
+           'event_team_shift_time_diff', 'event_team_toi', 'def_team_toi'],
+    'PP': ['season', 'game_id', 'event_idx', 'secondary_type', 'event_player_1_id', 'event_goalie_id',
+           'is_goal',
+           'period', 'game_seconds','is_home', 'is_overtime', 'is_playoff',
+           'x_abs', 'y_abs', 'event_angle', 'event_distance',
+           'event_angle_change', 'event_angle_change_speed',
+           'seconds_since_last', 'distance_from_last', 'x_abs_last', 'y_abs_last', 'puck_speed_since_last',
+           'pen_seconds_since', 'prior_event_EV', 'is_two_ma',
+           'pos_F', 'pos_D', 'pos_G', 'hand_R', 'hand_L', 'G_hand_R', 'G_hand_L',
+           'event_team_shift_time_diff', 'event_team_toi', 'def_team_toi'],
+    'SH': ['season', 'game_id', 'event_idx', 'secondary_type', 'event_player_1_id', 'event_goalie_id',
+           'is_goal',
+           'period', 'game_seconds','is_home', 'is_overtime', 'is_playoff',
+           'x_abs', 'y_abs', 'event_angle', 'event_distance',
+           'event_angle_change', 'event_angle_change_speed',
+           'seconds_since_last', 'distance_from_last', 'x_abs_last', 'y_abs_last', 'puck_speed_since_last',
+           'pen_seconds_since', 'prior_event_EV',
+           'pos_F', 'pos_D', 'pos_G', 'hand_R', 'hand_L', 'G_hand_R', 'G_hand_L',
+           'event_team_shift_time_diff', 'event_team_toi', 'def_team_toi'],
+    'EN': ['season', 'game_id', 'event_idx', 'secondary_type', 'event_player_1_id',
+           'is_goal',
+           'period', 'game_seconds','is_home', 'is_overtime', 'is_playoff',
+           'x_abs', 'y_abs', 'event_distance', 'event_angle',
+           'event_angle_change', 'event_angle_change_speed',
+           'seconds_since_last', 'distance_from_last', 'x_abs_last', 'y_abs_last', 'puck_speed_since_last',
+           'prior_event_EV',
+           'pos_F', 'pos_D', 'pos_G', 'hand_R', 'hand_L',
+           'event_team_shift_time_diff', 'event_team_toi', 'def_team_toi']
+}
+
+# Strengths Joined Against The Goalie Lookup (EN Has No Goalie In Net)
+goalie_strengths = ['EV', 'PP', 'SH']
+
+def compile_model_features(prep_type):
+    """Registry entries for one strength -> one expression per feature name, in registry order"""
+    features = {}
+    for name, strengths, expr in model_feature_registry:
+        if prep_type not in strengths:
+            continue
+        if name in features:
+            raise ValueError(f"Feature {name} Registered Twice For {prep_type}")
+        features[name] = expr.alias(name)
+    return features
+
+def model_columns(prep_type):
+    """Explicit output columns of a model frame: base columns, then the registry features not already among them"""
+    base_cols = model_base_columns[prep_type]
+    return base_cols + [name for name in compile_model_features(prep_type) if name not in base_cols]
 
 ## FUNCTIONS ##
 
+# Helper: Match Lookup Frames To The Pipeline (Eager DataFrame or LazyFrame)
+def frame_like(df, data):
+    """Returns df as a LazyFrame when data is lazy so the roster/goalie joins work in both modes"""
+    return df.lazy() if isinstance(data, pl.LazyFrame) else df
+
 # 1) Clean PBP Data
 def clean_pbp_data(data):
     """ This function will use inputs from play-by-play data to build usable features in a model.
@@ -51,6 +211,9 @@ def clean_pbp_data(data):
     """
     ### EVENT CALCULATIONS ###
 
+    # 0) Low Cardinality Columns As Enums (No-Op For Frames Read Through pbpstore)
+    data = cast_pbp_types(data)
+
     # 1) Create Columns Relative To Event Team
     data = data.with_columns([
         pl.when(pl.col('event_team_id') == pl.col('away_id')).then(pl.col('away_abbreviation'))
@@ -60,9 +223,9 @@ def clean_pbp_data(data):
     # 2) Create Zones Using Coordinates
     data = data.with_columns(
       [
-        pl.when(data['x_abs'] >= 25).then(pl.lit('OZ'))
-        .when((data['x_abs'] > -25) & (data['x_abs'] < 25)).then(pl.lit('NZ'))
-        .when(data['x_abs'] <= -25).then(pl.lit('DZ'))
+        pl.when(pl.col('x_abs') >= 25).then(pl.lit('OZ'))
+        .when((pl.col('x_abs') > -25) & (pl.col('x_abs') < 25)).then(pl.lit('NZ'))
+        .when(pl.col('x_abs') <= -25).then(pl.lit('DZ'))
         .otherwise(None)
         .alias('event_zone')
       ]
@@ -70,11 +233,11 @@ def clean_pbp_data(data):
 
     data = data.with_columns(
       [
-        pl.when((data['event_zone'] == 'OZ') & (data['event_team_type'] == 'home')).then(pl.lit('OZ'))
-        .when((data['event_zone'] == 'OZ') & (data['event_team_type'] == 'away')).then(pl.lit('DZ'))
-        .when((data['event_zone'] == 'DZ') & (data['event_team_type'] == 'home')).then(pl.lit('DZ'))
-        .when((data['event_zone'] == 'DZ') & (data['event_team_type'] == 'away')).then(pl.lit('OZ'))
-        .when((data['event_zone'] == 'NZ')).then(pl.lit('NZ'))
+        pl.when((pl.col('event_zone') == 'OZ') & (pl.col('event_team_type') == 'home')).then(pl.lit('OZ'))
+        .when((pl.col('event_zone') == 'OZ') & (pl.col('event_team_type') == 'away')).then(pl.lit('DZ'))
+        .when((pl.col('event_zone') == 'DZ') & (pl.col('event_team_type') == 'home')).then(pl.lit('DZ'))
+        .when((pl.col('event_zone') == 'DZ') & (pl.col('event_team_type') == 'away')).then(pl.lit('OZ'))
+        .when((pl.col('event_zone') == 'NZ')).then(pl.lit('NZ'))
         .otherwise(None)
         .alias('home_event_zone')
       ]
@@ -83,9 +246,7 @@ def clean_pbp_data(data):
     data = (
         data
         .with_columns([
-          pl.when(data['x_abs'] >= 0).then(pl.Series.sqrt((89.25 - pl.Series.abs(data['x_abs']))**2 + data['y_abs']**2))
-          .when(data['x_abs'] <  0).then(pl.Series.sqrt((pl.Series.abs(data['x_abs']) + 89.25)**2 + data['y_abs']**2))
-          .alias('event_distance')
+          net_distance('x_abs', 'y_abs', model_goal_x).alias('event_distance')
         ])
         .with_columns([
             pl.when((pl.col('event_distance').abs() == 0.0)).then(pl.lit(0.25))
@@ -96,16 +257,7 @@ def clean_pbp_data(data):
     data = (
         data
         .with_columns(
-        pl.when(data['x_abs'] >= 0)
-          .then(pl.Series.arctan(data['y_abs'] / (89.25 - pl.Series.abs(data['x_abs'])))
-                .map_elements(lambda x: abs(x * (180 / pi))))
-          .when(data['x_abs'] < 0)
-          .then(pl.Series.arctan(data['y_abs'] / (pl.Series.abs(data['x_abs']) + 89.25))
-                .map_elements(lambda x: abs(x * (180 / pi))))
-          .alias('event_angle')
-        )
-        .with_columns(
-            pl.when(pl.col('x_abs') > 89.25).then((180 - pl.col('event_angle'))).otherwise(pl.col('event_angle')).alias('event_angle')
+            net_angle('x_abs', 'y_abs', model_goal_x).alias('event_angle')
         )
         .with_columns(
             pl.col('event_angle').round(3)
@@ -115,34 +267,34 @@ def clean_pbp_data(data):
     data = data.with_columns(
         [
             pl.when(
-                (data['secondary_type'] == 'Penalty Shot') &
-                (data['event_team_type'] == 'home')
+                (pl.col('secondary_type') == 'Penalty Shot') &
+                (pl.col('event_team_type') == 'home')
             ).then(pl.lit('Ev1'))
             .when(
-                (data['secondary_type'] == 'Penalty Shot') &
-                (data['event_team_type'] == 'away')
+                (pl.col('secondary_type') == 'Penalty Shot') &
+                (pl.col('event_team_type') == 'away')
             ).then(pl.lit('1vE'))
-            .otherwise(data['strength_state']).alias('strength_state'),
+            .otherwise(pl.col('strength_state')).alias('strength_state'),
 
             pl.when(
-                (data['secondary_type'] == 'Penalty Shot') &
-                (data['event_team_type'] == 'home')
+                (pl.col('secondary_type') == 'Penalty Shot') &
+                (pl.col('event_team_type') == 'home')
             ).then(pl.lit(1))
             .when(
-                (data['secondary_type'] == 'Penalty Shot') &
-                (data['event_team_type'] == 'away')
+                (pl.col('secondary_type') == 'Penalty Shot') &
+                (pl.col('event_team_type') == 'away')
             ).then(pl.lit(0))
-            .otherwise(data['home_skaters']).alias('home_skaters'),
+            .otherwise(pl.col('home_skaters')).alias('home_skaters'),
 
             pl.when(
-                (data['secondary_type'] == 'Penalty Shot') &
-                (data['event_team_type'] == 'home')
+                (pl.col('secondary_type') == 'Penalty Shot') &
+                (pl.col('event_team_type') == 'home')
             ).then(pl.lit(0))
             .when(
-                (data['secondary_type'] == 'Penalty Shot') &
-                (data['event_team_type'] == 'away')
+                (pl.col('secondary_type') == 'Penalty Shot') &
+                (pl.col('event_team_type') == 'away')
             ).then(pl.lit(1))
-            .otherwise(data['away_skaters']).alias('away_skaters')
+            .otherwise(pl.col('away_skaters')).alias('away_skaters')
         ]
     )
 
@@ -227,8 +379,8 @@ def index_input_data(data):
     )
 
     # Join Indexes To Data (Join All Common Columns)
-    idx_cols = idx_df.columns
-    data_cols = data.columns
+    idx_cols = idx_df.collect_schema().names()
+    data_cols = data.collect_schema().names()
     common_cols = list(set(idx_cols) & set(data_cols))
 
     data =  data.join(
@@ -240,9 +392,24 @@ def index_input_data(data):
     return data
 # 3) Split Data By Strength
 def split_by_strength(data):
-    """This function will split and clean indexed play-by-play data into 4 categories (EV, PP, SH, and EN)"""
+    """This function will split and clean indexed play-by-play data into 4 categories (EV, PP, SH, and EN).
+       The sequential (last event) features are built once over the sorted xG event stream and each category is a filter + select of it"""
+
+    # Event Team / Defending Team Time On Ice From A Pair Of Home/Away TOI Columns
+    def team_toi(home_toi, away_toi, suffix=''):
+        return [
+            (pl.when(pl.col('event_team_type') == 'home').then(pl.col(home_toi))
+               .when(pl.col('event_team_type') == 'away').then(pl.col(away_toi))
+               .otherwise(pl.lit(None))
+            ).alias('event_team_toi' + suffix),
+            (pl.when(pl.col('event_team_type') == 'away').then(pl.col(home_toi))
+               .when(pl.col('event_team_type') == 'home').then(pl.col(away_toi))
+               .otherwise(pl.lit(None))
+            ).alias('def_team_toi' + suffix)
+        ]
 
-    EV_DF = (
+    ## Build Shared xG Event Stream ##
+    XG_DF = (
         data
         .filter(
             (pl.col('event_type').is_in(xG_Events)) &
@@ -255,6 +422,9 @@ def split_by_strength(data):
             ((pl.col('game_seconds')) - (pl.col('game_seconds').shift(1).over(['season', 'game_id', 'period']))).alias('seconds_since_last'),
             ((pl.col('game_seconds')) - (pl.col('game_seconds').first().over(['season', 'game_id', 'period', 'home_shift_ID']))).alias('home_skaters_toi'),
             ((pl.col('game_seconds')) - (pl.col('game_seconds').first().over(['season', 'game_id', 'period', 'away_shift_ID']))).alias('away_skaters_toi'),
+            # EN Measures Time On Ice By Shift Index (Not Shift ID)
+            ((pl.col('game_seconds')) - (pl.col('game_seconds').first().over(['season', 'game_id', 'period', 'home_shift_index']))).alias('home_skaters_toi_EN'),
+            ((pl.col('game_seconds')) - (pl.col('game_seconds').first().over(['season', 'game_id', 'period', 'away_shift_index']))).alias('away_skaters_toi_EN'),
             ((pl.col('event_type').shift(1).over(['season', 'game_id', 'period']))).alias('event_type_last'),
             ((pl.col('event_team_abbr').shift(1).over(['season', 'game_id', 'period']))).alias('event_team_last'),
             ((pl.col('strength_state').shift(1).over(['season', 'game_id', 'period']))).alias('event_strength_last'),
@@ -262,25 +432,24 @@ def split_by_strength(data):
             ((pl.col('y_abs').shift(1).over(['season', 'game_id', 'period']))).alias('y_abs_last'),
             ((pl.col('home_score').shift(1).over(['season', 'game_id', 'period']))).alias('home_score'),
             ((pl.col('away_score').shift(1).over(['season', 'game_id', 'period']))).alias('away_score'),
-            (pl.when((pl.col('event_team_type') == 'home')).then((pl.col('home_goalie')).str.to_uppercase()).otherwise((pl.col('away_goalie').str.to_uppercase())).alias('event_goalie_id'))
+            # SH Compares Skater Counts Only (No 'E' For An Empty Net)
+            (pl.concat_str([pl.col('home_skaters'), pl.lit('v'), pl.col('away_skaters')])).alias('true_strength_state_SH'),
+            (pl.when(pl.col('strength_state').is_in(PP_STR_Codes)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_pen'),
+            (pl.when(((pl.col('home_skaters') - pl.col('away_skaters')) >= 2) | ((pl.col('away_skaters') - pl.col('home_skaters')) >= 2)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_two_ma'),
+            (pl.when((pl.col('event_team_type') == 'home')).then(pl.col('home_goalie')).otherwise(pl.col('away_goalie')).alias('event_goalie_id'))
         ])
+        .with_columns(((pl.col('is_pen')) * ((pl.col('game_seconds')) - (pl.col('game_seconds').first().over(['season', 'game_id', 'pen_index'])))).alias('pen_seconds_since'))
         .with_columns([
-            (pl.when(pl.col('event_team_type') == 'home').then(pl.col('home_skaters_toi'))
-               .when(pl.col('event_team_type') == 'away').then(pl.col('away_skaters_toi'))
-               .otherwise(pl.lit(None))
-            ).alias('event_team_toi'),
-            (pl.when(pl.col('event_team_type') == 'away').then(pl.col('home_skaters_toi'))
-               .when(pl.col('event_team_type') == 'home').then(pl.col('away_skaters_toi'))
-               .otherwise(pl.lit(None))
-            ).alias('def_team_toi')
-        ])
+            (pl.when((pl.col('pen_seconds_since') > 0) & (pl.col('pen_seconds_since') >= 300)).then(pl.lit(120)).otherwise(pl.col('pen_seconds_since'))).alias('pen_seconds_since')
+            ])
+        .with_columns(team_toi('home_skaters_toi', 'away_skaters_toi') + team_toi('home_skaters_toi_EN', 'away_skaters_toi_EN', '_EN'))
         .with_columns([
-            (pl.col('def_team_toi') - pl.col('event_team_toi')).alias('event_team_shift_time_diff')
+            (pl.col('def_team_toi') - pl.col('event_team_toi')).alias('event_team_shift_time_diff'),
+            (pl.col('def_team_toi_EN') - pl.col('event_team_toi_EN')).alias('event_team_shift_time_diff_EN')
         ])
         .sort('season', 'game_id', 'event_idx')
         .filter(
             (pl.col('event_type').is_in(fenwick_events)) &
-            (pl.col('strength_state').is_in(EV_STR_Codes)) &
             (~pl.col('x_abs_last').is_null()) &
             (~pl.col('y_abs_last').is_null())
         )
@@ -297,30 +466,29 @@ def split_by_strength(data):
             (pl.when(pl.col('season_type') == 'P').then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_playoff'),
             (pl.when(pl.col('event_team_type') == 'home').then(pl.col('home_score') - pl.col('away_score')).otherwise(pl.col('away_score') - pl.col('home_score'))).alias('score_state'),
             #(pl.when((pl.col('seconds_since_last') == 0) & (pl.col('event_type_last') == 'FACEOFF')).then(pl.col("shift_length")).otherwise(pl.col('seconds_since_last'))).alias('seconds_since_last'),
-            ((((pl.col('x_abs') - pl.col('x_abs_last')) ** 2) + ((pl.col('y_abs') - pl.col('y_abs_last')) ** 2)).sqrt()).alias('distance_from_last')
+            ((((pl.col('x_abs') - pl.col('x_abs_last')) ** 2) + ((pl.col('y_abs') - pl.col('y_abs_last')) ** 2)).sqrt()).alias('distance_from_last'),
+            (pl.when(pl.col('event_strength_last').is_in(EV_STR_Codes)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_event_EV'),
+            (pl.when(pl.col('strength_state').is_in(EV_STR_Codes + ['6v6'])).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_EV')
         ])
         .with_columns(
             pl.when(pl.col('seconds_since_last') == 0).then(pl.lit(0.5)).otherwise(pl.col('seconds_since_last')).alias('seconds_since_last'),
-            pl.when(pl.col('x_abs_last') >= 0)
-            .then((pl.col('y_abs_last') / (89.25 - (pl.col('x_abs_last').abs()))).arctan()
-                    .map_elements(lambda x: abs(x * (180 / pi))))
-            .when(pl.col('x_abs_last') < 0)
-            .then((pl.col('y_abs_last') / ((pl.col('x_abs_last').abs()) + 89.25)).arctan()
-                    .map_elements(lambda x: abs(x * (180 / pi))))
-            .alias('event_angle_last')
-        )
-        .with_columns(
-            pl.when(pl.col('x_abs_last') > 89.25).then((180 - pl.col('event_angle_last'))).otherwise(pl.col('event_angle_last')).alias('event_angle_last')
+            net_angle('x_abs_last', 'y_abs_last', model_goal_x).alias('event_angle_last')
         )
         .with_columns([
             (pl.col('distance_from_last') / pl.col('seconds_since_last')).alias('puck_speed_since_last'),
-            ((pl.col('event_angle') - pl.col('event_angle_last')).abs()).alias('event_angle_change')
+            angle_change('event_angle', 'event_angle_last').alias('event_angle_change')
             ])
-        .with_columns((pl.col('event_angle_change') / pl.col('seconds_since_last')).alias('event_angle_change_speed'))
+        .with_columns(angle_change_speed('event_angle_change', 'seconds_since_last').alias('event_angle_change_speed'))
         .with_columns([
             pl.when(pl.col('puck_speed_since_last').is_infinite()).then(pl.col('distance_from_last') / pl.lit(0.5)).otherwise(pl.col('puck_speed_since_last')).alias('puck_speed_since_last'),
             pl.when(pl.col('event_angle_last').is_infinite()).then(None).otherwise(pl.col('event_angle_last')).alias('event_angle_last')
             ])
+    )
+
+    ## Partition Into Strengths (A Shot Can Land In More Than One, i.e. EV and EN) ##
+    EV_DF = (
+        XG_DF
+        .filter(pl.col('strength_state').is_in(EV_STR_Codes))
         .select(['season', 'game_id', 'game_date', 'event_idx', 'period', 'game_seconds', 'is_overtime', 'is_playoff',
                 'strength_state', 'score_state', 'is_home', 
                 'event_player_1_id', 'home_goalie', 'away_goalie', 'event_player_2_id', 'event_goalie_id',
@@ -333,95 +501,12 @@ def split_by_strength(data):
                 'event_team_shift_time_diff', 'event_team_toi', 'def_team_toi'])
     )
 
-    ## Build PP DataFrame ##
     PP_DF = (
-        data
-        .filter(
-            (pl.col('event_type').is_in(xG_Events)) &
-            (((pl.col('period') < 5) & (pl.col('season_type') == 'R')) | (pl.col('season_type') == 'P')) &
-            (~pl.col('x_abs').is_null()) &
-            (~pl.col('y_abs').is_null())
-        )
-        .sort('season', 'game_id', 'period', 'event_idx')
-        .with_columns([
-            ((pl.col('game_seconds')) - (pl.col('game_seconds').shift(1).over(['season', 'game_id', 'period']))).alias('seconds_since_last'),
-            ((pl.col('game_seconds')) - (pl.col('game_seconds').first().over(['season', 'game_id', 'period', 'home_shift_ID']))).alias('home_skaters_toi'),
-            ((pl.col('game_seconds')) - (pl.col('game_seconds').first().over(['season', 'game_id', 'period', 'away_shift_ID']))).alias('away_skaters_toi'),
-            ((pl.col('event_type').shift(1).over(['season', 'game_id', 'period']))).alias('event_type_last'),
-            ((pl.col('event_team_abbr').shift(1).over(['season', 'game_id', 'period']))).alias('event_team_last'),
-            ((pl.col('strength_state').shift(1).over(['season', 'game_id', 'period']))).alias('event_strength_last'),
-            ((pl.col('x_abs').shift(1).over(['season', 'game_id', 'period']))).alias('x_abs_last'),
-            ((pl.col('y_abs').shift(1).over(['season', 'game_id', 'period']))).alias('y_abs_last'),
-            ((pl.col('event_angle').shift(1).over(['season', 'game_id', 'period']))).alias('event_angle_last'),
-            ((pl.col('home_score').shift(1).over(['season', 'game_id', 'period']))).alias('home_score'),
-            ((pl.col('away_score').shift(1).over(['season', 'game_id', 'period']))).alias('away_score'),
-            (pl.when(pl.col('strength_state').is_in(PP_STR_Codes)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_pen'),
-            (pl.when(((pl.col('home_skaters') - pl.col('away_skaters')) >= 2) | ((pl.col('away_skaters') - pl.col('home_skaters')) >= 2)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_two_ma'),
-            (pl.when((pl.col('event_team_type') == 'home')).then((pl.col('home_goalie')).str.to_uppercase()).otherwise((pl.col('away_goalie').str.to_uppercase())).alias('event_goalie_id'))
-        ])
-        .with_columns(((pl.col('is_pen')) * ((pl.col('game_seconds')) - (pl.col('game_seconds').first().over(['season', 'game_id', 'pen_index'])))).alias('pen_seconds_since'))
-        .with_columns([
-            (pl.when((pl.col('pen_seconds_since') > 0) & (pl.col('pen_seconds_since') >= 300)).then(pl.lit(120)).otherwise(pl.col('pen_seconds_since'))).alias('pen_seconds_since')
-            ])
-        .with_columns([
-            (pl.when(pl.col('event_team_type') == 'home').then(pl.col('home_skaters_toi'))
-               .when(pl.col('event_team_type') == 'away').then(pl.col('away_skaters_toi'))
-               .otherwise(pl.lit(None))
-            ).alias('event_team_toi'),
-            (pl.when(pl.col('event_team_type') == 'away').then(pl.col('home_skaters_toi'))
-               .when(pl.col('event_team_type') == 'home').then(pl.col('away_skaters_toi'))
-               .otherwise(pl.lit(None))
-            ).alias('def_team_toi')
-        ])
-        .with_columns([
-            (pl.col('def_team_toi') - pl.col('event_team_toi')).alias('event_team_shift_time_diff')
-        ])
-        .sort('season', 'game_id', 'event_idx')
+        XG_DF
         .filter(
-            (pl.col('event_type').is_in(fenwick_events)) &
-            (((pl.col('event_team_type') == 'home') & (pl.col('true_strength_state').is_in(["6v5", "6v4", "5v4", "5v3", "4v3"]))) |
-            ((pl.col('event_team_type') == 'away') & (pl.col('true_strength_state').is_in(["5v6", "4v6", "4v5", "3v5", "3v4"])))) &
-            (~pl.col('x_abs_last').is_null()) &
-            (~pl.col('y_abs_last').is_null())
+            ((pl.col('event_team_type') == 'home') & (pl.col('true_strength_state').is_in(["6v5", "6v4", "5v4", "5v3", "4v3"]))) |
+            ((pl.col('event_team_type') == 'away') & (pl.col('true_strength_state').is_in(["5v6", "4v6", "4v5", "3v5", "3v4"])))
         )
-        .with_columns([
-            (pl.when(pl.col('event_team_last') == pl.col('event_team_abbr')).then(pl.col('x_abs_last')).otherwise(pl.col('x_abs_last') * -1).alias('x_abs_last')),
-            (pl.when(pl.col('event_team_last') == pl.col('event_team_abbr')).then(pl.col('y_abs_last')).otherwise(pl.col('y_abs_last') * -1).alias('y_abs_last')),
-            (pl.when(pl.col('home_score').is_null()).then(pl.lit(0)).otherwise(pl.col('home_score'))).alias('home_score'),
-            (pl.when(pl.col('away_score').is_null()).then(pl.lit(0)).otherwise(pl.col('away_score'))).alias('away_score')
-        ])
-        .with_columns([
-            (pl.when(pl.col('event_team_abbr') == pl.col('event_team_last')).then(pl.lit(1)).otherwise(pl.lit(0))).alias('same_team_last'),
-            (pl.when(pl.col('event_team_type') == 'home').then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_home'),
-            (pl.when(pl.col('period') >= 4).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_overtime'),
-            (pl.when(pl.col('season_type') == 'P').then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_playoff'),
-            (pl.when(pl.col('event_team_type') == 'home').then(pl.col('home_score') - pl.col('away_score')).otherwise(pl.col('away_score') - pl.col('home_score'))).alias('score_state'),
-            #(pl.when((pl.col('seconds_since_last') == 0) & (pl.col('event_type_last') == 'FACEOFF')).then(pl.col("shift_length")).otherwise(pl.col('seconds_since_last'))).alias('seconds_since_last'),
-            ((((pl.col('x_abs') - pl.col('x_abs_last')) ** 2) + ((pl.col('y_abs') - pl.col('y_abs_last')) ** 2)).sqrt()).alias('distance_from_last'),
-            (pl.when(pl.col('event_strength_last').is_in(EV_STR_Codes)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_event_EV')
-        ])
-        .with_columns(
-            pl.when(pl.col('seconds_since_last') == 0).then(pl.lit(0.5)).otherwise(pl.col('seconds_since_last')).alias('seconds_since_last'),
-            pl.when(pl.col('x_abs_last') >= 0)
-            .then((pl.col('y_abs_last') / (89.25 - (pl.col('x_abs_last').abs()))).arctan()
-                    .map_elements(lambda x: abs(x * (180 / pi))))
-            .when(pl.col('x_abs_last') < 0)
-            .then((pl.col('y_abs_last') / ((pl.col('x_abs_last').abs()) + 89.25)).arctan()
-                    .map_elements(lambda x: abs(x * (180 / pi))))
-            .alias('event_angle_last')
-        )
-        .with_columns(
-            pl.when(pl.col('x_abs_last') > 89.25).then((180 - pl.col('event_angle_last'))).otherwise(pl.col('event_angle_last')).alias('event_angle_last')
-        )
-        .with_columns([
-            (pl.col('distance_from_last') / pl.col('seconds_since_last')).alias('puck_speed_since_last'),
-            ((pl.col('event_angle') - pl.col('event_angle_last')).abs()).alias('event_angle_change')
-            ])
-        .with_columns((pl.col('event_angle_change') / pl.col('seconds_since_last')).alias('event_angle_change_speed'))
-        .with_columns([
-            pl.when(pl.col('puck_speed_since_last').is_infinite()).then(pl.col('distance_from_last') / pl.lit(0.5)).otherwise(pl.col('puck_speed_since_last')).alias('puck_speed_since_last'),
-            pl.when(pl.col('event_angle_last').is_infinite()).then(None).otherwise(pl.col('event_angle_last')).alias('event_angle_last')
-            ])
         .select([
             'season', 'game_id', 'game_date', 'event_idx', 'period', 'game_seconds', 'is_overtime', 'is_playoff',
             'strength_state', 'true_strength_state', 'score_state', 'is_home', 'is_two_ma',
@@ -436,98 +521,15 @@ def split_by_strength(data):
         ])
     )
 
-    ## Build SH DataFrame ##
     SH_DF = (
-        data
+        XG_DF
         .filter(
-            (pl.col('event_type').is_in(xG_Events)) &
-            (((pl.col('period') < 5) & (pl.col('season_type') == 'R')) | (pl.col('season_type') == 'P')) &
-            (~pl.col('x_abs').is_null()) &
-            (~pl.col('y_abs').is_null())
-        )
-        .sort('season', 'game_id', 'period', 'event_idx')
-        .with_columns([
-            ((pl.col('game_seconds')) - (pl.col('game_seconds').shift(1).over(['season', 'game_id', 'period']))).alias('seconds_since_last'),
-            ((pl.col('game_seconds')) - (pl.col('game_seconds').first().over(['season', 'game_id', 'period', 'home_shift_ID']))).alias('home_skaters_toi'),
-            ((pl.col('game_seconds')) - (pl.col('game_seconds').first().over(['season', 'game_id', 'period', 'away_shift_ID']))).alias('away_skaters_toi'),
-            ((pl.col('event_type').shift(1).over(['season', 'game_id', 'period']))).alias('event_type_last'),
-            ((pl.col('event_team_abbr').shift(1).over(['season', 'game_id', 'period']))).alias('event_team_last'),
-            ((pl.col('strength_state').shift(1).over(['season', 'game_id', 'period']))).alias('event_strength_last'),
-            ((pl.col('x_abs').shift(1).over(['season', 'game_id', 'period']))).alias('x_abs_last'),
-            ((pl.col('y_abs').shift(1).over(['season', 'game_id', 'period']))).alias('y_abs_last'),
-            ((pl.col('event_angle').shift(1).over(['season', 'game_id', 'period']))).alias('event_angle_last'),
-            ((pl.col('home_score').shift(1).over(['season', 'game_id', 'period']))).alias('home_score'),
-            ((pl.col('away_score').shift(1).over(['season', 'game_id', 'period']))).alias('away_score'),
-            (pl.concat_str([pl.col('home_skaters'), pl.lit('v'), pl.col('away_skaters')])).alias('true_strength_state'),
-            (pl.when(pl.col('strength_state').is_in(PP_STR_Codes)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_pen'),
-            (pl.when(((pl.col('home_skaters') - pl.col('away_skaters')) >= 2) | ((pl.col('away_skaters') - pl.col('home_skaters')) >= 2)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_two_ma'),
-            (pl.when((pl.col('event_team_type') == 'home')).then((pl.col('home_goalie')).str.to_uppercase()).otherwise((pl.col('away_goalie').str.to_uppercase())).alias('event_goalie_id'))
-        ])
-        .with_columns([((pl.col('is_pen')) * ((pl.col('game_seconds')) - (pl.col('game_seconds').first().over(['season', 'game_id', 'pen_index'])))).alias('pen_seconds_since')
-            ])
-        .with_columns((pl.when((pl.col('pen_seconds_since') > 0) & (pl.col('pen_seconds_since') >= 300)).then(pl.lit(120)).otherwise(pl.col('pen_seconds_since'))).alias('pen_seconds_since'))
-        .with_columns([
-            (pl.when(pl.col('event_team_type') == 'home').then(pl.col('home_skaters_toi'))
-               .when(pl.col('event_team_type') == 'away').then(pl.col('away_skaters_toi'))
-               .otherwise(pl.lit(None))
-            ).alias('event_team_toi'),
-            (pl.when(pl.col('event_team_type') == 'away').then(pl.col('home_skaters_toi'))
-               .when(pl.col('event_team_type') == 'home').then(pl.col('away_skaters_toi'))
-               .otherwise(pl.lit(None))
-            ).alias('def_team_toi')
-        ])
-        .with_columns([
-            (pl.col('def_team_toi') - pl.col('event_team_toi')).alias('event_team_shift_time_diff')
-        ])
-        .sort('season', 'game_id', 'event_idx')
-        .filter(
-            (pl.col('event_type').is_in(fenwick_events)) &
-            (((pl.col('event_team_type') == 'away') & (pl.col('true_strength_state').is_in(["5v4", "5v3", "4v3"]))) |
-            ((pl.col('event_team_type') == 'home') & (pl.col('true_strength_state').is_in(["4v5", "3v5", "3v4"])))) &
-            (~pl.col('x_abs_last').is_null()) &
-            (~pl.col('y_abs_last').is_null())
+            ((pl.col('event_team_type') == 'away') & (pl.col('true_strength_state_SH').is_in(["5v4", "5v3", "4v3"]))) |
+            ((pl.col('event_team_type') == 'home') & (pl.col('true_strength_state_SH').is_in(["4v5", "3v5", "3v4"])))
         )
-        .with_columns([
-            (pl.when(pl.col('event_team_last') == pl.col('event_team_abbr')).then(pl.col('x_abs_last')).otherwise(pl.col('x_abs_last') * -1).alias('x_abs_last')),
-            (pl.when(pl.col('event_team_last') == pl.col('event_team_abbr')).then(pl.col('y_abs_last')).otherwise(pl.col('y_abs_last') * -1).alias('y_abs_last')),
-            (pl.when(pl.col('home_score').is_null()).then(pl.lit(0)).otherwise(pl.col('home_score'))).alias('home_score'),
-            (pl.when(pl.col('away_score').is_null()).then(pl.lit(0)).otherwise(pl.col('away_score'))).alias('away_score')
-        ])
-        .with_columns([
-            (pl.when(pl.col('event_team_abbr') == pl.col('event_team_last')).then(pl.lit(1)).otherwise(pl.lit(0))).alias('same_team_last'),
-            (pl.when(pl.col('event_team_type') == 'home').then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_home'),
-            (pl.when(pl.col('period') >= 4).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_overtime'),
-            (pl.when(pl.col('season_type') == 'P').then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_playoff'),
-            (pl.when(pl.col('event_team_type') == 'home').then(pl.col('home_score') - pl.col('away_score')).otherwise(pl.col('away_score') - pl.col('home_score'))).alias('score_state'),
-            #(pl.when((pl.col('seconds_since_last') == 0) & (pl.col('event_type_last') == 'FACEOFF')).then(pl.col("shift_length")).otherwise(pl.col('seconds_since_last'))).alias('seconds_since_last'),
-            ((((pl.col('x_abs') - pl.col('x_abs_last')) ** 2) + ((pl.col('y_abs') - pl.col('y_abs_last')) ** 2)).sqrt()).alias('distance_from_last'),
-            (pl.when(pl.col('event_strength_last').is_in(EV_STR_Codes)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_event_EV')
-        ])
-        .with_columns(
-            pl.when(pl.col('seconds_since_last') == 0).then(pl.lit(0.5)).otherwise(pl.col('seconds_since_last')).alias('seconds_since_last'),
-            pl.when(pl.col('x_abs_last') >= 0)
-            .then((pl.col('y_abs_last') / (89.25 - (pl.col('x_abs_last').abs()))).arctan()
-                    .map_elements(lambda x: abs(x * (180 / pi))))
-            .when(pl.col('x_abs_last') < 0)
-            .then((pl.col('y_abs_last') / ((pl.col('x_abs_last').abs()) + 89.25)).arctan()
-                    .map_elements(lambda x: abs(x * (180 / pi))))
-            .alias('event_angle_last')
-        )
-        .with_columns(
-            pl.when(pl.col('x_abs_last') > 89.25).then((180 - pl.col('event_angle_last'))).otherwise(pl.col('event_angle_last')).alias('event_angle_last')
-        )
-        .with_columns([
-            (pl.col('distance_from_last') / pl.col('seconds_since_last')).alias('puck_speed_since_last'),
-            ((pl.col('event_angle') - pl.col('event_angle_last')).abs()).alias('event_angle_change')
-            ])
-        .with_columns((pl.col('event_angle_change') / pl.col('seconds_since_last')).alias('event_angle_change_speed'))
-        .with_columns([
-            pl.when(pl.col('puck_speed_since_last').is_infinite()).then(pl.col('distance_from_last') / pl.lit(0.5)).otherwise(pl.col('puck_speed_since_last')).alias('puck_speed_since_last'),
-            pl.when(pl.col('event_angle_last').is_infinite()).then(None).otherwise(pl.col('event_angle_last')).alias('event_angle_last')
-            ])
         .select([
             'season', 'game_id', 'game_date', 'event_idx', 'period', 'game_seconds', 'is_overtime', 'is_playoff',
-            'strength_state', 'true_strength_state', 'score_state', 'is_home', 'is_two_ma',
+            'strength_state', pl.col('true_strength_state_SH').alias('true_strength_state'), 'score_state', 'is_home', 'is_two_ma',
             'event_player_1_id', 'home_goalie', 'away_goalie', 'event_player_2_id', 'event_goalie_id',
             'home_score', 'away_score', 'home_abbreviation', 'away_abbreviation', 'home_skaters', 'away_skaters',
             'event_type', 'event_team', 'event_team_abbr', 'event_team_type', 'secondary_type',
@@ -539,91 +541,12 @@ def split_by_strength(data):
         ])
     )
 
-    ## Build Empty Net DataFrame ##
     EN_DF = (
-        data
+        XG_DF
         .filter(
-            (pl.col('event_type').is_in(xG_Events)) &
-            (((pl.col('period') < 5) & (pl.col('season_type') == 'R')) | (pl.col('season_type') == 'P')) &
-            (~pl.col('x_abs').is_null()) &
-            (~pl.col('y_abs').is_null())
+            ((pl.col('event_team_type') == 'away') & (pl.col('true_strength_state').is_in(["Ev5", "Ev4", "Ev3"]))) |
+            ((pl.col('event_team_type') == 'home') & (pl.col('true_strength_state').is_in(["5vE", "4vE", "3vE"])))
         )
-        .sort('season', 'game_id', 'period', 'event_idx')
-        .with_columns([
-            ((pl.col('game_seconds')) - (pl.col('game_seconds').shift(1).over(['season', 'game_id', 'period']))).alias('seconds_since_last'),
-            ((pl.col('game_seconds')) - (pl.col('game_seconds').first().over(['season', 'game_id', 'period', 'home_shift_index']))).alias('home_skaters_toi'),
-            ((pl.col('game_seconds')) - (pl.col('game_seconds').first().over(['season', 'game_id', 'period', 'away_shift_index']))).alias('away_skaters_toi'),
-            ((pl.col('event_type').shift(1).over(['season', 'game_id', 'period']))).alias('event_type_last'),
-            ((pl.col('event_team_abbr').shift(1).over(['season', 'game_id', 'period']))).alias('event_team_last'),
-            ((pl.col('strength_state').shift(1).over(['season', 'game_id', 'period']))).alias('event_strength_last'),
-            ((pl.col('x_abs').shift(1).over(['season', 'game_id', 'period']))).alias('x_abs_last'),
-            ((pl.col('y_abs').shift(1).over(['season', 'game_id', 'period']))).alias('y_abs_last'),
-            ((pl.col('home_score').shift(1).over(['season', 'game_id', 'period']))).alias('home_score'),
-            ((pl.col('away_score').shift(1).over(['season', 'game_id', 'period']))).alias('away_score'),
-            ((pl.col('event_angle').shift(1).over(['season', 'game_id', 'period']))).alias('event_angle_last'),
-            (pl.when(pl.col('strength_state').is_in(PP_STR_Codes)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_pen'),
-            (pl.when(((pl.col('home_skaters') - pl.col('away_skaters')) >= 2) | ((pl.col('away_skaters') - pl.col('home_skaters')) >= 2)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_two_ma')
-        ])
-        .with_columns([
-            (pl.when(pl.col('event_team_type') == 'home').then(pl.col('home_skaters_toi'))
-               .when(pl.col('event_team_type') == 'away').then(pl.col('away_skaters_toi'))
-               .otherwise(pl.lit(None))
-            ).alias('event_team_toi'),
-            (pl.when(pl.col('event_team_type') == 'away').then(pl.col('home_skaters_toi'))
-               .when(pl.col('event_team_type') == 'home').then(pl.col('away_skaters_toi'))
-               .otherwise(pl.lit(None))
-            ).alias('def_team_toi')
-        ])
-        .with_columns([
-            (pl.col('def_team_toi') - pl.col('event_team_toi')).alias('event_team_shift_time_diff')
-        ])
-        .sort('season', 'game_id', 'event_idx')
-        .filter(
-            (pl.col('event_type').is_in(fenwick_events)) &
-            (((pl.col('event_team_type') == 'away') & (pl.col('true_strength_state').is_in(["Ev5", "Ev4", "Ev3"]))) |
-            ((pl.col('event_team_type') == 'home') & (pl.col('true_strength_state').is_in(["5vE", "4vE", "3vE"])))) &
-            (~pl.col('x_abs_last').is_null()) &
-            (~pl.col('y_abs_last').is_null())
-        )
-        .with_columns([
-            (pl.when(pl.col('event_team_last') == pl.col('event_team_abbr')).then(pl.col('x_abs_last')).otherwise(pl.col('x_abs_last') * -1).alias('x_abs_last')),
-            (pl.when(pl.col('event_team_last') == pl.col('event_team_abbr')).then(pl.col('y_abs_last')).otherwise(pl.col('y_abs_last') * -1).alias('y_abs_last')),
-            (pl.when(pl.col('home_score').is_null()).then(pl.lit(0)).otherwise(pl.col('home_score'))).alias('home_score'),
-            (pl.when(pl.col('away_score').is_null()).then(pl.lit(0)).otherwise(pl.col('away_score'))).alias('away_score')
-        ])
-        .with_columns([
-            (pl.when(pl.col('event_team_abbr') == pl.col('event_team_last')).then(pl.lit(1)).otherwise(pl.lit(0))).alias('same_team_last'),
-            (pl.when(pl.col('event_team_type') == 'home').then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_home'),
-            (pl.when(pl.col('period') >= 4).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_overtime'),
-            (pl.when(pl.col('season_type') == 'P').then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_playoff'),
-            (pl.when(pl.col('event_team_type') == 'home').then(pl.col('home_score') - pl.col('away_score')).otherwise(pl.col('away_score') - pl.col('home_score'))).alias('score_state'),
-            #(pl.when((pl.col('seconds_since_last') == 0) & (pl.col('event_type_last') == 'FACEOFF')).then(pl.col("shift_length")).otherwise(pl.col('seconds_since_last'))).alias('seconds_since_last'),
-            ((((pl.col('x_abs') - pl.col('x_abs_last')) ** 2) + ((pl.col('y_abs') - pl.col('y_abs_last')) ** 2)).sqrt()).alias('distance_from_last'),
-            (pl.when(pl.col('event_strength_last').is_in(EV_STR_Codes)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_event_EV'),
-            (pl.when(pl.col('strength_state').is_in(EV_STR_Codes + ['6v6'])).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_EV')
-        ])
-        .with_columns(
-            pl.when(pl.col('seconds_since_last') == 0).then(pl.lit(0.5)).otherwise(pl.col('seconds_since_last')).alias('seconds_since_last'),
-            pl.when(pl.col('x_abs_last') >= 0)
-            .then((pl.col('y_abs_last') / (89.25 - (pl.col('x_abs_last').abs()))).arctan()
-                    .map_elements(lambda x: abs(x * (180 / pi))))
-            .when(pl.col('x_abs_last') < 0)
-            .then((pl.col('y_abs_last') / ((pl.col('x_abs_last').abs()) + 89.25)).arctan()
-                    .map_elements(lambda x: abs(x * (180 / pi))))
-            .alias('event_angle_last')
-        )
-        .with_columns(
-            pl.when(pl.col('x_abs_last') > 89.25).then((180 - pl.col('event_angle_last'))).otherwise(pl.col('event_angle_last')).alias('event_angle_last')
-        )
-        .with_columns([
-            (pl.col('distance_from_last') / pl.col('seconds_since_last')).alias('puck_speed_since_last'),
-            ((pl.col('event_angle') - pl.col('event_angle_last')).abs()).alias('event_angle_change')
-            ])
-        .with_columns((pl.col('event_angle_change') / pl.col('seconds_since_last')).alias('event_angle_change_speed'))
-        .with_columns([
-            pl.when(pl.col('puck_speed_since_last').is_infinite()).then(pl.col('distance_from_last') / pl.lit(0.5)).otherwise(pl.col('puck_speed_since_last')).alias('puck_speed_since_last'),
-            pl.when(pl.col('event_angle_last').is_infinite()).then(None).otherwise(pl.col('event_angle_last')).alias('event_angle_last')
-            ])
         .select([
             'season', 'game_id', 'game_date', 'event_idx', 'period', 'game_seconds', 'is_overtime', 'is_playoff',
             'strength_state', 'true_strength_state', 'score_state', 'is_home', 'is_two_ma', 'is_pen', 'is_EV',
@@ -634,385 +557,28 @@ def split_by_strength(data):
             'event_angle_change', 'event_angle_change_speed',
             'event_team_last', 'same_team_last', 'event_strength_last', 'prior_event_EV', 'event_type_last',
             'seconds_since_last', 'distance_from_last', 'x_abs_last', 'y_abs_last', 'puck_speed_since_last',
-            'event_team_shift_time_diff', 'event_team_toi', 'def_team_toi'
+            pl.col('event_team_shift_time_diff_EN').alias('event_team_shift_time_diff'),
+            pl.col('event_team_toi_EN').alias('event_team_toi'),
+            pl.col('def_team_toi_EN').alias('def_team_toi')
         ])
     )
     return EV_DF, PP_DF, SH_DF, EN_DF
 # 4) One-Hot Encode Certain Columns
 def model_prep(data, prep_type):
-    """ This function will prep each dataframe to be inputted into a classification model to predict expected goals """
-
-    if(prep_type == 'EV'):
-        model_prep = (
-            data
-            .join(ROSTER_DF.with_columns(pl.col('event_player_1_id').cast(pl.Utf8)), on=["event_player_1_id"], how = 'left')
-            .join(GOALIES, on=["event_goalie_id"], how = 'left')
-            .with_columns([
-                # Target Variable
-                (pl.when(pl.col('event_type') == "GOAL").then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_goal'),
-                # Game State
-                (pl.when(pl.col('strength_state') == "5v5").then(pl.lit(1)).otherwise(pl.lit(0))).alias('state_5v5'),
-                (pl.when(pl.col('strength_state') == "4v4").then(pl.lit(1)).otherwise(pl.lit(0))).alias('state_4v4'),
-                (pl.when(pl.col('strength_state') == "3v3").then(pl.lit(1)).otherwise(pl.lit(0))).alias('state_3v3'),
-                # Score State
-                (pl.when(pl.col('score_state') <= -4).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_down_4'),
-                (pl.when(pl.col('score_state') == -3).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_down_3'),
-                (pl.when(pl.col('score_state') == -2).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_down_2'),
-                (pl.when(pl.col('score_state') == -1).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_down_1'),
-                (pl.when(pl.col('score_state') == 0).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_even'),
-                (pl.when(pl.col('score_state') == 1).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_up_1'),
-                (pl.when(pl.col('score_state') == 2).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_up_2'),
-                (pl.when(pl.col('score_state') == 3).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_up_3'),
-                (pl.when(pl.col('score_state') >= 4).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_up_4'),
-                # Prior Shot Outcome
-                (pl.when((pl.col('event_type_last') == "SHOT") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_shot_same'),
-                (pl.when((pl.col('event_type_last') == "MISSED_SHOT") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_miss_same'),
-                (pl.when((pl.col('event_type_last') == "BLOCKED_SHOT") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_block_same'),
-                (pl.when((pl.col('event_type_last') == "SHOT") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_shot_opp'),
-                (pl.when((pl.col('event_type_last') == "MISSED_SHOT") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_miss_opp'),
-                (pl.when((pl.col('event_type_last') == "BLOCKED_SHOT") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_block_opp'),
-                # Prior Event - Non Shot
-                (pl.when((pl.col('event_type_last') == "GIVEAWAY") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_give_opp'),
-                (pl.when((pl.col('event_type_last') == "GIVEAWAY") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_give_same'),
-                (pl.when((pl.col('event_type_last') == "TAKEAWAY") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_take_opp'),
-                (pl.when((pl.col('event_type_last') == "TAKEAWAY") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_take_same'),
-                (pl.when((pl.col('event_type_last') == "HIT") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_hit_opp'),
-                (pl.when((pl.col('event_type_last') == "HIT") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_hit_same'),
-                (pl.when((pl.col('event_type_last') == "FACEOFF") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_face_win'),
-                (pl.when((pl.col('event_type_last') == "FACEOFF") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_face_lose'),
-                # Handiness
-                (pl.when(
-                    ((pl.col('hand_R') == 1) & (pl.col('y_abs') > 0) & ((pl.col('event_angle') > 10))) |
-                    ((pl.col('hand_L') == 1) & (pl.col('y_abs') < 0) & ((pl.col('event_angle') > 10)))
-                    ).then(pl.lit(1)).otherwise(pl.lit(0)).alias('off_wing'))
-            ])
-            .with_columns([
-                # Create Rebound Flag
-                (pl.when(
-                (pl.col('prior_shot_same') == 1) &
-                (pl.col('seconds_since_last') <= 3)
-                ).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_rebound'),
-                (pl.when(
-                ((pl.col('prior_miss_same') == 1) | (pl.col('prior_block_same') == 1)) &
-                (pl.col('seconds_since_last') <= 3)
-                ).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_post_miss_shot'),
-                # Set Play (Faceoff Win + Shot In 5 Seconds)
-                (pl.when(
-                (pl.col('prior_face_win') == 1) &
-                (pl.col('x_abs_last') > 25) &
-                (pl.col('seconds_since_last') <= 3)
-                ).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_set_play'),
-                # Rush (Transition Play after Turnover)
-                (pl.when(
-                (pl.col('x_abs_last') < 0) &
-                (pl.col('seconds_since_last') <= 5) &
-                ((pl.col('prior_give_opp') == 1) | (pl.col('prior_shot_opp') == 1) | (pl.col('prior_miss_opp') == 1) | (pl.col('prior_block_opp') == 1) | (pl.col('prior_take_same') == 1))
-                ).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_rush_play'),
-                (pl.when(
-                (pl.col('x_abs_last') < 25) &
-                (pl.col('seconds_since_last') <= 3) &
-                ((pl.col('prior_give_opp') == 1) | (pl.col('prior_shot_opp') == 1) | (pl.col('prior_miss_opp') == 1) | (pl.col('prior_block_opp') == 1) | (pl.col('prior_take_same') == 1))
-                ).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_fast_rush_play')
-            ])
-        )
-
-        # Get Creates Column Names + Slim
-        new_cols = model_prep.columns[-32:]
-        model_prep = (
-            model_prep
-            .select([ 'season', 'game_id', 'event_idx', 'secondary_type', 'event_player_1_id', 'event_goalie_id',
-                'is_goal',
-                'period', 'game_seconds','is_home', 'is_overtime', 'is_playoff',
-                'x_abs', 'y_abs', 'event_distance', 'event_angle',
-                'event_angle_change', 'event_angle_change_speed',
-                'seconds_since_last', 'distance_from_last', 'x_abs_last', 'y_abs_last', 'puck_speed_since_last',
-                'pos_F', 'pos_D', 'pos_G', 'hand_R', 'hand_L', 'G_hand_R', 'G_hand_L',
-                'event_team_shift_time_diff', 'event_team_toi', 'def_team_toi'] + new_cols
-            )
-        )
-
-    elif(prep_type == 'PP'):
-        model_prep = (
-            data
-            .join(ROSTER_DF.with_columns(pl.col('event_player_1_id').cast(pl.Utf8)), on=["event_player_1_id"], how = 'left')
-            .join(GOALIES, on=["event_goalie_id"], how = 'left')
-            .with_columns([
-                # Target Variable
-                (pl.when(pl.col('event_type') == "GOAL").then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_goal'),
-                # Game State
-                (pl.when(((pl.col('true_strength_state') == "5v4") & (pl.col('event_team_type') == 'home')) | 
-                         ((pl.col('true_strength_state') == "4v5") & (pl.col('event_team_type') == 'away'))).then(pl.lit(1)).otherwise(pl.lit(0))).alias('state_5v4'),
-                (pl.when(((pl.col('true_strength_state') == "5v3") & (pl.col('event_team_type') == 'home')) | 
-                         ((pl.col('true_strength_state') == "3v5") & (pl.col('event_team_type') == 'away'))).then(pl.lit(1)).otherwise(pl.lit(0))).alias('state_5v3'),
-                (pl.when(((pl.col('true_strength_state') == "4v3") & (pl.col('event_team_type') == 'home')) | 
-                         ((pl.col('true_strength_state') == "3v4") & (pl.col('event_team_type') == 'away'))).then(pl.lit(1)).otherwise(pl.lit(0))).alias('state_4v3'),
-                (pl.when(((pl.col('true_strength_state') == "6v5") & (pl.col('event_team_type') == 'home')) | 
-                         ((pl.col('true_strength_state') == "5v6") & (pl.col('event_team_type') == 'away'))).then(pl.lit(1)).otherwise(pl.lit(0))).alias('state_6v5'),
-                (pl.when(((pl.col('true_strength_state') == "6v4") & (pl.col('event_team_type') == 'home')) | 
-                         ((pl.col('true_strength_state') == "4v6") & (pl.col('event_team_type') == 'away'))).then(pl.lit(1)).otherwise(pl.lit(0))).alias('state_6v4'),
-                # Score State
-                (pl.when(pl.col('score_state') <= -4).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_down_4'),
-                (pl.when(pl.col('score_state') == -3).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_down_3'),
-                (pl.when(pl.col('score_state') == -2).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_down_2'),
-                (pl.when(pl.col('score_state') == -1).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_down_1'),
-                (pl.when(pl.col('score_state') == 0).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_even'),
-                (pl.when(pl.col('score_state') == 1).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_up_1'),
-                (pl.when(pl.col('score_state') == 2).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_up_2'),
-                (pl.when(pl.col('score_state') == 3).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_up_3'),
-                (pl.when(pl.col('score_state') >= 4).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_up_4'),
-                # Prior Shot Outcome
-                (pl.when((pl.col('event_type_last') == "SHOT") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_shot_same'),
-                (pl.when((pl.col('event_type_last') == "MISSED_SHOT") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_miss_same'),
-                (pl.when((pl.col('event_type_last') == "BLOCKED_SHOT") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_block_same'),
-                (pl.when((pl.col('event_type_last') == "SHOT") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_shot_opp'),
-                (pl.when((pl.col('event_type_last') == "MISSED_SHOT") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_miss_opp'),
-                (pl.when((pl.col('event_type_last') == "BLOCKED_SHOT") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_block_opp'),
-                # Prior Event - Non Shot
-                (pl.when((pl.col('event_type_last') == "GIVEAWAY") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_give_opp'),
-                (pl.when((pl.col('event_type_last') == "GIVEAWAY") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_give_same'),
-                (pl.when((pl.col('event_type_last') == "TAKEAWAY") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_take_opp'),
-                (pl.when((pl.col('event_type_last') == "TAKEAWAY") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_take_same'),
-                (pl.when((pl.col('event_type_last') == "HIT") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_hit_opp'),
-                (pl.when((pl.col('event_type_last') == "HIT") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_hit_same'),
-                (pl.when((pl.col('event_type_last') == "FACEOFF") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_face_win'),
-                (pl.when((pl.col('event_type_last') == "FACEOFF") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_face_lose'),
-                # Handiness
-                (pl.when(
-                    ((pl.col('hand_R') == 1) & (pl.col('y_abs') > 0) & ((pl.col('event_angle') > 10))) |
-                    ((pl.col('hand_L') == 1) & (pl.col('y_abs') < 0) & ((pl.col('event_angle') > 10)))
-                    ).then(pl.lit(1)).otherwise(pl.lit(0)).alias('off_wing'))
-            ])
-            .with_columns([
-                # Create Rebound Flag
-                (pl.when(
-                (pl.col('prior_shot_same') == 1) &
-                (pl.col('seconds_since_last') <= 3)
-                ).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_rebound'),
-                (pl.when(
-                ((pl.col('prior_miss_same') == 1) | (pl.col('prior_block_same') == 1)) &
-                (pl.col('seconds_since_last') <= 3)
-                ).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_post_miss_shot'),
-                # Set Play (Faceoff Win + Shot In 5 Seconds)
-                (pl.when(
-                (pl.col('prior_face_win') == 1) &
-                (pl.col('x_abs_last') > 25) &
-                (pl.col('seconds_since_last') <= 3)
-                ).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_set_play'),
-                # Rush (Transition Play after Turnover)
-                (pl.when(
-                (pl.col('x_abs_last') < 0) &
-                (pl.col('seconds_since_last') <= 5) &
-                ((pl.col('prior_give_opp') == 1) | (pl.col('prior_shot_opp') == 1) | (pl.col('prior_miss_opp') == 1) | (pl.col('prior_block_opp') == 1) | (pl.col('prior_take_same') == 1))
-                ).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_rush_play'),
-                (pl.when(
-                (pl.col('x_abs_last') < 25) &
-                (pl.col('seconds_since_last') <= 3) &
-                ((pl.col('prior_give_opp') == 1) | (pl.col('prior_shot_opp') == 1) | (pl.col('prior_miss_opp') == 1) | (pl.col('prior_block_opp') == 1) | (pl.col('prior_take_same') == 1))
-                ).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_fast_rush_play')
-            ])
-        )
-
-        # Get Creates Column Names + Slim
-        new_cols = model_prep.columns[-34:]
-        model_prep = (
-            model_prep
-            .select([ 'season', 'game_id', 'event_idx', 'secondary_type', 'event_player_1_id', 'event_goalie_id',
-                'is_goal',
-                'period', 'game_seconds','is_home', 'is_overtime', 'is_playoff',
-                'x_abs', 'y_abs', 'event_angle', 'event_distance',
-                'event_angle_change', 'event_angle_change_speed',
-                'seconds_since_last', 'distance_from_last', 'x_abs_last', 'y_abs_last', 'puck_speed_since_last',
-                'pen_seconds_since', 'prior_event_EV', 'is_two_ma',
-                'pos_F', 'pos_D', 'pos_G', 'hand_R', 'hand_L', 'G_hand_R', 'G_hand_L',
-                'event_team_shift_time_diff', 'event_team_toi', 'def_team_toi'] + new_cols
-            )
-        )
-
-    elif(prep_type == 'SH'):
-        model_prep = (
-            data
-            .join(ROSTER_DF.with_columns(pl.col('event_player_1_id').cast(pl.Utf8)), on=["event_player_1_id"], how = 'left')
-            .join(GOALIES, on=["event_goalie_id"], how = 'left')
-            .with_columns([
-                # Target Variable
-                (pl.when(pl.col('event_type') == "GOAL").then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_goal'),
-                # Game State
-                (pl.when(((pl.col('true_strength_state') == "5v4") & (pl.col('event_team_type') == 'away')) | 
-                         ((pl.col('true_strength_state') == "4v5") & (pl.col('event_team_type') == 'home'))).then(pl.lit(1)).otherwise(pl.lit(0))).alias('state_4v5'),
-                (pl.when(((pl.col('true_strength_state') == "5v3") & (pl.col('event_team_type') == 'away')) | 
-                         ((pl.col('true_strength_state') == "3v5") & (pl.col('event_team_type') == 'home'))).then(pl.lit(1)).otherwise(pl.lit(0))).alias('state_3v5'),
-                (pl.when(((pl.col('true_strength_state') == "4v3") & (pl.col('event_team_type') == 'away')) | 
-                         ((pl.col('true_strength_state') == "3v4") & (pl.col('event_team_type') == 'home'))).then(pl.lit(1)).otherwise(pl.lit(0))).alias('state_3v4'),
-                # Score State
-                (pl.when(pl.col('score_state') <= -4).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_down_4'),
-                (pl.when(pl.col('score_state') == -3).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_down_3'),
-                (pl.when(pl.col('score_state') == -2).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_down_2'),
-                (pl.when(pl.col('score_state') == -1).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_down_1'),
-                (pl.when(pl.col('score_state') == 0).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_even'),
-                (pl.when(pl.col('score_state') == 1).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_up_1'),
-                (pl.when(pl.col('score_state') == 2).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_up_2'),
-                (pl.when(pl.col('score_state') == 3).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_up_3'),
-                (pl.when(pl.col('score_state') >= 4).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_up_4'),
-                # Prior Shot Outcome
-                (pl.when((pl.col('event_type_last') == "SHOT") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_shot_same'),
-                (pl.when((pl.col('event_type_last') == "MISSED_SHOT") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_miss_same'),
-                (pl.when((pl.col('event_type_last') == "BLOCKED_SHOT") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_block_same'),
-                (pl.when((pl.col('event_type_last') == "SHOT") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_shot_opp'),
-                (pl.when((pl.col('event_type_last') == "MISSED_SHOT") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_miss_opp'),
-                (pl.when((pl.col('event_type_last') == "BLOCKED_SHOT") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_block_opp'),
-                # Prior Event - Non Shot
-                (pl.when((pl.col('event_type_last') == "GIVEAWAY") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_give_opp'),
-                (pl.when((pl.col('event_type_last') == "GIVEAWAY") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_give_same'),
-                (pl.when((pl.col('event_type_last') == "TAKEAWAY") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_take_opp'),
-                (pl.when((pl.col('event_type_last') == "TAKEAWAY") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_take_same'),
-                (pl.when((pl.col('event_type_last') == "HIT") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_hit_opp'),
-                (pl.when((pl.col('event_type_last') == "HIT") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_hit_same'),
-                (pl.when((pl.col('event_type_last') == "FACEOFF") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_face_win'),
-                (pl.when((pl.col('event_type_last') == "FACEOFF") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_face_lose'),
-                # Handiness
-                (pl.when(
-                    ((pl.col('hand_R') == 1) & (pl.col('y_abs') > 0) & ((pl.col('event_angle') > 10))) |
-                    ((pl.col('hand_L') == 1) & (pl.col('y_abs') < 0) & ((pl.col('event_angle') > 10)))
-                    ).then(pl.lit(1)).otherwise(pl.lit(0)).alias('off_wing'))
-            ])
-            .with_columns([
-                # Create Rebound Flag
-                (pl.when(
-                (pl.col('prior_shot_same') == 1) &
-                (pl.col('seconds_since_last') <= 3)
-                ).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_rebound'),
-                (pl.when(
-                ((pl.col('prior_miss_same') == 1) | (pl.col('prior_block_same') == 1)) &
-                (pl.col('seconds_since_last') <= 3)
-                ).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_post_miss_shot'),
-                # Set Play (Faceoff Win + Shot In 5 Seconds)
-                (pl.when(
-                (pl.col('prior_face_win') == 1) &
-                (pl.col('x_abs_last') > 25) &
-                (pl.col('seconds_since_last') <= 3)
-                ).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_set_play'),
-                # Rush (Transition Play after Turnover)
-                (pl.when(
-                (pl.col('x_abs_last') < 0) &
-                (pl.col('seconds_since_last') <= 5) &
-                ((pl.col('prior_give_opp') == 1) | (pl.col('prior_shot_opp') == 1) | (pl.col('prior_miss_opp') == 1) | (pl.col('prior_block_opp') == 1) | (pl.col('prior_take_same') == 1))
-                ).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_rush_play'),
-                (pl.when(
-                (pl.col('x_abs_last') < 25) &
-                (pl.col('seconds_since_last') <= 3) &
-                ((pl.col('prior_give_opp') == 1) | (pl.col('prior_shot_opp') == 1) | (pl.col('prior_miss_opp') == 1) | (pl.col('prior_block_opp') == 1) | (pl.col('prior_take_same') == 1))
-                ).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_fast_rush_play')
-            ])
-        )
-
-        # Get Creates Column Names + Slim
-        new_cols = model_prep.columns[-32:]
-        model_prep = (
-            model_prep
-            .select([ 'season', 'game_id', 'event_idx', 'secondary_type', 'event_player_1_id', 'event_goalie_id',
-                'is_goal',
-                'period', 'game_seconds','is_home', 'is_overtime', 'is_playoff',
-                'x_abs', 'y_abs', 'event_angle', 'event_distance',
-                'event_angle_change', 'event_angle_change_speed',
-                'seconds_since_last', 'distance_from_last', 'x_abs_last', 'y_abs_last', 'puck_speed_since_last',
-                'pen_seconds_since', 'prior_event_EV',
-                'pos_F', 'pos_D', 'pos_G', 'hand_R', 'hand_L', 'G_hand_R', 'G_hand_L',
-                'event_team_shift_time_diff', 'event_team_toi', 'def_team_toi'] + new_cols
-            )
-        )
-
-    elif(prep_type == 'EN'):
-        model_prep = (
-        data
-        .join(ROSTER_DF.with_columns(pl.col('event_player_1_id').cast(pl.Utf8)), on=["event_player_1_id"], how = 'left')
-        .with_columns([
-            # Target Variable
-            (pl.when(pl.col('event_type') == "GOAL").then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_goal'),
-            # Game State
-            (pl.when(((pl.col('true_strength_state') == "Ev5") & (pl.col('event_team_type') == 'away')) | 
-                     ((pl.col('true_strength_state') == "5vE") & (pl.col('event_team_type') == 'home'))).then(pl.lit(1)).otherwise(pl.lit(0))).alias('state_Ev5'),
-            (pl.when(((pl.col('true_strength_state') == "Ev4") & (pl.col('event_team_type') == 'away')) | 
-                     ((pl.col('true_strength_state') == "4vE") & (pl.col('event_team_type') == 'home'))).then(pl.lit(1)).otherwise(pl.lit(0))).alias('state_Ev4'),
-            (pl.when(((pl.col('true_strength_state') == "Ev3") & (pl.col('event_team_type') == 'away')) | 
-                     ((pl.col('true_strength_state') == "3vE") & (pl.col('event_team_type') == 'home'))).then(pl.lit(1)).otherwise(pl.lit(0))).alias('state_Ev3'),
-            # Score State
-            (pl.when(pl.col('score_state') <= -4).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_down_4'),
-            (pl.when(pl.col('score_state') == -3).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_down_3'),
-            (pl.when(pl.col('score_state') == -2).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_down_2'),
-            (pl.when(pl.col('score_state') == -1).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_down_1'),
-            (pl.when(pl.col('score_state') == 0).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_even'),
-            (pl.when(pl.col('score_state') == 1).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_up_1'),
-            (pl.when(pl.col('score_state') == 2).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_up_2'),
-            (pl.when(pl.col('score_state') == 3).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_up_3'),
-            (pl.when(pl.col('score_state') >= 4).then(pl.lit(1)).otherwise(pl.lit(0))).alias('score_up_4'),
-            # Prior Shot Outcome
-            (pl.when((pl.col('event_type_last') == "SHOT") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_shot_same'),
-            (pl.when((pl.col('event_type_last') == "MISSED_SHOT") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_miss_same'),
-            (pl.when((pl.col('event_type_last') == "BLOCKED_SHOT") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_block_same'),
-            (pl.when((pl.col('event_type_last') == "SHOT") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_shot_opp'),
-            (pl.when((pl.col('event_type_last') == "MISSED_SHOT") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_miss_opp'),
-            (pl.when((pl.col('event_type_last') == "BLOCKED_SHOT") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_block_opp'),
-            # Prior Event - Non Shot
-            (pl.when((pl.col('event_type_last') == "GIVEAWAY") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_give_opp'),
-            (pl.when((pl.col('event_type_last') == "GIVEAWAY") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_give_same'),
-            (pl.when((pl.col('event_type_last') == "TAKEAWAY") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_take_opp'),
-            (pl.when((pl.col('event_type_last') == "TAKEAWAY") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_take_same'),
-            (pl.when((pl.col('event_type_last') == "HIT") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_hit_opp'),
-            (pl.when((pl.col('event_type_last') == "HIT") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_hit_same'),
-            (pl.when((pl.col('event_type_last') == "FACEOFF") & (pl.col('same_team_last') == 1)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_face_win'),
-            (pl.when((pl.col('event_type_last') == "FACEOFF") & (pl.col('same_team_last') == 0)).then(pl.lit(1)).otherwise(pl.lit(0))).alias('prior_face_lose'),
-            # Handiness
-            (pl.when(
-                    ((pl.col('hand_R') == 1) & (pl.col('y_abs') > 0) & ((pl.col('event_angle') > 10))) |
-                    ((pl.col('hand_L') == 1) & (pl.col('y_abs') < 0) & ((pl.col('event_angle') > 10)))
-                    ).then(pl.lit(1)).otherwise(pl.lit(0)).alias('off_wing'))
-        ])
-        .with_columns([
-            # Create Rebound Flag
-            (pl.when(
-            (pl.col('prior_shot_same') == 1) &
-            (pl.col('seconds_since_last') <= 3)
-            ).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_rebound'),
-            (pl.when(
-            ((pl.col('prior_miss_same') == 1) | (pl.col('prior_block_same') == 1)) &
-            (pl.col('seconds_since_last') <= 3)
-            ).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_post_miss_shot'),
-            # Set Play (Faceoff Win + Shot In 5 Seconds)
-            (pl.when(
-            (pl.col('prior_face_win') == 1) &
-            (pl.col('x_abs_last') > 25) &
-            (pl.col('seconds_since_last') <= 3)
-            ).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_set_play'),
-            # Rush (Transition Play after Turnover)
-            (pl.when(
-            (pl.col('x_abs_last') < 0) &
-            (pl.col('seconds_since_last') <= 5) &
-            ((pl.col('prior_give_opp') == 1) | (pl.col('prior_shot_opp') == 1) | (pl.col('prior_miss_opp') == 1) | (pl.col('prior_block_opp') == 1) | (pl.col('prior_take_same') == 1))
-            ).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_rush_play'),
-            (pl.when(
-            (pl.col('x_abs_last') < 25) &
-            (pl.col('seconds_since_last') <= 3) &
-            ((pl.col('prior_give_opp') == 1) | (pl.col('prior_shot_opp') == 1) | (pl.col('prior_miss_opp') == 1) | (pl.col('prior_block_opp') == 1) | (pl.col('prior_take_same') == 1))
-            ).then(pl.lit(1)).otherwise(pl.lit(0))).alias('is_fast_rush_play')
-            ])
-        )
+    """ This function will prep each dataframe to be inputted into a classification model to predict expected goals.
+        Features come from model_feature_registry, so any frame shaped like a split_by_strength output (i.e. one live event) works """
+
+    model_prep = data.join(frame_like(roster_lookup(), data), on=["event_player_1_id"], how = 'left')
+    if prep_type in goalie_strengths:
+        model_prep = model_prep.join(frame_like(goalie_lookup(), data), on=["event_goalie_id"], how = 'left')
+
+    # Build Every Feature In One Pass + Slim To The Explicit Column List
+    return (
+        model_prep
+        .with_columns(list(compile_model_features(prep_type).values()))
+        .select(model_columns(prep_type))
+    )
 
-        # Get Creates Column Names + Slim
-        new_cols = model_prep.columns[-32:]
-        model_prep = (
-            model_prep
-            .select(['season', 'game_id', 'event_idx', 'secondary_type', 'event_player_1_id',
-                'is_goal',
-                'period', 'game_seconds','is_home', 'is_overtime', 'is_playoff',
-                'x_abs', 'y_abs', 'event_distance', 'event_angle',
-                'event_angle_change', 'event_angle_change_speed',
-                'seconds_since_last', 'distance_from_last', 'x_abs_last', 'y_abs_last', 'puck_speed_since_last',
-                'prior_event_EV',
-                'pos_F', 'pos_D', 'pos_G', 'hand_R', 'hand_L',
-                'event_team_shift_time_diff', 'event_team_toi', 'def_team_toi'] + new_cols
-            )
-        )
-    return model_prep
 # 5) Imputate Shot Type For Weird Shots
 def imp_sec_type(data):
     """ This Function will looks to impute missing values in secondary type by using a classification model to guess the shot type"""
@@ -1030,13 +596,13 @@ def imp_sec_type(data):
 
 
     # Label encode the target variable
-    le = LabelEncoder()
+    le = modeling.LabelEncoder()
     train_target = le.fit_transform(
         train.select('secondary_type')['secondary_type']
     )
     
     # Train a classifier
-    classifier = XGBClassifier()
+    classifier = modeling.XGBClassifier()
     classifier.fit(train_features, train_target)
 
     # Predict missing values
@@ -1046,7 +612,7 @@ def imp_sec_type(data):
     imputed_labels = le.inverse_transform(predicted_values)
 
     # Use map_elements method to replace missing values
-    test = test.with_columns(pl.lit(imputed_labels).alias("event_detail"))
+    test = test.with_columns(pl.Series(imputed_labels).cast(train.schema['secondary_type']).alias("event_detail"))
     train = train.with_columns(pl.col('secondary_type').alias("event_detail"))
     final_df = train.vstack(test)
     final_df = (
@@ -1074,7 +640,87 @@ def imp_sec_type(data):
     
     return final_df.drop('secondary_type')
 
-def load_model_data(start=st_yr, end=end_yr):
+# 6) Build Model Query Plans For One Season
+def season_model_plans(data):
+    """ Chains clean_pbp_data -> index_input_data -> split_by_strength -> model_prep on a LazyFrame and returns the
+        (EV, PP, SH, EN) plans uncollected. Collect them together (pl.collect_all) so polars shares their common subplan"""
+    df = index_input_data(clean_pbp_data(data.lazy()))
+    ev, pp, sh, en = split_by_strength(df)
+    return model_prep(ev, "EV"), model_prep(pp, "PP"), model_prep(sh, "SH"), model_prep(en, "EN")
+
+# 7) Stream Every Local Season To Disk
+def stream_model_data(start=st_yr, end=end_yr, root=pbp_root, out_root=model_data_root, partitioned=False, season_types=None):
+    """ Builds the EV/PP/SH/EN model datasets for every local season and writes them straight to disk, one file per season.
+        All season files are scanned as one dataset and each season is a batch (every window and index in the pipeline is
+        per season/game) run on the streaming engine, so peak memory is about one season of raw play by play.
+        partitioned=True reads the PBP/hive layout instead, where season_types (i.e. ['P'] for playoffs only) skips whole partitions.
+        Returns {strength: [paths]}"""
+    if partitioned:
+        root = hive_root if root == pbp_root else root
+        seasons = [i for i in range(start, end) if os.path.isdir(season_partition_dir(i, root))]
+    else:
+        seasons = [i for i in range(start, end) if os.path.exists(season_base_path(i, root))]
+    for i in sorted(set(range(start, end)) - set(seasons)):
+        print(f"No Local Play by Play For {i}-{i+1} | Skipping")
+
+    if partitioned:
+        pbp = scan_pbp_dataset(root, seasons=seasons, season_types=season_types)
+    else:
+        pbp = scan_pbp_seasons(seasons, root)
+        if season_types is not None:
+            pbp = pbp.filter(pl.col('season_type').is_in(season_types))
+    type_lab = '' if season_types is None else '_' + ''.join(season_types)
+    paths = {strength: [] for strength in model_strengths}
+    for i in seasons:
+        print(f"Now Streaming Play by Play Data From {i}-{i+1} NHL Season")
+
+        # Season Predicate Is Pushed Into The Scan, So Only This Season's Files Are Read
+        season_pbp = pbp.filter(pl.col('season') == int(f"{i}{i+1}"))
+        frames = pl.collect_all(list(season_model_plans(season_pbp)), streaming=True)
+
+        for strength, df in zip(model_strengths, frames):
+            save_path = f"{out_root}/{strength}/NHL_Model_{strength}_{i}{i+1}{type_lab}.parquet"
+            os.makedirs(os.path.dirname(save_path), exist_ok=True)
+            df.write_parquet(save_path + '.tmp')
+            os.replace(save_path + '.tmp', save_path)
+            paths[strength].append(save_path)
+
+    return paths
+
+# 8) Feature Store (Per Season Model Frames, Rebuilt Only When The Feature Code Or Raw Data Change)
+def feature_code_fp():
+    """ Fingerprint of everything that shapes the model frames: the feature functions, geometry, column dtypes, the event/strength constants
+        and the roster/goalie lookups they join against"""
+    return code_fingerprint(
+        [frame_like, clean_pbp_data, index_input_data, split_by_strength, model_prep, season_model_plans, geometry, pbptypes,
+         flag, team_state, prior_event, compile_model_features, model_columns],
+        extra=[[(name, strengths, str(expr)) for name, strengths, expr in model_feature_registry], model_base_columns, goalie_strengths, xG_Events, fenwick_events, corsi_events, EV_STR_Codes, PP_STR_Codes, UE_STR_Codes, SH_STR_Codes,
+               frame_fingerprint(roster_lookup()), frame_fingerprint(goalie_lookup()), pl.__version__]
+    )
+
+def load_season_features(i, root=pbp_root, store_root=feature_root, code_fp=None):
+    """ Returns the (EV, PP, SH, EN) model frames of a local season from the feature store. They are built (and stored) only
+        when no stored frames match the season's raw files + the current feature code"""
+    season_lab = f"{i}{i+1}"
+    code_fp = feature_code_fp() if code_fp is None else code_fp
+    input_ck = input_checksum([season_base_path(i, root)] + list_season_deltas(i, root))
+    key = feature_key(code_fp, input_ck)
+
+    frames = read_features(season_lab, key, store_root)
+    if frames is None:
+        print(f"Building Features For {i}-{i+1} NHL Season | Key {key}")
+        built = pl.collect_all(list(season_model_plans(scan_season_pbp(i, root))), streaming=True)
+        frames = dict(zip(feature_strengths, built))
+        save_features(season_lab, key, frames, store_root, code_fp, input_ck)
+    else:
+        print(f"Loaded Stored Features For {i}-{i+1} NHL Season | Key {key}")
+    return tuple(frames[strength] for strength in feature_strengths)
+
+def load_model_data(start=st_yr, end=end_yr, stream=False, partitioned=False, store=False):
+    """ Loads the EV/PP/SH/EN model datasets. stream=True builds them from the local season files with stream_model_data
+        (bounded memory, datasets written to model_data_root) instead of reading each season from GitHub into memory.
+        partitioned=True streams from the PBP/hive layout.
+        store=True reads each local season from the feature store and only rebuilds seasons whose raw files or feature code changed"""
     ## BEGIN LOAD ##
     ev_dfs = []
     pp_dfs = []
@@ -1084,36 +730,39 @@ def load_model_data(start=st_yr, end=end_yr):
     print("================== Begin Loading + Cleaning Individual Seasons ==================")
     print(" ")
 
-    for i in range(start,end):
-
-        # Begin Load
-        print(f"Now Loading Play by Play Data From {i}-{i+1} NHL Season")
-
-        # Basic Clean/Manipulation
-        df = clean_pbp_data(pl.read_parquet(f'https://raw.githubusercontent.com/twinfield10/NHL-Data/main/PBP/parquet/API_RAW_PBP_Data_{i}{i+1}.parquet'))
-
-        # Create Indexes
-        df = index_input_data(df)
-
-        if i == 2023:
-            CURRENT_DF = df
-        else:
-            pass
-
-        # Split by Strength
-        ev, pp, sh, en = split_by_strength(df)
-
-        # Prep For Model (OHE + Other Features)
-        ev = model_prep(ev, "EV")
-        pp = model_prep(pp, "PP")
-        sh = model_prep(sh, "SH")
-        en = model_prep(en, "EN")
-
-        # Append the modified dataframe to the list
-        ev_dfs.append(ev)
-        pp_dfs.append(pp)
-        sh_dfs.append(sh)
-        en_dfs.append(en)
+    if stream:
+        # Raw Play By Play Never Leaves The Streaming Build, Only The (Small) Shot Datasets Are Read Back
+        paths = stream_model_data(start, end, partitioned=partitioned)
+        ev_dfs, pp_dfs, sh_dfs, en_dfs = [[pl.read_parquet(p) for p in paths[strength]] for strength in model_strengths]
+    elif store:
+        code_fp = feature_code_fp()
+        for i in range(start,end):
+            if not os.path.exists(season_base_path(i)):
+                print(f"No Local Play by Play For {i}-{i+1} | Skipping")
+                continue
+            ev, pp, sh, en = load_season_features(i, code_fp=code_fp)
+            ev_dfs.append(ev)
+            pp_dfs.append(pp)
+            sh_dfs.append(sh)
+            en_dfs.append(en)
+    else:
+        for i in range(start,end):
+
+            # Begin Load
+            print(f"Now Loading Play by Play Data From {i}-{i+1} NHL Season")
+
+            # Build The Season Query Plan (Nothing Is Read Yet)
+            ev, pp, sh, en = season_model_plans(scan_season_pbp(i, root=remote_pbp_root))
+
+            # Run All Four Plans Together: The Scan + Clean + Index Subplan They Share Is Computed Once And Only
+            # Columns Used By model_prep's Final Select Are Decoded
+            ev, pp, sh, en = pl.collect_all([ev, pp, sh, en])
+
+            # Append the modified dataframe to the list
+            ev_dfs.append(ev)
+            pp_dfs.append(pp)
+            sh_dfs.append(sh)
+            en_dfs.append(en)
 
         # Create the PBP DataFrames
     print(" ")
@@ -1121,27 +770,19 @@ def load_model_data(start=st_yr, end=end_yr):
     print(" ")
 
     # EV
-    EV_PBP = ev_dfs[0]
-    for df in ev_dfs[1:]:
-        EV_PBP = EV_PBP.extend(df)
+    EV_PBP = pl.concat(ev_dfs, how='vertical')
     print(str(EV_PBP.height) + " Total Shots in Even Strength DF")
 
     # PP
-    PP_PBP = pp_dfs[0]
-    for df in pp_dfs[1:]:
-        PP_PBP = PP_PBP.extend(df)
+    PP_PBP = pl.concat(pp_dfs, how='vertical')
     print(str(PP_PBP.height) + " Total Shots in Power Play DF")
 
     # SH
-    SH_PBP = sh_dfs[0]
-    for df in sh_dfs[1:]:
-        SH_PBP = SH_PBP.extend(df)
+    SH_PBP = pl.concat(sh_dfs, how='vertical')
     print(str(SH_PBP.height) + " Total Shots in Short Handed (Offense) DF")
 
     # EN
-    EN_PBP = en_dfs[0]
-    for df in en_dfs[1:]:
-        EN_PBP = EN_PBP.extend(df)
+    EN_PBP = pl.concat(en_dfs, how='vertical')
     print(str(EN_PBP.height) + " Total Shots in Empty Net DF")
 
     # Imputate + Clean Null Values of Shot Type
@@ -1158,4 +799,6 @@ def load_model_data(start=st_yr, end=end_yr):
 
     return EV_PBP, PP_PBP, SH_PBP, EN_PBP
 
-EV_PBP, PP_PBP, SH_PBP, EN_PBP = load_model_data(2010, 2024)
\ No newline at end of file
+# Guarded So Importing This File (i.e. For clean_pbp_data Or model_prep) Does No I/O
+if __name__ == '__main__':
+    EV_PBP, PP_PBP, SH_PBP, EN_PBP = load_model_data(2010, 2024)
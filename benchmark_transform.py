@@ -0,0 +1,92 @@
+# benchmark_transform.py
+# Micro-benchmark for align_and_cast_columns: per game time of the current version vs. the version at a git revision.
+#
+# Payloads are read through the raw archive, so run a load in 'record' mode first (or pass --archive live).
+#   python benchmark_transform.py --games 2023020001 2023020002 --baseline c1e7e61 --repeat 20
+import argparse
+import importlib.util
+import subprocess
+import sys
+import tempfile
+import time
+
+from initalize import *
+
+# Constants - Benchmark Defaults #
+bench_games = [2023020001, 2023020002, 2023020003]
+bench_repeat = 10
+
+
+def load_baseline_module(rev):
+    """initalize.py as it was at a git revision, executed in a throwaway module next to that revision's own helper modules
+       (its top level .py files are written to a temp dir, nothing is checked out). The current helper modules are put back after"""
+    repo_dir = os.path.dirname(os.path.abspath(__file__))
+    git = lambda *cmd: subprocess.run(['git', *cmd], capture_output=True, text=True, check=True, cwd=repo_dir).stdout
+    rev_dir = tempfile.mkdtemp(prefix=f"baseline_{rev}_")
+    local_modules = []
+    for file in git('ls-tree', '--name-only', rev).splitlines():
+        if file.endswith('.py'):
+            with open(f"{rev_dir}/{file}", 'w') as f:
+                f.write(git('show', f"{rev}:{file}"))
+            local_modules.append(file[:-3])
+
+    # Swap The Current Helper Modules Out While The Baseline Imports Its Own
+    current_modules = {name: sys.modules.pop(name) for name in local_modules if name in sys.modules}
+    sys.path.insert(0, rev_dir)
+    try:
+        module = importlib.util.module_from_spec(importlib.util.spec_from_loader(f"initalize_{rev}", loader=None))
+        exec(compile(git('show', f"{rev}:initalize.py"), f"{rev}:initalize.py", 'exec'), module.__dict__)
+    finally:
+        sys.path.remove(rev_dir)
+        for name in local_modules:
+            sys.modules.pop(name, None)
+        sys.modules.update(current_modules)
+    return module
+
+def load_baseline_align(rev):
+    """(align_and_cast_columns, raw_schema) as they were at a git revision. The baseline needs its own schema: dtype codes
+       (i.e. 'u32') change between revisions"""
+    module = load_baseline_module(rev)
+    return module.align_and_cast_columns, module.raw_schema
+
+def same_output(baseline_df, current_df):
+    """Equal values, with the baseline cast to the current dtypes first (i.e. ids stored as text before they were UInt32)"""
+    if baseline_df.columns != current_df.columns:
+        return False
+    return baseline_df.cast(current_df.schema).equals(current_df)
+
+def time_per_game(func, frames, repeat, sch=raw_schema):
+    """Best of repeat runs, in milliseconds per game"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for df in frames:
+            func(data=df, sch=sch)
+        elap = (time.perf_counter() - start) / len(frames)
+        best = elap if best is None else min(best, elap)
+    return round(best * 1000, 2)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Per game timing of align_and_cast_columns before and after')
+    parser.add_argument('--games', type=int, nargs='+', default=bench_games)
+    parser.add_argument('--baseline', default=None, help='git revision to compare against (i.e. the commit before a change)')
+    parser.add_argument('--repeat', type=int, default=bench_repeat)
+    parser.add_argument('--archive', default='replay')
+    args = parser.parse_args()
+
+    # Decode Once So Only align_and_cast_columns Is Timed
+    frames = [ping_nhl_api(i=i, archive=args.archive) for i in args.games]
+
+    results = {'current': time_per_game(align_and_cast_columns, frames, args.repeat)}
+    if args.baseline is not None:
+        baseline_align, baseline_schema = load_baseline_align(args.baseline)
+        results[args.baseline] = time_per_game(baseline_align, frames, args.repeat, sch=baseline_schema)
+
+        # Outputs Must Match Before Timings Mean Anything
+        for df in frames:
+            if not same_output(baseline_align(data=df, sch=baseline_schema), align_and_cast_columns(data=df, sch=raw_schema)):
+                print(f"WARNING: Output Differs From {args.baseline} For Game ID {df['game_id'][0]}")
+
+    print(f"align_and_cast_columns | {len(frames)} Games | Best Of {args.repeat}")
+    for label, ms in results.items():
+        print(f"  {label:>12}: {ms} ms/game")
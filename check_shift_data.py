@@ -0,0 +1,84 @@
+# check_shift_data.py
+# Regression check for append_shift_data: on-ice players, goalies and every other shift derived column of the current
+# version vs. the version at a git revision (i.e. the per row map_elements version before the interval join), game by game.
+#
+# Payloads are read through the raw archive, so run a load in 'record' mode first (or pass --archive live).
+#   python check_shift_data.py --games 2023020001 2023020002 --baseline 948bd26
+# Exits non-zero if any game differs.
+import argparse
+import sys
+
+from initalize import *
+from benchmark_transform import load_baseline_module, bench_games
+from pbptypes import pbp_name_columns
+
+# Constants - Check Defaults #
+check_roster = 'Rosters/parquet/all/NHL_Roster_AllSeasons_Slim.parquet'
+on_ice_slots = {f"{team}_on_ids": [f"{team}_{n}_on_id" for n in range(1, 7)] for team in ['home', 'away']}
+
+
+def on_ice_sets(df):
+    """Replaces the six {team}_n_on_id slots with one sorted, comma joined set per team (slot order is not part of the output)"""
+    for label, slots in on_ice_slots.items():
+        slots = [col for col in slots if col in df.columns]
+        if slots:
+            df = (
+                df
+                .with_columns(pl.concat_list([pl.col(col).cast(pl.Utf8) for col in slots]).list.drop_nulls().list.sort().list.join(',').alias(label))
+                .drop(slots)
+            )
+    return df
+
+def compare_game(baseline, i, pbp_response, shift_response, roster, archive=archive_mode):
+    """{column: rows that differ} between the baseline and current append_shift_data for one game (empty when they match).
+       Each version runs on its own decode of the payload; name columns (dropped since the roster became the name table) are skipped"""
+    base_df = baseline.append_shift_data(
+        baseline.align_and_cast_columns(data=baseline.ping_nhl_api(i=i, pbp_response=pbp_response, archive=archive), sch=baseline.raw_schema),
+        roster_data=roster, shift_response=shift_response, archive=archive)
+    new_df = append_shift_data(
+        align_and_cast_columns(data=ping_nhl_api(i=i, pbp_response=pbp_response, archive=archive), sch=raw_schema),
+        roster_data=roster, shift_response=shift_response, archive=archive)
+
+    # 1) Same Rows In The Same Order, Same Dtypes, On-Ice Slots As Sets
+    base_df = on_ice_sets(base_df.sort('event_idx'))
+    new_df = on_ice_sets(new_df.sort('event_idx'))
+    cols = [col for col in new_df.columns if (col in base_df.columns) & (col not in pbp_name_columns)]
+    if base_df.height != new_df.height:
+        return {'rows': abs(base_df.height - new_df.height)}
+    base_df = base_df.select(cols).cast({col: new_df.schema[col] for col in cols if base_df.schema[col] != new_df.schema[col]})
+
+    # 2) Count Differing Rows Per Column (Nulls Compare Equal)
+    diffs = {}
+    for col in cols:
+        n_diff = (~base_df[col].eq_missing(new_df[col])).sum()
+        if n_diff > 0:
+            diffs[col] = n_diff
+    missing = [col for col in base_df.columns if (col not in new_df.columns) & (col not in pbp_name_columns)]
+    if missing:
+        diffs['missing columns'] = missing
+    return diffs
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='append_shift_data output of the current version vs. a git revision')
+    parser.add_argument('--games', type=int, nargs='+', default=bench_games)
+    parser.add_argument('--baseline', required=True, help='git revision to compare against (i.e. the commit before a change)')
+    parser.add_argument('--roster', default=check_roster)
+    parser.add_argument('--archive', default='replay')
+    args = parser.parse_args()
+
+    baseline = load_baseline_module(args.baseline)
+    roster = pl.read_parquet(args.roster)
+
+    bad_games = 0
+    for i in args.games:
+        pbp_response = fetch_json('pbp', i, pbp_link_pre+str(i)+pbp_link_suf, args.archive)
+        shift_response = fetch_json('shifts', i, shift_link+str(i), args.archive)
+        diffs = compare_game(baseline, i, pbp_response, shift_response, roster, args.archive)
+        if diffs:
+            bad_games += 1
+            print(f"Game ID {i}: Differs From {args.baseline} | {diffs}")
+        else:
+            print(f"Game ID {i}: Matches {args.baseline}")
+
+    print(f"append_shift_data | {len(args.games) - bad_games}/{len(args.games)} Games Match {args.baseline}")
+    sys.exit(1 if bad_games else 0)
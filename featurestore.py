@@ -0,0 +1,91 @@
+# featurestore.py
+# Versioned per-season store for the model-ready EV/PP/SH/EN frames built by applymodels.
+#
+# Layout:
+#   Model/features/{season}/{key}/NHL_Features_{strength}.parquet   <- frames built by one version of the feature code
+#   Model/features/{season}/manifest.json                           <- key currently served for the season (+ what went into it)
+#
+# key = sha256(code fingerprint + input checksum). The code fingerprint covers the feature functions' source and anything
+# they join against; the input checksum covers the raw season files. Past seasons keep their key, so they are read back
+# instead of rebuilt until the feature logic (or their raw data) changes.
+import hashlib
+import inspect
+import json
+import os
+import shutil
+from datetime import datetime
+
+import polars as pl
+
+# Constants - Store Location #
+feature_root = 'Model/features'
+feature_strengths = ['EV', 'PP', 'SH', 'EN']
+checksum_chunk = 1 << 20   # Bytes read at a time when hashing raw files
+
+
+def code_fingerprint(objects, extra=()):
+    """sha256 over the source of functions/modules plus any extra strings (i.e. lookup table hashes, library versions)"""
+    digest = hashlib.sha256()
+    for obj in objects:
+        digest.update(inspect.getsource(obj).encode())
+    for value in extra:
+        digest.update(str(value).encode())
+    return digest.hexdigest()
+
+def frame_fingerprint(df):
+    """Order independent sha256 of a (small) lookup frame. Row hashes are folded with polars (two seeds), so numpy isn't needed"""
+    row_hashes = df.sort(df.columns).hash_rows(seed=0).implode()
+    return hashlib.sha256(f"{df.height}:{row_hashes.hash(seed=0)[0]}:{row_hashes.hash(seed=1)[0]}".encode()).hexdigest()
+
+def input_checksum(paths):
+    """sha256 over the bytes of every raw input file (local paths), in order"""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(os.path.basename(path).encode())
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(checksum_chunk), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+def feature_key(code_fp, input_ck):
+    return hashlib.sha256(f"{code_fp}:{input_ck}".encode()).hexdigest()[:16]
+
+def _season_dir(season_lab, root=feature_root):
+    return f"{root}/{season_lab}"
+
+def read_feature_manifest(season_lab, root=feature_root):
+    manifest_path = f"{_season_dir(season_lab, root)}/manifest.json"
+    if not os.path.exists(manifest_path):
+        return {}
+    with open(manifest_path) as f:
+        return json.load(f)
+
+def read_features(season_lab, key, root=feature_root):
+    """Returns {strength: DataFrame} if the season is stored under key, else None"""
+    if read_feature_manifest(season_lab, root).get('key') != key:
+        return None
+    key_dir = f"{_season_dir(season_lab, root)}/{key}"
+    paths = {strength: f"{key_dir}/NHL_Features_{strength}.parquet" for strength in feature_strengths}
+    if not all(os.path.exists(p) for p in paths.values()):
+        return None
+    return {strength: pl.read_parquet(p) for strength, p in paths.items()}
+
+def save_features(season_lab, key, frames, root=feature_root, code_fp=None, input_ck=None):
+    """Writes the frames under key, then points the season manifest at them and drops older keys"""
+    season_dir = _season_dir(season_lab, root)
+    key_dir = f"{season_dir}/{key}"
+    os.makedirs(key_dir, exist_ok=True)
+    for strength in feature_strengths:
+        path = f"{key_dir}/NHL_Features_{strength}.parquet"
+        frames[strength].write_parquet(path + '.tmp')
+        os.replace(path + '.tmp', path)
+
+    manifest = {'key': key, 'code': code_fp, 'input': input_ck, 'built': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'rows': {strength: frames[strength].height for strength in feature_strengths}}
+    with open(f"{season_dir}/manifest.json.tmp", 'w') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(f"{season_dir}/manifest.json.tmp", f"{season_dir}/manifest.json")
+
+    for old_key in os.listdir(season_dir):
+        if (old_key != key) & os.path.isdir(f"{season_dir}/{old_key}"):
+            shutil.rmtree(f"{season_dir}/{old_key}")
@@ -0,0 +1,45 @@
+# geometry.py
+# Native polars expressions for the clock and rink geometry features, shared by initalize.py, loadfunctions.py and applymodels.py.
+#
+# Every function takes column names (or expressions) and returns an expression, so the features run inside polars
+# instead of calling a Python function per row. Coordinates are x_abs/y_abs (attacking zone is x > 0).
+from math import pi
+
+import polars as pl
+
+# Constants - Goal Line (Feet From Center Ice) #
+ingest_goal_x = 89.0     # Used for event_distance/event_angle when the raw play by play is built (initalize.py)
+model_goal_x = 89.25     # Used for the model features (applymodels.py)
+
+
+def _col(c):
+    return pl.col(c) if isinstance(c, str) else c
+
+def clock_seconds(c):
+    """MM:SS game clock string -> whole seconds (Int64, null stays null). Replaces the old per row min_to_sec helper"""
+    parts = _col(c).str.split_exact(':', 1)
+    return parts.struct.field('field_0').cast(pl.Int64) * 60 + parts.struct.field('field_1').cast(pl.Int64)
+
+def net_x_distance(x, goal_x=ingest_goal_x):
+    """Distance along the x axis between a point and the attacking goal line"""
+    return (
+        pl.when(_col(x) >= 0).then(goal_x - _col(x).abs())
+          .when(_col(x) < 0).then(_col(x).abs() + goal_x)
+    )
+
+def net_distance(x, y, goal_x=ingest_goal_x):
+    """Straight line distance from a point to the attacking net"""
+    return (net_x_distance(x, goal_x)**2 + _col(y)**2).sqrt()
+
+def net_angle(x, y, goal_x=ingest_goal_x):
+    """Angle (degrees, 0 = straight on) from a point to the attacking net. Points behind the goal line get 180 - angle"""
+    angle = ((_col(y) / net_x_distance(x, goal_x)).arctan().cast(pl.Float64) * (180 / pi)).abs()
+    return pl.when(_col(x) > goal_x).then(180 - angle).otherwise(angle)
+
+def angle_change(angle, angle_last):
+    """Absolute change in shot angle between two events"""
+    return (_col(angle) - _col(angle_last)).abs()
+
+def angle_change_speed(change, seconds):
+    """Angle change per second between two events"""
+    return _col(change) / _col(seconds)
@@ -1,5 +1,12 @@
 # initalload.py
 from requirements import *
+from nhlclient import api_get, api_stats
+from rawarchive import archive_get, archive_put, ArchiveMissError
+from geometry import clock_seconds, net_distance, net_angle
+from pbpstore import season_base_path, new_delta_path, add_season_delta, read_season_pbp, reset_season_deltas, compact_season_pbp
+from pbpstore import season_partition_dir, write_pbp_partitions, replace_season_partitions, scan_pbp_dataset
+from pbptypes import cast_pbp_types, pbp_schema, cast_roster_ids, cast_schedule_ids, pbp_id_dtype
+from ipccache import read_cached, share_frame, read_shared
 
 # Constants - Team Abbreviation
 team_abbr_dict = {
@@ -39,8 +46,8 @@ team_abbr_dict = {
     52: 'WPG'            # Winnipeg Jets
 }
 
-away_teams = pl.DataFrame([{'away_team_id': team_id, 'away_abbreviation': team_abbr} for team_id, team_abbr in team_abbr_dict.items()]).with_columns(pl.col('away_team_id').cast(pl.Utf8))
-home_teams = pl.DataFrame([{'home_team_id': team_id, 'home_abbreviation': team_abbr} for team_id, team_abbr in team_abbr_dict.items()]).with_columns(pl.col('home_team_id').cast(pl.Utf8))
+away_teams = pl.DataFrame([{'away_team_id': team_id, 'away_abbreviation': team_abbr} for team_id, team_abbr in team_abbr_dict.items()]).with_columns(pl.col('away_team_id').cast(pbp_id_dtype))
+home_teams = pl.DataFrame([{'home_team_id': team_id, 'home_abbreviation': team_abbr} for team_id, team_abbr in team_abbr_dict.items()]).with_columns(pl.col('home_team_id').cast(pbp_id_dtype))
 
 # Constants - Time Zone Conversions #
 est = pytz.timezone('US/Eastern')
@@ -55,13 +62,39 @@ pbp_link_pre = 'https://api-web.nhle.com/v1/gamecenter/'
 pbp_link_suf = '/play-by-play'
 shift_link = 'https://api.nhle.com/stats/rest/en/shiftcharts?cayenneExp=gameId='
 
-# Constant - Helper Function (Covert GameTime to Seconds)
-def min_to_sec(time_str):
-    """This function will help to convert time's formatted like MM:SS to a round seconds number"""
-    if time_str is None:
-        return None
-    minutes, seconds = map(int, time_str.split(':'))
-    return minutes * 60 + seconds
+# Constants - Team/Seasons Without A Roster (Seeds The Missing Roster Cache) #
+roster_missing_seed = [
+    ('ATL', '20112012'), ('ATL', '20122013'), ('ATL', '20132014'), ('ATL', '20142015'), ('ATL', '20152016'), ('ATL', '20162017'), ('ATL', '20172018'), ('ATL', '20182019'), ('ATL', '20192020'), ('ATL', '20202021'), ('ATL', '20212022'), ('ATL', '20222023'), ('ATL', '20232024'),
+    ('ANA', '20132014'), ('ANA', '20142015'), ('ANA', '20152016'), ('ANA', '20162017'), ('ANA', '20172018'), ('ANA', '20182019'), ('ANA', '20192020'), ('ANA', '20202021'), ('ANA', '20212022'), ('ANA', '20222023'), ('ANA', '20232024'),
+    ('ARI', '20092010'), ('ARI', '20102011'), ('ARI', '20112012'), ('ARI', '20122013'), ('ARI', '20132014'),
+    ('PHX', '20142015'), ('PHX', '20152016'), ('PHX', '20162017'), ('PHX', '20172018'), ('PHX', '20182019'), ('PHX', '20192020'), ('PHX', '20202021'), ('PHX', '20212022'), ('PHX', '20222023'), ('PHX', '20232024'),
+    ('SEA', '20092010'), ('SEA', '20102011'), ('SEA', '20112012'), ('SEA', '20122013'), ('SEA', '20132014'), ('SEA', '20142015'), ('SEA', '20152016'), ('SEA', '20162017'), ('SEA', '20172018'), ('SEA', '20182019'), ('SEA', '20192020'), ('SEA', '20202021'),
+    ('VGK', '20092010'), ('VGK', '20102011'), ('VGK', '20112012'), ('VGK', '20122013'), ('VGK', '20132014'), ('VGK', '20142015'), ('VGK', '20152016'), ('VGK', '20162017'),
+    ('WPG', '20092010'), ('WPG', '20102011')
+]
+roster_missing_path = 'Rosters/parquet/missing/NHL_Roster_Missing.parquet'   # (team, season) pairs that 404, never requested again
+
+# Constants - Schedule Sync #
+schedule_link = 'https://api-web.nhle.com/v1/schedule/'
+schedule_sync_state = 'Schedule/schedule_sync_state.json'   # Last synced date per season, so windows are never refetched
+schedule_stride = 7                                         # Days covered by one /v1/schedule/{date} response (gameWeek)
+
+# Constants - Async Fetch #
+fetch_concurrency = 16   # Games downloaded at once when LoadData/Update run with concurrency
+fetch_prefetch = 32      # Downloaded games waiting to be transformed before downloads pause (back-pressure)
+fetch_put_timeout = 0.5  # Seconds a finished download waits on a full queue before checking if the consumer stopped
+
+# Constants - Game Shards #
+shard_root = 'PBP/shards'   # One parquet per finished game + manifest.txt, per season, so a killed load can resume
+
+# Constants - Parallel Transform #
+transform_workers = os.cpu_count() or 1   # Processes used for align_and_cast_columns/append_shift_data when LoadData/Update run with workers
+
+# Constants - Partitioned PBP #
+pbp_partitioned = False  # True = load_pbp/update_pbp also write PBP/hive season/season_type/month partitions (see pbpstore)
+
+# Constants - Raw Archive #
+archive_mode = 'record'  # 'live' = API only | 'record' = API + save raw payloads to Archive/ | 'replay' = Archive/ only, no network
 
 # Constants - PBP RAW Schema #
 raw_schema = {
@@ -76,11 +109,11 @@ raw_schema = {
     'timeInPeriod': 'str',
     'situationCode': 'str',
     'homeTeamDefendingSide': 'str',
-    'eventOwnerTeamId': 'str',
-    'awayTeam.id': 'str',
+    'eventOwnerTeamId': 'u32',
+    'awayTeam.id': 'u32',
     'awayTeam.abbrev': 'str',
     'awayScore': 'f32',
-    'homeTeam.id': 'str',
+    'homeTeam.id': 'u32',
     'homeTeam.abbrev': 'str',
     'homeScore': 'f32',
     'eventId': 'i32',
@@ -94,229 +127,397 @@ raw_schema = {
     'zoneCode': 'str',
     'xCoord': 'f32',
     'yCoord': 'f32',
-    'scoringPlayerId': 'str',
-    'shootingPlayerId': 'str',
-    'goalieInNetId': 'str',
-    'blockingPlayerId': 'str',
-    'committedByPlayerId': 'str',
-    'drawnByPlayerId': 'str',
-    'servedByPlayerId': 'str',
+    'scoringPlayerId': 'u32',
+    'shootingPlayerId': 'u32',
+    'goalieInNetId': 'u32',
+    'blockingPlayerId': 'u32',
+    'committedByPlayerId': 'u32',
+    'drawnByPlayerId': 'u32',
+    'servedByPlayerId': 'u32',
     'duration': 'str',
-    'hittingPlayerId': 'str',
-    'hitteePlayerId': 'str',
-    'winningPlayerId': 'str',
-    'losingPlayerId': 'str',
-    'assist1PlayerId': 'str',
-    'assist2PlayerId': 'str',
-    'playerId': 'str'    
+    'hittingPlayerId': 'u32',
+    'hitteePlayerId': 'u32',
+    'winningPlayerId': 'u32',
+    'losingPlayerId': 'u32',
+    'assist1PlayerId': 'u32',
+    'assist2PlayerId': 'u32',
+    'playerId': 'u32'    
 }
 
+# Archive Helper Functions #
+json_loads = orjson.loads if orjson is not None else json.loads   # orjson is optional, roughly 3-5x faster on play by play payloads
+
+def fetch_raw(endpoint, key, link, archive=archive_mode):
+    """Returns (status_code, raw bytes) for an API payload.
+        1) 'live': Hits the API
+        2) 'record': Hits the API and saves successful payloads to the archive under endpoint/key
+        3) 'replay': Reads the archive only. Returns (404, None) if the payload was never archived"""
+    if archive == 'replay':
+        content = archive_get(endpoint, key)
+        return (200, content) if content is not None else (404, None)
+
+    response = api_get(link)
+    if (archive == 'record') & (response.status_code == 200):
+        archive_put(endpoint, key, response.content)
+    return response.status_code, response.content
+
+def fetch_json(endpoint, key, link, archive=archive_mode):
+    """fetch_raw, returning the parsed JSON.
+        Raises ArchiveMissError (a ValueError) if replay has no payload, or requests.HTTPError if the API still fails after retries"""
+    status_code, content = fetch_raw(endpoint, key, link, archive)
+    if content is None:
+        raise ArchiveMissError(f"No archived {endpoint} payload for {key}")
+    if status_code != 200:
+        raise requests.HTTPError(f"{endpoint} request for {key} failed with status {status_code}: {link}")
+    return json_loads(content)
+
+# Schedule Sync Functions #
+def parse_schedule_game(value):
+    """Flattens one game from a gameWeek day into a schedule row"""
+    return {
+        'game_id': value.get('id'),
+        'season': value.get('season'),
+        'game_type_code': value.get('gameType'),
+        'venue_name': value.get('venue').get('default'),
+        'neutral_site': value.get('neutralSite'),
+        'start_time_utc': value.get('startTimeUTC'),
+        'east_offset': value.get('easternUTCOffset'),
+        'local_offset': value.get('venueUTCOffset'),
+        'local_timezone': value.get('venueTimezone'),
+        'game_state': value.get('gameState'),
+        'game_schedule_state': value.get('gameScheduleState'),
+        'away_team_id': value.get('awayTeam').get('id'),
+        'away_abbreviation': value.get('awayTeam').get('abbrev'),
+        'away_team_place': value.get('awayTeam').get('placeName').get('default'),
+        'away_logo': value.get('awayTeam').get('logo'),
+        'away_logo_dark': value.get('awayTeam').get('darkLogo'),
+        'away_score': value.get('awayTeam').get('score'),
+        'home_team_id': value.get('homeTeam').get('id'),
+        'home_abbreviation': value.get('homeTeam').get('abbrev'),
+        'home_team_place': value.get('homeTeam').get('placeName').get('default'),
+        'home_logo': value.get('homeTeam').get('logo'),
+        'home_logo_dark': value.get('homeTeam').get('darkLogo'),
+        'home_score': value.get('homeTeam').get('score'),
+        'period': value.get('periodDescriptor').get('number'),
+        'period_type': value.get('periodDescriptor').get('periodType'),
+        'last_period_type': value.get('gameOutcome', {}).get('lastPeriodType'),
+        'gamecenter_link': value.get('gameCenterLink')
+    }
+
+def schedule_rows_to_frame(rows):
+    """Casts parsed schedule rows into the saved schedule columns"""
+    return (
+        pl.DataFrame(rows)
+        .with_columns([
+            pl.col('game_id').cast(pl.Int32),
+            pl.col('season').cast(pl.Int32),
+            pl.col('away_score').cast(pl.Int32),
+            pl.col('home_score').cast(pl.Int32),
+            pl.when(pl.col('game_type_code') == 2).then(pl.lit('R'))
+              .when(pl.col('game_type_code') == 3).then(pl.lit('P'))
+              .alias('season_type'),
+            pl.col("start_time_utc").str.to_datetime("%Y-%m-%dT%H:%M:%SZ").dt.replace_time_zone('UTC'),
+            pl.col('away_team_id').cast(pbp_id_dtype),
+            pl.col('home_team_id').cast(pbp_id_dtype)
+        ])
+        .with_columns([
+            pl.col("start_time_utc").dt.convert_time_zone('America/New_York').dt.strftime(time_fmt).alias('start_time_ET'),
+            pl.col("start_time_utc").dt.convert_time_zone('America/New_York').dt.strftime(day_fmt).alias('game_date'),
+            pl.concat_str(pl.lit(pbp_link_pre), pl.col('game_id'), pl.lit(pbp_link_suf)).alias('pbp_link'),
+            pl.concat_str(pl.lit(shift_link), pl.col('game_id')).alias('shift_link')
+        ])
+        .select([
+            'game_id', 'season', 'game_date', 'start_time_ET', 'season_type', 'game_schedule_state',
+            'away_team_id', 'away_score', 'away_abbreviation', 'home_score', 'home_team_id', 'home_abbreviation',
+            'pbp_link', 'shift_link', 'start_time_utc'
+        ])
+        .sort('game_id', 'season', 'start_time_ET')
+    )
+
+def read_schedule_sync_state(state_path=schedule_sync_state):
+    if not os.path.exists(state_path):
+        return {}
+    with open(state_path) as f:
+        return json.load(f)
+
+def save_schedule_sync_state(state, state_path=schedule_sync_state):
+    os.makedirs(os.path.dirname(state_path), exist_ok=True)
+    with open(state_path + '.tmp', 'w') as f:
+        json.dump(state, f, indent=1)
+    os.replace(state_path + '.tmp', state_path)
+
+def sync_schedule_window(season_lab, start_date, end_date, archive=archive_mode, state_path=schedule_sync_state, resume=True):
+    """Returns completed (OK/OFF, regular season + playoff) games between start_date and end_date (Y-m-d, inclusive), or None if there are none.
+        1) Starts the day after the last date synced for season_lab, if that is later than start_date (resume=False always starts at start_date)
+        2) Each /v1/schedule/{date} response holds a full gameWeek, so every day in it is parsed and the next request
+           starts where the week ends (a month of catch up is ~5 requests instead of ~30)
+        3) Games are deduplicated by game_id. synced_through only advances over consecutive days that were fetched and whose
+           games are all final, so days skipped in replay or holding games still in progress are fetched again next run"""
+    # 1) Skip Dates Already Synced
+    state = read_schedule_sync_state(state_path)
+    synced_through = state.get(season_lab, {}).get('synced_through')
+    if resume & (synced_through is not None):
+        start_date = max(start_date, (datetime.strptime(synced_through, day_fmt) + timedelta(days=1)).strftime(day_fmt))
+    if start_date > end_date:
+        print(f"Schedule Already Synced Through {synced_through}")
+        return None
+
+    # 2) Walk The Window One Week Per Request
+    games = {}
+    fetched_days = set()
+    pending_days = set()
+    n_requests = 0
+    req_date = start_date
+    while req_date <= end_date:
+        try:
+            response = fetch_json('schedule', req_date, schedule_link+req_date, archive)
+        except ArchiveMissError:
+            req_date = (datetime.strptime(req_date, day_fmt) + timedelta(days=1)).strftime(day_fmt)
+            continue
+        n_requests += 1
+
+        for day in response.get('gameWeek', []):
+            if not (start_date <= day.get('date') <= end_date):
+                continue
+            fetched_days.add(day.get('date'))
+            for value in day.get('games', []):
+                if (value.get('gameType') in [2,3]) & (value.get('gameScheduleState') == 'OK'):
+                    if value.get('gameState') == 'OFF':
+                        games[value.get('id')] = parse_schedule_game(value)
+                    else:
+                        pending_days.add(day.get('date'))
+
+        next_date = response.get('nextStartDate') or (datetime.strptime(req_date, day_fmt) + timedelta(days=schedule_stride)).strftime(day_fmt)
+        if next_date <= req_date:
+            next_date = (datetime.strptime(req_date, day_fmt) + timedelta(days=schedule_stride)).strftime(day_fmt)
+        req_date = next_date
+
+    # 3) Remember The Last Day Before The First Gap (Missing Payload Or Game Not Yet Final)
+    complete_through = None
+    day = start_date
+    while (day <= end_date) and (day in fetched_days) and (day not in pending_days):
+        complete_through = day
+        day = (datetime.strptime(day, day_fmt) + timedelta(days=1)).strftime(day_fmt)
+    if (complete_through is not None) and ((synced_through is None) or (complete_through > synced_through)):
+        state[season_lab] = {'synced_through': complete_through}
+        save_schedule_sync_state(state, state_path)
+    print(f"Synced Schedule {start_date} to {end_date} in {n_requests} Requests | {len(games)} Completed Games | Complete Through {complete_through or synced_through}")
+
+    if not games:
+        return None
+    return schedule_rows_to_frame(list(games.values()))
+
 # PBP Helper Functions #
-def ping_nhl_api(i):
-            """This function will get the raw data from the NHL API.
-                It will then save two files:
+raw_dtypes = {'i32': pl.Int32, 'u32': pbp_id_dtype, 'str': pl.Utf8, 'f32': pl.Float32}
+
+# Keys Expected In Each Play's 'details' (Anything Else Is Reported)
+pbp_detail_keys = {
+    'descKey','reason','secondaryReason','shotType', #Event Description
+    'xCoord','yCoord','zoneCode', # Location
+    'homeScore','awayScore','homeSOG','awaySOG', 'scoringPlayerTotal','assist1PlayerTotal','assist2PlayerTotal', # Game Details
+    'eventOwnerTeamId', # Team ID
+    'goalieInNetId','scoringPlayerId','assist1PlayerId','assist2PlayerId','shootingPlayerId','blockingPlayerId', # Player IDs (Shots)
+    'winningPlayerId','losingPlayerId','hittingPlayerId','hitteePlayerId','playerId', # Faceoff/Hit/GiveTakeAway Player IDs
+    'typeCode', 'committedByPlayerId', 'drawnByPlayerId','servedByPlayerId','duration' # Penalty IDs
+}
+
+def decode_pbp_payload(i, pbp_response, sch=raw_schema):
+    """Decodes a play by play payload straight into the typed raw_schema columns in one pass over the plays.
+        1) Game level values (id, season, teams...) are repeated for every play
+        2) Each play value is looked up in the play, then its periodDescriptor, then its details
+           (the event typeCode comes from the play; details.typeCode is the penalty code, which raw_schema never keeps)
+        3) 'i32'/'u32'/'f32' columns (player + team ids are 'u32') are typed on creation"""
+    plays = pbp_response.get('plays', [])
+    if not plays:
+        raise ValueError(f"No plays in play by play response for GameID: {i}")
+
+    # 1) Game Level Values
+    game_values = {
+        'id': pbp_response.get('id'),
+        'season': pbp_response.get('season'),
+        'gameDate': pbp_response.get('gameDate'),
+        'gameType': pbp_response.get('gameType'),
+        'awayTeam.id': pbp_response.get('awayTeam', {}).get('id'),
+        'awayTeam.abbrev': pbp_response.get('awayTeam', {}).get('abbrev'),
+        'homeTeam.id': pbp_response.get('homeTeam', {}).get('id'),
+        'homeTeam.abbrev': pbp_response.get('homeTeam', {}).get('abbrev')
+    }
+
+    # 2) Play Level Values (Single Pass)
+    play_cols = [col for col in sch.keys() if col not in game_values]
+    columns = {col: [] for col in play_cols}
+    for play in plays:
+        details = play.get('details') or {}
+        period_desc = play.get('periodDescriptor') or {}
+
+        extra_keys = details.keys() - pbp_detail_keys
+        if extra_keys:
+            print(f"GameID: {i} | Extra keys in details_dict: {extra_keys}")
+
+        for col in play_cols:
+            if col in play:
+                columns[col].append(play[col])
+            elif col in period_desc:
+                columns[col].append(period_desc[col])
+            elif col in pbp_detail_keys:
+                columns[col].append(details.get(col))
+            else:
+                columns[col].append(None)
+
+    # 3) Build Typed Columns In Schema Order
+    n_plays = len(plays)
+    data = {}
+    for col, col_type in sch.items():
+        values = [game_values[col]] * n_plays if col in game_values else columns[col]
+        if col_type == 'str':
+            values = [v if (v is None) or isinstance(v, str) else str(v) for v in values]
+        data[col] = pl.Series(col, values, dtype=raw_dtypes[col_type])
+
+    return pl.DataFrame(data)
+
+def ping_nhl_api(i, pbp_response=None, archive=archive_mode):
+            """This function will get the raw play by play data from the NHL API and decode it into raw_schema columns (see decode_pbp_payload)
 
-                1) Roster Data From Each Game
-                    a) This will be used to create features like handiness and position
-                2) Play By Play Data From Each Game
-                    a) Within PBP data, we will need to normalize the json object stored in 'details'
-            to ensure we collect every detail from each event"""
+                If pbp_response is passed (i.e. it was already downloaded by iter_game_payloads), the API is not called again.
+                Otherwise the payload is read/written through the archive based on archive (see fetch_raw)"""
 
             # 1) Create Link For API Endpoint
             pbp_link = pbp_link_pre+str(i)+pbp_link_suf
 
             # 2) Get Game Data From Response
-            pbp_response = requests.get(pbp_link).json()
-            game_data = pl.DataFrame({
-                    'id': pbp_response.get('id'),
-                    'season': pbp_response.get('season'),
-                    'gameDate': pbp_response.get('gameDate'),
-                    'gameType': pbp_response.get('gameType'),
-                    'awayTeam.id': pbp_response.get('awayTeam', {}).get('id'),
-                    'awayTeam.abbrev': pbp_response.get('awayTeam', {}).get('abbrev'),
-                    'homeTeam.id': pbp_response.get('homeTeam', {}).get('id'),
-                    'homeTeam.abbrev': pbp_response.get('homeTeam', {}).get('abbrev'),
-                    'key': 1
-                })
-
-            # 3) Get Plays Data (Stored As List)
-            raw_list = pbp_response.get('plays', [])
-
-            # 4) Normalize Details Dictionary
-            ### a) Create Keys To Compare Set
-            keys_to_compare = {
-                'descKey','reason','secondaryReason','shotType', #Event Description
-                'xCoord','yCoord','zoneCode', # Location
-                'homeScore','awayScore','homeSOG','awaySOG', 'scoringPlayerTotal','assist1PlayerTotal','assist2PlayerTotal', # Game Details
-                'eventOwnerTeamId', # Team ID
-                'goalieInNetId','scoringPlayerId','assist1PlayerId','assist2PlayerId','shootingPlayerId','blockingPlayerId', # Player IDs (Shots)
-                'winningPlayerId','losingPlayerId','hittingPlayerId','hitteePlayerId','playerId', # Faceoff/Hit/GiveTakeAway Player IDs
-                'typeCode', 'committedByPlayerId', 'drawnByPlayerId','servedByPlayerId','duration' # Penalty IDs
-            }
-            ### b) Loop Through Rows To Get Complete Details Dictionary 
-            for entry in raw_list:
-                details_dict = entry.get("details", {})
-
-                ##### i) Check For Extra Keys
-                extra_keys = set(details_dict.keys()) - keys_to_compare
-                if extra_keys:
-                    print(f"GameID: {i} | Extra keys in details_dict: {extra_keys}")
-
-                ##### ii) Update Details To Include All Keys
-                entry["details"] = {key: details_dict.get(key, None) for key in keys_to_compare}
-
-            # 5) Build New DataFrame With Full Details
-            plays_raw =  (
-                pl.DataFrame(raw_list)
-                .rename({"typeCode":"eventTypeCode"})
-                .unnest('periodDescriptor')
-                .unnest('details')
-                .rename({"typeCode":"penaltyTypeCode","eventTypeCode":"typeCode"})
-                .with_columns(pl.lit(1).cast(pl.Int64).alias('key'))
-            )
+            if pbp_response is None:
+                pbp_response = fetch_json('pbp', i, pbp_link, archive)
+
+            # 3) Decode Straight To Typed Columns
+            return decode_pbp_payload(i, pbp_response)
+# Constants - PBP Rename / Value Maps (Used By raw_projection + align_and_cast_columns) #
+rename_dict = {
+    "id": "game_id",
+    "gameDate": "game_date",
+    "awayTeam.id": "away_id",
+    "awayTeam.abbrev": "away_abbreviation",
+    "homeTeam.id": "home_id",
+    "homeTeam.abbrev": "home_abbreviation",
+    "gameType": "season_type",
+    "eventId": "event_id",
+    "typeDescKey": "event_type",
+    "sortOrder": "event_idx",
+    "periodType": "period_type",
+    "eventOwnerTeamId": "event_team_id",
+    "xCoord": "x",
+    "yCoord": "y",
+    "zoneCode": "event_zone",
+    "shotType": "secondary_type",
+    "awayScore": "away_score",
+    "homeScore": "home_score",
+    "goalieInNetId": "event_goalie_id",
+    "blockingPlayerId": "blocking_player_id",
+    "drawnByPlayerId": "drawnby_player_id",
+    "servedByPlayerId": "servedby_player_id",
+    "committedByPlayerId": "committedby_player_id",
+    "hittingPlayerId": "hitting_player_id",
+    "hitteePlayerId": "hittee_player_id",
+    "assist1PlayerId": "assist_1_player_id",
+    "assist2PlayerId": "assist_2_player_id",
+    "shootingPlayerId": "shooting_player_id",
+    "reason": "reason",
+    "scoringPlayerId": "scoring_player_id",
+    "duration": "penalty_minutes",
+    "winningPlayerId": "winning_player_id",
+    "losingPlayerId": "losing_player_id"
+}
 
-            return_df = game_data.join(plays_raw, on=pl.col("key"), how="inner").drop("key")
+# Event Type
+event_type_dict = {
+    "faceoff": "FACEOFF",
+    "shot-on-goal": "SHOT",
+    "stoppage": "STOPPAGE",
+    "hit": "HIT",
+    "blocked-shot": "BLOCKED_SHOT",
+    "missed-shot": "MISSED_SHOT",
+    "giveaway": "GIVEAWAY",
+    "takeaway": "TAKEAWAY",
+    "penalty": "PENALTY",
+    "goal": "GOAL",
+    "period-start": "PERIOD_START",
+    "period-end": "PERIOD_END",
+    "delayed-penalty": "DELAYED_PENALTY",
+    "game-end": "GAME_END",
+    "shootout-complete": "SHOOTOUT_COMPLETE",
+    "failed-shot-attempt": "FAILED_SHOT",
+    None:None
+}
 
-            return return_df
-def align_and_cast_columns(data, sch):
-            # Identify missing and extra columns
-            extra_cols_int = set(data.columns) - set(sch.keys())
-            data = data.drop(extra_cols_int)
-
-            # Fill missing columns with null values and cast to the correct type
-            for col in sch.keys():
-            
-                col_type = sch.get(col)
-
-                if (col in data.columns) & (col_type == 'str'):
-                    data = data.with_columns(pl.col(col).cast(pl.Utf8).alias(col))
-                elif (col in data.columns) & (col_type == 'i32'):
-                    data = data.with_columns(pl.col(col).cast(pl.Int32).alias(col))
-                elif (col in data.columns) & (col_type == 'f32'):
-                    data = data.with_columns(pl.col(col).cast(pl.Float32).alias(col))
-                elif (col not in data.columns) & (col_type == 'str'):
-                    data = data.with_columns(pl.lit(None).cast(pl.Utf8).alias(col))
-                elif (col not in data.columns) & (col_type == 'f32'):
-                    data = data.with_columns(pl.lit(None).cast(pl.Float32).alias(col))
-
-            # Select columns and update schema
-            data = data.select(sch.keys())
-
-                # Create Dictionaries For Column Name/Value Rename
-            rename_dict = {
-                "id": "game_id",
-                "gameDate": "game_date",
-                "awayTeam.id": "away_id",
-                "awayTeam.abbrev": "away_abbreviation",
-                "homeTeam.id": "home_id",
-                "homeTeam.abbrev": "home_abbreviation",
-                "gameType": "season_type",
-                "eventId": "event_id",
-                "typeDescKey": "event_type",
-                "sortOrder": "event_idx",
-                "periodType": "period_type",
-                "eventOwnerTeamId": "event_team_id",
-                "xCoord": "x",
-                "yCoord": "y",
-                "zoneCode": "event_zone",
-                "shotType": "secondary_type",
-                "awayScore": "away_score",
-                "homeScore": "home_score",
-                "goalieInNetId": "event_goalie_id",
-                "blockingPlayerId": "blocking_player_id",
-                "drawnByPlayerId": "drawnby_player_id",
-                "servedByPlayerId": "servedby_player_id",
-                "committedByPlayerId": "committedby_player_id",
-                "hittingPlayerId": "hitting_player_id",
-                "hitteePlayerId": "hittee_player_id",
-                "assist1PlayerId": "assist_1_player_id",
-                "assist2PlayerId": "assist_2_player_id",
-                "shootingPlayerId": "shooting_player_id",
-                "reason": "reason",
-                "scoringPlayerId": "scoring_player_id",
-                "duration": "penalty_minutes",
-                "winningPlayerId": "winning_player_id",
-                "losingPlayerId": "losing_player_id"
-            }
-
-            # Event Type
-            event_type_dict = {
-                "faceoff": "FACEOFF",
-                "shot-on-goal": "SHOT",
-                "stoppage": "STOPPAGE",
-                "hit": "HIT",
-                "blocked-shot": "BLOCKED_SHOT",
-                "missed-shot": "MISSED_SHOT",
-                "giveaway": "GIVEAWAY",
-                "takeaway": "TAKEAWAY",
-                "penalty": "PENALTY",
-                "goal": "GOAL",
-                "period-start": "PERIOD_START",
-                "period-end": "PERIOD_END",
-                "delayed-penalty": "DELAYED_PENALTY",
-                "game-end": "GAME_END",
-                "shootout-complete": "SHOOTOUT_COMPLETE",
-                "failed-shot-attempt": "FAILED_SHOT",
-                None:None
-            }
-
-            # Season Type
-            season_type_dict = {
-                2: "R",
-                3: "P",
-                None:None
-            }
-
-            # Shot Type
-            shot_type_dict = {
-                "snap": "Snap",
-                "between-legs": "Between Legs",
-                "wrap-around": "Wrap-Around",
-                "tip-in": "Tip-In",
-                "cradle": "Wrap-Around",
-                "poke": 'Poked',
-                "bat": 'Batted',
-                "deflected": "Deflected",
-                "wrist": "Wrist",
-                "slap":	"Slap",
-                "backhand": "Backhand",
-                None: None
-            }
-
-            # Rename Columns + Values AND Add Event/Season Type Helpers
-            data = data.rename(rename_dict).filter((pl.col('period_type') != 'SO') & (pl.col('season_type').is_in([2, 3])))
+# Season Type
+season_type_dict = {
+    2: "R",
+    3: "P",
+    None:None
+}
 
-            data = (
-                data
-                .with_columns([
-                    (pl.col('season_type').replace(season_type_dict, default = pl.col('season_type'))).alias('season_type'),
-                    (pl.col('event_type').replace(event_type_dict,default = pl.col('event_type'))).alias('event_type'),
-                    (pl.col('secondary_type').replace(shot_type_dict,default = pl.col('secondary_type'))).alias('secondary_type'),
-                    pl.when(pl.col('event_team_id') == pl.col('home_id')).then(pl.lit('home')).otherwise(pl.lit('away')).alias('event_team_type'),
-                    pl.when(pl.col('event_team_id') == pl.col('home_id')).then(pl.col('home_abbreviation')).otherwise(pl.col('away_abbreviation')).alias('event_team_abbr')
-                    ])
-                #.drop('gameType', 'typeDescKey', 'shotType')
-                .filter(~pl.col('situationCode').is_in(["PERIOD_START", "PERIOD_END", "GAME_START", "GAME_END"]))
-            )
+# Shot Type
+shot_type_dict = {
+    "snap": "Snap",
+    "between-legs": "Between Legs",
+    "wrap-around": "Wrap-Around",
+    "tip-in": "Tip-In",
+    "cradle": "Wrap-Around",
+    "poke": 'Poked',
+    "bat": 'Batted',
+    "deflected": "Deflected",
+    "wrist": "Wrist",
+    "slap":	"Slap",
+    "backhand": "Backhand",
+    None: None
+}
 
-            # Create Game and Period Seconds Remaining from timeInPeriod, timeRemaining: 'period', 'period_seconds', 'period_seconds_remaining', 'game_seconds', 'game_seconds_remaining'
+# Raw Player Id Columns Folded Into event_player_1-4
+remove_ply_ids = ['winning_player_id', 'hitting_player_id', 'scoring_player_id', 'shooting_player_id', 'committedby_player_id',
+                  'playerId', 'losing_player_id', 'hittee_player_id', 'drawnby_player_id', 'assist_1_player_id', 'assist_2_player_id',
+                  'blocking_player_id']
+
+# On Ice Player Id Columns Added By append_shift_data (UInt32, Names Come From The Rosters)
+on_ice_id_cols = (['home_goalie'] + [f"home_{n}_on_id" for n in range(1, 7)] +
+                  [f"away_{n}_on_id" for n in range(1, 7)] + ['away_goalie'])
+
+def raw_projection(sch, columns, rename=rename_dict):
+    """Compiles a raw schema + rename map into one select expression list: every schema column is cast (or filled with a typed null
+       when the payload lacks it), renamed, and event_type/secondary_type values are mapped in the same pass"""
+    value_maps = {'event_type': event_type_dict, 'secondary_type': shot_type_dict}
+    exprs = []
+    for col, col_type in sch.items():
+        name = rename.get(col, col)
+        expr = pl.col(col).cast(raw_dtypes[col_type]) if col in columns else pl.lit(None, dtype=raw_dtypes[col_type])
+        if name in value_maps:
+            expr = expr.replace(value_maps[name], default=expr)
+        exprs.append(expr.alias(name))
+    return exprs
+
+def align_and_cast_columns(data, sch):
+            """Casts a decoded play by play frame to sch, renames it and derives the event, clock, strength and coordinate columns.
+               Everything runs as one projection plus a handful of fused with_columns passes (see benchmark_transform.py)"""
+            # 1) Project Raw Schema (Cast + Rename + Value Maps) And Drop Shootout/Non Game Rows
             data = (
                 data
-                .with_columns(pl.when(pl.col('timeInPeriod').is_null()).then(pl.lit(None)).otherwise(pl.col('timeInPeriod').map_elements(min_to_sec)).alias('period_seconds'))
-                .with_columns([
-                    (1200 - pl.col('period_seconds')).alias('period_seconds_remaining'),
-                    (pl.col('period_seconds') + ((pl.col('period')-1)*1200)).alias('game_seconds'),
-                    ((3600 - pl.col('period_seconds')) + ((pl.col('period') - 3) * 1200)).alias('game_seconds_remaining')
-                ])
+                .select(raw_projection(sch, data.columns))
+                .filter((pl.col('period_type') != 'SO') &
+                        (pl.col('season_type').is_in([2, 3])) &
+                        (~pl.col('situationCode').is_in(["PERIOD_START", "PERIOD_END", "GAME_START", "GAME_END"])))
             )
 
-            # Create event_player_1_id and event_player_2_id columns based on event_type and corresponding columns
-            remove_ply_ids = ['winning_player_id', 'hitting_player_id', 'scoring_player_id', 'shooting_player_id', 'committedby_player_id',
-                              'playerId', 'losing_player_id', 'hittee_player_id', 'drawnby_player_id', 'assist_1_player_id', 'assist_2_player_id',
-                              'blocking_player_id']
+            # 2) Season Type + Event Team Helpers, Game/Period Seconds (Remaining) from timeInPeriod AND event_player_1-4 id/type
+            #    based on event_type and corresponding columns
+            period_seconds = clock_seconds('timeInPeriod')
             data = (
                 data
                 .with_columns([
+                    (pl.col('season_type').replace(season_type_dict, default = pl.col('season_type'))).alias('season_type'),
+                    pl.when(pl.col('event_team_id') == pl.col('home_id')).then(pl.lit('home')).otherwise(pl.lit('away')).alias('event_team_type'),
+                    pl.when(pl.col('event_team_id') == pl.col('home_id')).then(pl.col('home_abbreviation')).otherwise(pl.col('away_abbreviation')).alias('event_team_abbr'),
+                    period_seconds.alias('period_seconds'),
+                    (1200 - period_seconds).alias('period_seconds_remaining'),
+                    (period_seconds + ((pl.col('period')-1)*1200)).alias('game_seconds'),
+                    ((3600 - period_seconds) + ((pl.col('period') - 3) * 1200)).alias('game_seconds_remaining'),
                     (pl.when(pl.col('event_type') == 'FACEOFF').then(pl.col('winning_player_id'))
                        .when(pl.col('event_type') == 'HIT').then(pl.col('hitting_player_id'))
                        .when(pl.col('event_type') == 'GOAL').then(pl.col('scoring_player_id'))
@@ -370,7 +571,9 @@ def align_and_cast_columns(data, sch):
                 ])
                 .drop(remove_ply_ids)
             )
-            # Parse Situation Code For Home/Away Skaters/EmptyNet
+
+            # 3) Fill Situation Code Forward, Then Parse It For Home/Away Skaters/EmptyNet AND Create x_abs/y_abs In One Pass.
+            #    x_abs/y_abs are relative to the event team's attacking zone (i.e., x_abs is positive)
             data = (
                 data
                 .sort('season', 'game_id', 'period', 'event_idx')
@@ -378,117 +581,56 @@ def align_and_cast_columns(data, sch):
                     pl.when(pl.col('situationCode').is_null()).then(pl.col("situationCode").fill_null(strategy="forward")).otherwise(pl.col('situationCode')).alias('situationCode')
                 )
                 .filter(~pl.col('situationCode').is_in(['0101', '1010']))
-                .with_columns([
-                    pl.when(pl.col("situationCode").str.slice(0, 1).cast(pl.Int32) == 0).then(pl.lit(1)).otherwise(pl.lit(0)).alias("away_en"),
-                    pl.when(pl.col("situationCode").str.slice(3, 1).cast(pl.Int32) == 0).then(pl.lit(1)).otherwise(pl.lit(0)).alias("home_en"),
-                    pl.col("situationCode").str.slice(1, 1).cast(pl.Int32).alias("away_skaters"),
-                    pl.col("situationCode").str.slice(2, 1).cast(pl.Int32).alias("home_skaters")
-                ])
-                .with_columns([
-                    (pl.concat_str([pl.col('home_skaters'), pl.lit('v'), pl.col('away_skaters')])).alias('strength_state'),
-                    pl.when(pl.col('away_en') == 1).then(pl.lit('E')).otherwise(pl.col('away_skaters')).alias('true_away_skaters'),
-                    pl.when(pl.col('home_en') == 1).then(pl.lit('E')).otherwise(pl.col('home_skaters')).alias('true_home_skaters')
-                ])
-                .with_columns((pl.concat_str([pl.col('true_home_skaters'), pl.lit('v'), pl.col('true_away_skaters')])).alias('true_strength_state'))
-                .drop(['true_away_skaters', 'true_home_skaters'])
             )
 
-            # Create x_fixed and y_fixed. These coordinates will be relative to the event team's attacking zone (i.e., x_abs is positive)
-            data = (
-                data
-                .with_columns([
-                    pl.when((pl.col('event_zone') == 'O') & (pl.col('x').mean() > 0)).then(pl.lit(1)).otherwise(pl.lit(-1)).alias('flipped_coords')
-                ])
-                .with_columns([
-                    # Where homeTeamDefendingSide Exists
-                    (pl.when((~pl.col('homeTeamDefendingSide').is_null()) &
-                             ( pl.col('homeTeamDefendingSide') == 'left') &
-                             ( pl.col('event_team_type') == 'home'))
-                             .then(pl.col('x'))
-                       .when((~pl.col('homeTeamDefendingSide').is_null()) &
-                             ( pl.col('homeTeamDefendingSide') == 'right') &
-                             ( pl.col('event_team_type') == 'home'))
-                             .then(pl.col('x')*-1)
-                       .when((~pl.col('homeTeamDefendingSide').is_null()) &
-                             ( pl.col('homeTeamDefendingSide') == 'left') &
-                             ( pl.col('event_team_type') == 'away'))
-                             .then(pl.col('x')*-1)
-                       .when((~pl.col('homeTeamDefendingSide').is_null()) &
-                             ( pl.col('homeTeamDefendingSide') == 'right') &
-                             ( pl.col('event_team_type') == 'away'))
-                             .then(pl.col('x'))
-                      # Where homeTeamDefendingSide does not exist
-                      .when((pl.col('homeTeamDefendingSide').is_null()) &
-                            (pl.col('event_zone') == 'O'))
-                            .then(pl.col('x').abs())
-                      .when((pl.col('homeTeamDefendingSide').is_null()) &
-                            (pl.col('event_zone') == 'D'))
-                            .then((pl.col('x').abs())*-1)
-                      .when((pl.col('homeTeamDefendingSide').is_null()) &
-                            (pl.col('event_zone') == 'N'))
-                            .then((pl.col('x')) * (pl.col('flipped_coords').max().over(['season', 'game_id', 'period'])))
-                      .otherwise(pl.lit(None)).alias('x_abs')
-                    ),
-                    # Where homeTeamDefendingSide does exist
-                    (pl.when((~pl.col('homeTeamDefendingSide').is_null()) &
-                             ( pl.col('homeTeamDefendingSide') == 'left') &
-                             ( pl.col('event_team_type') == 'home'))
-                             .then(pl.col('y'))
-                       .when((~pl.col('homeTeamDefendingSide').is_null()) &
-                             ( pl.col('homeTeamDefendingSide') == 'right') &
-                             ( pl.col('event_team_type') == 'home'))
-                             .then(pl.col('y')*-1)
-                       .when((~pl.col('homeTeamDefendingSide').is_null()) &
-                             ( pl.col('homeTeamDefendingSide') == 'left') &
-                             ( pl.col('event_team_type') == 'away'))
-                             .then(pl.col('y')*-1)
-                       .when((~pl.col('homeTeamDefendingSide').is_null()) &
-                             ( pl.col('homeTeamDefendingSide') == 'right') &
-                             ( pl.col('event_team_type') == 'away'))
-                             .then(pl.col('y'))
-                      # Where homeTeamDefendingSide does not exist
-                      .when((pl.col('homeTeamDefendingSide').is_null()) &
-                            (pl.col('event_zone') == 'O'))
-                            .then(pl.col('y').abs())
-                      .when((pl.col('homeTeamDefendingSide').is_null()) &
-                            (pl.col('event_zone') == 'D'))
-                            .then((pl.col('y').abs())*-1)
-                      .when((pl.col('homeTeamDefendingSide').is_null()) &
-                            (pl.col('event_zone') == 'N'))
-                            .then((pl.col('y')) * (pl.col('flipped_coords').max().over(['season', 'game_id', 'period'])))
-                      .otherwise(pl.lit(None)).alias('y_abs')
-                    )
-                ])
-                .drop("flipped_coords")
-            )
-
-            # Create Event Distance Calculation
-            data = data.with_columns(
-                pl.when(pl.col('x_abs') >= 0).then(pl.Series.sqrt((89 - pl.Series.abs(data['x_abs']))**2 + data['y_abs']**2))
-                  .when(pl.col('x_abs') <  0).then(pl.Series.sqrt((pl.Series.abs(data['x_abs']) + 89)**2 + data['y_abs']**2))
-                  .alias('event_distance')
+            away_en = pl.col("situationCode").str.slice(0, 1).cast(pl.Int32) == 0
+            home_en = pl.col("situationCode").str.slice(3, 1).cast(pl.Int32) == 0
+            away_skaters = pl.col("situationCode").str.slice(1, 1).cast(pl.Int32)
+            home_skaters = pl.col("situationCode").str.slice(2, 1).cast(pl.Int32)
+            # Period Wide Flip For Neutral Zone Events (was max() of a per-row +1/-1 helper column)
+            flipped_coords = (
+                pl.when((pl.col('x').mean() > 0) & (pl.col('event_zone') == 'O').any().over(['season', 'game_id', 'period']))
+                  .then(pl.lit(1)).otherwise(pl.lit(-1)).cast(pl.Int32)
             )
+            home_left = (~pl.col('homeTeamDefendingSide').is_null()) & (pl.col('homeTeamDefendingSide') == 'left')
+            home_right = (~pl.col('homeTeamDefendingSide').is_null()) & (pl.col('homeTeamDefendingSide') == 'right')
 
-            # Create Event Angle Calculation
-            data = (
-                data
-                .with_columns(
-                pl.when(data['x_abs'] >= 0)
-                  .then(pl.Series.arctan(data['y_abs'] / (89 - pl.Series.abs(data['x_abs'])))
-                        .map_elements(lambda x: abs(x * (180 / pi))))
-                  .when(data['x_abs'] < 0)
-                  .then(pl.Series.arctan(data['y_abs'] / (pl.Series.abs(data['x_abs']) + 89))
-                        .map_elements(lambda x: abs(x * (180 / pi))))
-                  .alias('event_angle')
-                )
-                .with_columns(
-                    pl.when(pl.col('x_abs') > 89).then((180 - pl.col('event_angle'))).otherwise(pl.col('event_angle')).alias('event_angle')
+            def abs_coord(c):
+                return (
+                    # Where homeTeamDefendingSide Exists
+                    pl.when(home_left & (pl.col('event_team_type') == 'home')).then(pl.col(c))
+                      .when(home_right & (pl.col('event_team_type') == 'home')).then(pl.col(c)*-1)
+                      .when(home_left & (pl.col('event_team_type') == 'away')).then(pl.col(c)*-1)
+                      .when(home_right & (pl.col('event_team_type') == 'away')).then(pl.col(c))
+                      # Where homeTeamDefendingSide does not exist
+                      .when((pl.col('homeTeamDefendingSide').is_null()) & (pl.col('event_zone') == 'O')).then(pl.col(c).abs())
+                      .when((pl.col('homeTeamDefendingSide').is_null()) & (pl.col('event_zone') == 'D')).then((pl.col(c).abs())*-1)
+                      .when((pl.col('homeTeamDefendingSide').is_null()) & (pl.col('event_zone') == 'N')).then((pl.col(c)) * flipped_coords)
+                      .otherwise(pl.lit(None)).alias(f'{c}_abs')
                 )
-            )
 
-            return data      
-def append_shift_data(data, roster_data):
-            """ This function will load shift data allowing the user to see which players are on the ice at a given time in each game"""
+            data = data.with_columns([
+                pl.when(away_en).then(pl.lit(1)).otherwise(pl.lit(0)).alias("away_en"),
+                pl.when(home_en).then(pl.lit(1)).otherwise(pl.lit(0)).alias("home_en"),
+                away_skaters.alias("away_skaters"),
+                home_skaters.alias("home_skaters"),
+                (pl.concat_str([home_skaters, pl.lit('v'), away_skaters])).alias('strength_state'),
+                (pl.concat_str([pl.when(home_en).then(pl.lit('E')).otherwise(home_skaters), pl.lit('v'),
+                                pl.when(away_en).then(pl.lit('E')).otherwise(away_skaters)])).alias('true_strength_state'),
+                abs_coord('x'),
+                abs_coord('y')
+            ])
+
+            # 4) Create Event Distance + Angle Calculation
+            data = data.with_columns([
+                net_distance('x_abs', 'y_abs').alias('event_distance'),
+                net_angle('x_abs', 'y_abs').alias('event_angle')
+            ])
+
+            return data
+def append_shift_data(data, roster_data, shift_response=None, archive=archive_mode):
+            """ This function will load shift data allowing the user to see which players are on the ice at a given time in each game
+                If shift_response is passed (i.e. it was already downloaded by iter_game_payloads), the API is not called again"""
             # Load Game ID and Home/Away Ids
             i = data['game_id'][0]
             bad_shift_ids = []
@@ -500,8 +642,8 @@ def append_shift_data(data, roster_data):
                 .unique()
             )
 
-            shift_link = "https://api.nhle.com/stats/rest/en/shiftcharts?cayenneExp=gameId="+str(i)
-            shift_response = requests.get(shift_link).json()
+            if shift_response is None:
+                shift_response = fetch_json('shifts', i, shift_link+str(i), archive)
 
             # Assuming "data" is the key containing nested data
             data_list = shift_response.get('data', [])
@@ -520,7 +662,6 @@ def append_shift_data(data, roster_data):
                     .filter((pl.col('startTime_min') != 0) & (pl.col('endTime_min') != 0))
                     .drop('startTime_min', 'endTime_min')
                     .with_columns([
-                        (pl.col('firstName') + ' ' + pl.col('lastName')).alias('player_name'),
                         ((pl.col('startTime').str.slice(0, 2).cast(pl.Int32) * 60) + (pl.col('startTime').str.slice(3, 5).cast(pl.Int32))).alias('period_start_seconds'),
                         ((pl.col('endTime').str.slice(0, 2).cast(pl.Int32) * 60) + (pl.col('endTime').str.slice(3, 5).cast(pl.Int32))).alias('period_end_seconds')
                     ])
@@ -536,9 +677,8 @@ def append_shift_data(data, roster_data):
                             'teamAbbrev': 'team_abbr'
                         })
                     .select([pl.col('game_id').cast(pl.Int32),
-                             pl.col('team_id').cast(pl.Utf8),
-                             pl.col('player_id').cast(pl.Utf8),
-                             pl.col('player_name').str.to_uppercase().cast(pl.Utf8),
+                             pl.col('team_id').cast(pbp_id_dtype),
+                             pl.col('player_id').cast(pbp_id_dtype),
                              pl.col('team_abbr').cast(pl.Utf8),
                              pl.col('period').cast(pl.Int32),
                              pl.col('period_start_seconds').cast(pl.Int64),
@@ -571,95 +711,59 @@ def append_shift_data(data, roster_data):
                     ])
                     #.unique()
                     # Separate Goalies
-                    .join(roster_data.with_columns([
-                        (pl.col('player_id').cast(pl.Utf8).alias('player_id')),
+                    .join(cast_roster_ids(roster_data).with_columns([
                         (pl.col('pos_G').cast(pl.Int32).alias('pos_G'))
                     ])
                     .select('player_id', 'pos_G'), on='player_id', how='left')
                     .unique()
                 )
-                # Concat Player IDs into lists for each group (i.e. event and seconds)
-                result_df = (
-                    shift_raw
-                    .sort('game_start_seconds')
-                    .group_by(['game_id', 'period', 'period_start_seconds', 'period_end_seconds', 'team_type', 'pos_G'])
-                    .agg(
-                        pl.concat_list('player_id').flatten().unique().alias('player_id_list'),
-                        pl.concat_list('player_name').flatten().unique().alias('player_name_list')
-                        )
-                )
                 # Separate and Create Player On Columns
                 game_data = (
                      game_info_slim
                     .filter(pl.col('game_id') == i)
                     .sort('game_seconds', 'event_idx')
                 )
-                def apply_player_lists_pl(x, ty, pos, shift, output):
-                    return get_player_lists_pl((x['game_id'], x['period'], x['period_seconds'], ty, pos, shift, output))
-                def get_player_lists_pl(x):
-                    # Outline Variables
-                    g_id, per, p_secs, ty, pos, shift, output = x
-                    # Adjust conditions as needed
-                    conditions = (
-                        (result_df['game_id'] == g_id) &
-                        (result_df['period'] == per) &
-                        (result_df['team_type'] == ty) &
-                        (result_df['pos_G'] == pos)
+
+                # Interval Join: Every Shift Spanning Each Event Second (Same Period)
+                ### a) Players Without A Roster Position (pos_G Null) Are Left Out, Like Before
+                event_secs = game_data.select('period', 'period_seconds').unique()
+                shift_on_ice = (
+                    event_secs.lazy()
+                    .join(
+                        shift_raw.lazy()
+                        .filter(pl.col('pos_G').is_not_null())
+                        .select('period', 'period_start_seconds', 'period_end_seconds', 'team_type', 'pos_G', 'player_id'),
+                        on='period', how='inner'
                     )
-                    if shift == 'current':
-                        conditions &= (
-                            (result_df['period_start_seconds'] < p_secs) &
-                            (result_df['period_end_seconds'] > p_secs)
-                        )
-                    elif shift == 'on':
-                        conditions &= (result_df['period_start_seconds'] == p_secs)
-                    elif shift == 'off':
-                        conditions &= (result_df['period_end_seconds'] == p_secs)
-                    filtered_rows = result_df.filter(conditions)
-                    if output == 'id':
-                        result_list = set(filtered_rows['player_id_list'].explode().to_list())
-                    elif output == 'name':
-                        result_list = set(filtered_rows['player_name_list'].explode().to_list())
-                    return ','.join(str(item) for item in result_list)
-
-                # List of columns to generate
-                columns_to_generate = [
-                    ('home', 0, 'current', 'id'),
-                    ('home', 0, 'current', 'name'),
-                    ('home', 0, 'on', 'id'),
-                    ('home', 0, 'on', 'name'),
-                    ('home', 0, 'off', 'id'),
-                    ('home', 0, 'off', 'name'),
-                    ('away', 0, 'current', 'id'),
-                    ('away', 0, 'current', 'name'),
-                    ('away', 0, 'on', 'id'),
-                    ('away', 0, 'on', 'name'),
-                    ('away', 0, 'off', 'id'),
-                    ('away', 0, 'off', 'name'),
-                    ('home', 1, 'current', 'id'),
-                    ('home', 1, 'current', 'name'),
-                    ('home', 1, 'on', 'id'),
-                    ('home', 1, 'on', 'name'),
-                    ('home', 1, 'off', 'id'),
-                    ('home', 1, 'off', 'name'),
-                    ('away', 1, 'current', 'id'),
-                    ('away', 1, 'current', 'name'),
-                    ('away', 1, 'on', 'id'),
-                    ('away', 1, 'on', 'name'),
-                    ('away', 1, 'off', 'id'),
-                    ('away', 1, 'off', 'name')
-                ]
-
-                # Generate columns dynamically
-                for prefix, pos, shift, output in columns_to_generate:
-                    if pos == 1:
-                        pos_lab = 'goalie'
-                    elif pos == 0:
-                        pos_lab = 'skater'
-                    col_name = f"{prefix}_{pos_lab}_{shift}_{output}"
-                    game_data = game_data.with_columns([
-                        pl.struct(["game_id", "period", "period_seconds"]).map_elements(lambda x: apply_player_lists_pl(x, prefix, pos, shift, output)).alias(col_name)
+                    .filter((pl.col('period_start_seconds') <= pl.col('period_seconds')) & (pl.col('period_end_seconds') >= pl.col('period_seconds')))
+                    ### b) Label Shift As Current (Spans Second), On (Starts At Second) or Off (Ends At Second)
+                    .with_columns(
+                        pl.when(pl.col('period_start_seconds') == pl.col('period_seconds')).then(pl.lit('on'))
+                          .when(pl.col('period_end_seconds') == pl.col('period_seconds')).then(pl.lit('off'))
+                          .otherwise(pl.lit('current'))
+                          .alias('shift')
+                    )
+                    ### c) One Row Per Player, Then Comma Join IDs (Sorted)
+                    .unique(['period', 'period_seconds', 'team_type', 'pos_G', 'shift', 'player_id'], keep='first')
+                    .group_by(['period', 'period_seconds', 'team_type', 'pos_G', 'shift'])
+                    .agg([
+                        pl.col('player_id').sort().cast(pl.Utf8).str.join(',').alias('id')
+                    ])
+                    ### d) Spread To One Column Per Team/Position/Shift/Output (i.e. home_skater_current_id)
+                    .group_by(['period', 'period_seconds'])
+                    .agg([
+                        pl.col(output).filter((pl.col('team_type') == prefix) & (pl.col('pos_G') == pos) & (pl.col('shift') == shift)).first()
+                          .alias(f"{prefix}_{'goalie' if pos == 1 else 'skater'}_{shift}_{output}")
+                        for prefix in ['home', 'away'] for pos in [0, 1] for shift in ['current', 'on', 'off'] for output in ['id']
                     ])
+                    .collect()
+                )
+                on_ice_cols = [c for c in shift_on_ice.columns if c not in ['period', 'period_seconds']]
+                game_data = (
+                    game_data
+                    .join(shift_on_ice, on=['period', 'period_seconds'], how='left')
+                    .with_columns([pl.col(c).fill_null('') for c in on_ice_cols])
+                )
                 game_start_end = ['GAME_START', 'PERIOD_START', 'GAME_END', 'PERIOD_END']
                 game_data =(
                      game_data
@@ -679,7 +783,7 @@ def append_shift_data(data, roster_data):
 
                 teams = ['home', 'away']
                 positions = ['skater', 'goalie']
-                outputvals = ['id', 'name']
+                outputvals = ['id']
                 for team in teams:
                     for position in positions:
                         for outputval in outputvals:
@@ -718,22 +822,20 @@ def append_shift_data(data, roster_data):
                                     "field_7" : f"{team}_8_{label2}"
                                 })
                             )
+                # Player Names Live In The Roster (Dimension) Tables, Only UInt32 IDs Are Kept ('' = Nobody On -> Null)
                 keep_cols = ['game_id', 'period', 'game_seconds', 'period_seconds', 'event_idx',
-                             'home_1__goalie_id', 'home_1__goalie_name',
+                             'home_1__goalie_id',
                              'home_1_on_id', 'home_2_on_id', 'home_3_on_id', 'home_4_on_id', 'home_5_on_id', 'home_6_on_id',
-                             'home_1_on_name', 'home_2_on_name', 'home_3_on_name', 'home_4_on_name', 'home_5_on_name', 'home_6_on_name',
                              'away_1_on_id', 'away_2_on_id', 'away_3_on_id', 'away_4_on_id', 'away_5_on_id', 'away_6_on_id',
-                             'away_1_on_name', 'away_2_on_name', 'away_3_on_name', 'away_4_on_name', 'away_5_on_name', 'away_6_on_name',
-                             'away_1__goalie_id', 'away_1__goalie_name']
+                             'away_1__goalie_id']
                 game_data = (
                     game_data
                     .select(keep_cols)
                     .rename({
                         'away_1__goalie_id': 'away_goalie',
-                        'away_1__goalie_name': 'away_goalie_name',
-                        'home_1__goalie_id': 'home_goalie',
-                        'home_1__goalie_name': 'home_goalie_name'
+                        'home_1__goalie_id': 'home_goalie'
                     })
+                    .with_columns([pl.col(c).cast(pbp_id_dtype, strict=False) for c in on_ice_id_cols])
                     .sort('game_id', 'period', 'period_seconds', 'event_idx')
                 )
 
@@ -748,42 +850,489 @@ def append_shift_data(data, roster_data):
                     data
                     .select('game_id', 'period', 'game_seconds', 'period_seconds', 'event_idx')
                 )
-                columns_with_null = [
-                'home_goalie', 'home_goalie_name',
-                'home_1_on_id', 'home_2_on_id', 'home_3_on_id', 'home_4_on_id', 'home_5_on_id', 'home_6_on_id',
-                'home_1_on_name', 'home_2_on_name', 'home_3_on_name', 'home_4_on_name', 'home_5_on_name', 'home_6_on_name',
-                'away_1_on_id', 'away_2_on_id', 'away_3_on_id', 'away_4_on_id', 'away_5_on_id', 'away_6_on_id',
-                'away_1_on_name', 'away_2_on_name', 'away_3_on_name', 'away_4_on_name', 'away_5_on_name', 'away_6_on_name',
-                'away_goalie', 'away_goalie_name'
-                    ]
-
                 # Add null columns to the existing DataFrame
-                for column in columns_with_null:
-                    result_df = result_df.with_columns(pl.lit(None).alias(column))
+                for column in on_ice_id_cols:
+                    result_df = result_df.with_columns(pl.lit(None, dtype=pbp_id_dtype).alias(column))
 
 
             return result_df
 
+# Game Fetch + Transform Functions #
+async def fetch_game_pair(i, executor, archive=archive_mode):
+    """Downloads the play-by-play and shiftchart payloads for one game at the same time.
+        The blocking requests run in the executor so the event loop can keep other games in flight"""
+    loop = asyncio.get_running_loop()
+    pbp_response, shift_response = await asyncio.gather(
+        loop.run_in_executor(executor, fetch_json, 'pbp', i, pbp_link_pre+str(i)+pbp_link_suf, archive),
+        loop.run_in_executor(executor, fetch_json, 'shifts', i, shift_link+str(i), archive)
+    )
+    return pbp_response, shift_response
+
+def put_until_stopped(payload_queue, item, stop):
+    """Blocking put that gives up once stop is set (the consumer is gone). Returns True if the item was queued"""
+    while not stop.is_set():
+        try:
+            payload_queue.put(item, timeout=fetch_put_timeout)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+async def produce_games_async(game_ids, payload_queue, concurrency, archive=archive_mode, stop=None):
+    """Downloads games with at most concurrency in flight and puts (game_id, pbp_response, shift_response) on payload_queue as each one finishes.
+        A game keeps its slot until payload_queue accepts it, so a full queue pauses new downloads instead of growing memory.
+        Once stop is set (see iter_game_payloads) games waiting for a slot are skipped and finished ones are dropped"""
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(concurrency)
+    stop = stop if stop is not None else threading.Event()
+
+    with ThreadPoolExecutor(max_workers=concurrency*2) as executor:
+        async def fetch_and_put(i):
+            async with slots:
+                if stop.is_set():
+                    return
+                try:
+                    pbp_response, shift_response = await fetch_game_pair(i, executor, archive)
+                    item = (i, pbp_response, shift_response)
+                except Exception as e:
+                    item = (i, e, None)
+                await loop.run_in_executor(None, put_until_stopped, payload_queue, item, stop)
+
+        await asyncio.gather(*[fetch_and_put(i) for i in game_ids])
+
+def iter_game_payloads(game_ids, concurrency=None, archive=archive_mode, prefetch=fetch_prefetch):
+    """Yields (game_id, pbp_response, shift_response) for each game while the next games download in a background thread.
+        1) concurrency=None: One game downloads at a time, overlapping with the transform of the previous game
+        2) concurrency=N: N games download at a time
+        3) prefetch=0: Nothing is prefetched, payloads are None and the transforms call the API themselves
+        A failed download yields its Exception in place of pbp_response. Games are yielded in the order they finish downloading.
+        If the consumer stops early (break, exception, generator closed) the downloads stop too, so the process can exit"""
+    if not prefetch:
+        for i in game_ids:
+            yield i, None, None
+        return
+
+    payload_queue = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+    done = object()
+
+    def producer():
+        try:
+            asyncio.run(produce_games_async(game_ids, payload_queue, concurrency or 1, archive, stop))
+        finally:
+            put_until_stopped(payload_queue, done, stop)
+
+    threading.Thread(target=producer, name='nhl-game-fetch', daemon=True).start()
+
+    try:
+        while True:
+            item = payload_queue.get()
+            if item is done:
+                return
+            yield item
+    finally:
+        stop.set()
+
+def transform_game(i, pbp_response, shift_response, roster_obj, archive=archive_mode):
+    """Runs the play-by-play and shift transforms for a single game. Columns leave in their compact dtypes (see pbptypes.py)"""
+    return cast_pbp_types(append_shift_data(align_and_cast_columns(data = ping_nhl_api(i = i, pbp_response = pbp_response, archive = archive), sch = raw_schema), roster_data = roster_obj, shift_response = shift_response, archive = archive))
+
+# Game Shard Functions #
+def season_shard_dir(season):
+    return f"{shard_root}/{season}{season+1}"
+
+def game_shard_path(shard_dir, i):
+    return f"{shard_dir}/{i}.parquet"
+
+def save_game_shard(shard_dir, i, df):
+    """Writes one transformed game to its shard. Written to a temp file first so a killed load never leaves half a shard"""
+    os.makedirs(shard_dir, exist_ok=True)
+    path = game_shard_path(shard_dir, i)
+    df.write_parquet(path + '.tmp')
+    os.replace(path + '.tmp', path)
+
+def mark_shard_complete(shard_dir, i):
+    """Appends a finished game id to the shard manifest. Only games in the manifest are skipped on resume or compacted"""
+    with open(f"{shard_dir}/manifest.txt", 'a') as f:
+        f.write(f"{i}\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+def read_shard_manifest(shard_dir):
+    """Returns the game ids already saved as shards (in the order they finished)"""
+    path = f"{shard_dir}/manifest.txt"
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return list(dict.fromkeys(int(line) for line in f if line.strip()))
+
+def reset_game_shards(shard_dir):
+    """Removes shards + manifest from an earlier load so a fresh (non resume) load starts clean"""
+    if not os.path.isdir(shard_dir):
+        return
+    for file in os.listdir(shard_dir):
+        if file.endswith(('.parquet', '.tmp')) | (file == 'manifest.txt'):
+            os.remove(f"{shard_dir}/{file}")
+
+def compact_game_shards(shard_dir, game_ids, save_path, base_path=None, schema_path=None):
+    """Combines the shards for game_ids (plus an existing season file at base_path) into save_path without holding every game in memory.
+        Like the old vstack, a shard whose columns/types don't match the rest (or the file at schema_path) is reported and left out.
+        Season files written before the compact dtypes (pbptypes.py) compare (and are rewritten) in that layout.
+        Returns the game ids written (nothing is written if there are none)"""
+    # 1) Check Each Shard Schema Against The First One
+    frames = []
+    compacted_ids = []
+    ref_schema = None
+    if base_path is not None:
+        frames.append(cast_pbp_types(pl.scan_parquet(base_path)))
+        ref_schema = pbp_schema(pl.read_parquet_schema(base_path).items())
+    elif schema_path is not None:
+        ref_schema = pbp_schema(pl.read_parquet_schema(schema_path).items())
+    for i in game_ids:
+        path = game_shard_path(shard_dir, i)
+        shard_schema = pbp_schema(pl.read_parquet_schema(path).items())
+        if ref_schema is None:
+            ref_schema = shard_schema
+        elif shard_schema != ref_schema:
+            print(f"Incomplete Data For Game ID: {i}")
+            print(f"Error: shard columns do not match season columns")
+            continue
+        frames.append(cast_pbp_types(pl.scan_parquet(path)))
+        compacted_ids.append(i)
+
+    if not compacted_ids:
+        return compacted_ids
+
+    # 2) Stream Shards Into The Season File (Temp File First, base_path May Be save_path)
+    os.makedirs(os.path.dirname(save_path), exist_ok=True)
+    (
+        pl.concat(frames, how='vertical')
+        .sort('game_id', 'period', 'event_idx')
+        .sink_parquet(save_path + '.tmp')
+    )
+    os.replace(save_path + '.tmp', save_path)
+
+    return compacted_ids
+
+# Process Pool Transform Functions #
+transform_worker_state = {}
+
+def frame_to_ipc(df):
+    """Serializes a DataFrame to Arrow IPC bytes (cheap to send between processes)"""
+    buffer = io.BytesIO()
+    df.write_ipc(buffer)
+    return buffer.getvalue()
+
+def ipc_to_frame(ipc_bytes):
+    return pl.read_ipc(io.BytesIO(ipc_bytes))
+
+def init_transform_worker(roster_path, archive):
+    """Runs once in each worker process. The roster is memory mapped from one shared IPC file (see ipccache.py), so every
+        worker reads the same pages instead of decoding its own copy"""
+    transform_worker_state['roster'] = read_shared(roster_path)
+    transform_worker_state['archive'] = archive
+
+def transform_game_worker(i, pbp_response, shift_response, shard_dir=None):
+    """transform_game inside a worker process. Returns the game frame as Arrow IPC bytes and the seconds it took.
+        With shard_dir the worker writes the shard itself and returns None instead of the frame"""
+    shift_start = time.time()
+    df = transform_game(i, pbp_response, shift_response, transform_worker_state['roster'], transform_worker_state['archive'])
+    if shard_dir is not None:
+        save_game_shard(shard_dir, i, df)
+        return None, time.time() - shift_start
+    return frame_to_ipc(df), time.time() - shift_start
+
+def print_load_update(i, shift_elap, shift_len, n_games):
+    """Prints intermitent load metrics every 500 games"""
+    shift_len.append(shift_elap)
+    average_shift_time = statistics.mean(shift_len)
+
+    if (str(i)[-3:] == "500"):
+        print(f"LOAD UPDATE: Game {i} took {round(shift_elap,2)} | Each game is taking ~{round(average_shift_time,2)} Seconds | For {n_games-500} More Games It will Take {round(((average_shift_time*(n_games-500))/60),1)} Minutes")
+    if (str(i)[-3:] == "000"):
+        print(f"LOAD UPDATE: Game {i} took {round(shift_elap,2)} | Each game is taking ~{round(average_shift_time,2)} Seconds | For {n_games-1000} More Games It will Take {round(((average_shift_time*(n_games-1000))/60),1)} Minutes")
+
+def load_games(game_ids, roster_obj, concurrency=None, archive=archive_mode, prefetch=fetch_prefetch, workers=None, shard_dir=None):
+    """Loads and transforms every game in game_ids, downloading upcoming games while the current one is transformed.
+        Set workers (e.g. transform_workers) to run the transforms in that many processes instead of this one.
+        Set shard_dir to save each game as a shard the moment it finishes instead of keeping it in memory.
+        Returns the list of game DataFrames (empty with shard_dir) and the list of bad game ids"""
+    if workers is not None:
+        return load_games_parallel(game_ids, roster_obj, concurrency, archive, prefetch, workers, shard_dir)
+
+    bad_ids = []
+    shift_len = []
+    df_list = []
+    n_games = len(game_ids)
+
+    for i, pbp_response, shift_response in iter_game_payloads(game_ids, concurrency, archive, prefetch):
+        shift_start = time.time()
+        try:
+            # Re-raise download errors here so they are handled like a sequential load
+            if isinstance(pbp_response, Exception):
+                raise pbp_response
+            df = transform_game(i, pbp_response, shift_response, roster_obj, archive)
+        except (ValueError, requests.RequestException) as e:
+            bad_ids.append(i)
+            print(f"Error In Loading NHL API for GameID: {i} | {e}")
+            continue
+
+        if shard_dir is not None:
+            save_game_shard(shard_dir, i, df)
+            mark_shard_complete(shard_dir, i)
+        else:
+            df_list.append(df)
+
+        # Print Intermitent Update
+        print_load_update(i, time.time() - shift_start, shift_len, n_games)
+
+    return df_list, bad_ids
+
+def load_games_parallel(game_ids, roster_obj, concurrency, archive, prefetch, workers, shard_dir=None):
+    """load_games with the transforms fanned out over a process pool.
+        1) The roster is written once as a shared IPC file and memory mapped by each worker through the pool initializer
+        2) At most workers*2 games are queued in the pool so downloaded payloads don't pile up in memory
+        3) Workers send each game frame back as Arrow IPC bytes, or write it to shard_dir themselves"""
+    bad_ids = []
+    shift_len = []
+    df_list = []
+    n_games = len(game_ids)
+    pending = {}
+
+    def collect(return_when):
+        done, _ = wait(pending, return_when=return_when)
+        for future in done:
+            i = pending.pop(future)
+            try:
+                game_ipc, shift_elap = future.result()
+            except (ValueError, requests.RequestException) as e:
+                bad_ids.append(i)
+                print(f"Error In Loading NHL API for GameID: {i} | {e}")
+                continue
+            if shard_dir is not None:
+                mark_shard_complete(shard_dir, i)
+            else:
+                df_list.append(ipc_to_frame(game_ipc))
+            print_load_update(i, shift_elap, shift_len, n_games)
+
+    # Spawn (not fork) so workers never inherit Polars' thread pool mid-operation
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=init_transform_worker,
+        initargs=(share_frame(roster_obj, 'roster'), archive)
+    ) as pool:
+        for i, pbp_response, shift_response in iter_game_payloads(game_ids, concurrency, archive, prefetch):
+            # Download errors are handled like a sequential load
+            if isinstance(pbp_response, (ValueError, requests.RequestException)):
+                bad_ids.append(i)
+                print(f"Error In Loading NHL API for GameID: {i} | {pbp_response}")
+                continue
+            if isinstance(pbp_response, Exception):
+                raise pbp_response
+
+            pending[pool.submit(transform_game_worker, i, pbp_response, shift_response, shard_dir)] = i
+            if len(pending) >= workers*2:
+                collect(FIRST_COMPLETED)
+
+        while pending:
+            collect(ALL_COMPLETED)
+
+    return df_list, bad_ids
+
+# Roster Load Functions #
+def read_missing_rosters(missing_path=roster_missing_path):
+    """Returns the set of (team, season) pairs known to have no roster. The cache is seeded from roster_missing_seed on first use"""
+    if not os.path.exists(missing_path):
+        return set(roster_missing_seed)
+    return set(pl.read_parquet(missing_path).select('team', 'season').iter_rows())
+
+def add_missing_rosters(pairs, missing_path=roster_missing_path):
+    """Adds (team, season) pairs that returned 404 to the missing roster cache so they are never requested again"""
+    missing = read_missing_rosters(missing_path) | set(pairs)
+    os.makedirs(os.path.dirname(missing_path), exist_ok=True)
+    pl.DataFrame(sorted(missing), schema=['team', 'season'], orient='row').write_parquet(missing_path)
+
+def parse_roster_payload(data, szn_lab, team_lab):
+    """Flattens one team roster response into the full roster columns"""
+    flat_data = {
+        'season': [],
+        'team': [],
+        'position': [],
+        'player_id': [],
+        'headshot': [],
+        'firstName': [],
+        'lastName': [],
+        'positionCode': [],
+        'shootsCatches': [],
+        'sweaterNumber': [],
+        'heightInInches': [],
+        'weightInPounds': [],
+        'heightInCentimeters': [],
+        'weightInKilograms': [],
+        'birthDate': [],
+        'birthCity': [],
+        'birthCountry': [],
+        'birthStateProvince': []
+    }
+
+    for position, players in data.items():
+        for player in players:
+            flat_data['season'].append(szn_lab)
+            flat_data['team'].append(team_lab)
+            flat_data['position'].append(position)
+            flat_data['player_id'].append(player['id'])
+            flat_data['headshot'].append(player['headshot'])
+            flat_data['firstName'].append(player['firstName']['default'])
+            flat_data['lastName'].append(player['lastName']['default'])
+            flat_data['positionCode'].append(player['positionCode'])
+            flat_data['shootsCatches'].append(player['shootsCatches'])
+            flat_data['sweaterNumber'].append(player.get('sweaterNumber', 100))
+            flat_data['heightInInches'].append(player['heightInInches'])
+            flat_data['weightInPounds'].append(player['weightInPounds'])
+            flat_data['heightInCentimeters'].append(player['heightInCentimeters'])
+            flat_data['weightInKilograms'].append(player['weightInKilograms'])
+            flat_data['birthDate'].append(player['birthDate'])
+            flat_data['birthCity'].append(player['birthCity']['default'])
+            flat_data['birthCountry'].append(player['birthCountry'])
+            flat_data['birthStateProvince'].append(player.get('birthStateProvince', {}).get('default', ''))
+    df = pl.DataFrame(flat_data)
+    df = (
+        df
+        .with_columns([
+            pl.col('player_id').cast(pbp_id_dtype),
+            pl.col('season').cast(pl.Int64),
+            pl.when(pl.col('position') == 'forwards').then(pl.lit(1)).otherwise(pl.lit(0)).alias('pos_F'),
+            pl.when(pl.col('position') == 'defensmen').then(pl.lit(1)).otherwise(pl.lit(0)).alias('pos_D'),
+            pl.when(pl.col('position') == 'goalies').then(pl.lit(1)).otherwise(pl.lit(0)).alias('pos_G'),
+            pl.when(pl.col('shootsCatches') == 'R').then(pl.lit(1)).otherwise(pl.lit(0)).alias('hand_R'),
+            pl.when(pl.col('shootsCatches') == 'L').then(pl.lit(1)).otherwise(pl.lit(0)).alias('hand_L')
+        ])
+        .drop('position')
+    )
+    return df
+
+def fetch_roster(team_lab, szn_lab, archive=archive_mode):
+    """Returns (status_code, raw bytes) for one team/season roster. A request that raises (i.e. ConnectionError after retries)
+       returns (None, None) so one team can't abort the batch"""
+    link = f"https://api-web.nhle.com/v1/roster/{team_lab}/{szn_lab}"
+    try:
+        return fetch_raw('roster', f"{team_lab}_{szn_lab}", link, archive)
+    except requests.RequestException as e:
+        print(f"Roster Request Failed: {link} | {e}")
+        return None, None
+
+def load_rosters(seasons, archive=archive_mode, concurrency=fetch_concurrency):
+    """Loads every team roster for each start year in seasons in one concurrent batch. Returns {start year: slim roster}
+        1) Team/seasons in the missing roster cache are skipped, new 404s are added to it
+        2) Full + slim rosters are saved per season like load_roster always has. Seasons with no rosters loaded are reported
+           and left out of the result (nothing is saved for them)"""
+    start_time = time.time()
+
+    # 1) Build Team/Season Requests (Minus Known Missing)
+    missing = read_missing_rosters()
+    tms_list = list(team_abbr_dict.values())
+    roster_requests = [(team_lab, f"{season}{season+1}") for season in seasons for team_lab in tms_list]
+    roster_requests = [r for r in roster_requests if r not in missing]
+
+    # 2) Fetch Concurrently (Order Kept So Rosters Compile Like Before)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        responses = list(executor.map(lambda r: fetch_roster(r[0], r[1], archive), roster_requests))
+
+    # 3) Parse Each Team Roster
+    full_df_lists = {season: [] for season in seasons}
+    slim_df_lists = {season: [] for season in seasons}
+    new_missing = []
+    for (team_lab, szn_lab), (status_code, content) in zip(roster_requests, responses):
+        season = int(szn_lab[:4])
+        if status_code == 200:
+            df = parse_roster_payload(json_loads(content), szn_lab[-4:], team_lab)
+
+            # Append Full DF To List For Compilation
+            full_df_lists[season].append(df)
+
+            # Create Slim
+            slim_df = (
+                df
+                .select([
+                    pl.col('player_id').cast(pbp_id_dtype),
+                    pl.col('firstName'),
+                    pl.col('lastName'),
+                    pl.col('pos_F').cast(pl.Int32),
+                    pl.col('pos_D').cast(pl.Int32),
+                    pl.col('pos_G').cast(pl.Int32),
+                    pl.col('hand_R').cast(pl.Int32),
+                    pl.col('hand_L').cast(pl.Int32)])
+                .unique()
+            )
+
+            # Append Slim DF To List For Compilation
+            slim_df_lists[season].append(slim_df)
+
+        elif (status_code == 404) & (archive != 'replay'):
+            new_missing.append((team_lab, szn_lab))
+        else:
+            # If the request was not successful, print the status code
+            print(f"Error Bad Link: https://api-web.nhle.com/v1/roster/{team_lab}/{szn_lab} | Status {status_code}")
+
+    if new_missing:
+        print(f"Adding {len(new_missing)} Team/Seasons To Missing Roster Cache: {new_missing}")
+        add_missing_rosters(new_missing)
+
+    # 4) Compile + Save Each Season
+    slim_rosters = {}
+    for season in seasons:
+        szn_lab = f"{season}{season+1}"
+        if not slim_df_lists[season]:
+            print(f"No Rosters Loaded For {season}-{season+1} | Nothing Saved For This Season")
+            continue
+        full_df = pl.concat(full_df_lists[season], how='vertical')
+        slim_df = pl.concat(slim_df_lists[season], how='vertical')
+
+        # Save Full
+        full_df.write_csv(f'Rosters/csv/full/NHL_Roster_Full_{szn_lab}.csv')
+        full_df.write_parquet(f'Rosters/parquet/full/NHL_Roster_Full_{szn_lab}.parquet')
+
+        # Save Slim
+        slim_df.write_csv(f'Rosters/csv/slim/NHL_Roster_Slim_{szn_lab}.csv')
+        slim_df.write_parquet(f'Rosters/parquet/slim/NHL_Roster_Slim_{szn_lab}.parquet')
+
+        slim_rosters[season] = slim_df
+
+    # Metrics
+    end_time = time.time()
+    elap_time = round((end_time - start_time), 2)
+    print(f"{len(seasons)} Seasons of NHL Roster Data Loaded in {elap_time} Seconds ({len(roster_requests)} Requests) | Path: Rosters/parquet/slim/")
+
+    return slim_rosters
+
 
 # Create Load Class
 class LoadData:
-    """ Used to Load Games and Play By Play For Each Game"""
-    def __init__(self, year):
+    """ Used to Load Games and Play By Play For Each Game
+        archive: 'live', 'record' (default) or 'replay'. Replay rebuilds every output from Archive/ with no network
+        partitioned: also write the season to the PBP/hive partitioned layout"""
+    def __init__(self, year, archive = archive_mode, partitioned = pbp_partitioned):
         self.year = year+1
         self.start_year = year
+        self.archive = archive
+        self.partitioned = partitioned
 
     def load_schedule(self):
         """ Loads a single season schedule. Will loop for each season in load document"""
         start_time = time.time()
-        # Load From Parquet
+        # Load From Parquet (Through Archive)
+        status_code, content = fetch_raw('schedule', f"fastR_{self.year}", f"{fastR_base}{self.year}.parquet", self.archive)
+        if content is None:
+            raise ArchiveMissError(f"No archived schedule payload for fastR_{self.year}")
         df = (
-        pl.read_parquet(f"{fastR_base}{self.year}.parquet")
+        pl.read_parquet(io.BytesIO(content))
         .drop(['season', 'game_date'])
         .with_columns([
             pl.col('game_id').cast(pl.Int32),
             pl.col('season_full').cast(pl.Int32).alias('season'),
-            pl.col('away_team_id').cast(pl.Utf8),
-            pl.col('home_team_id').cast(pl.Utf8),
+            pl.col('away_team_id').cast(pbp_id_dtype),
+            pl.col('home_team_id').cast(pbp_id_dtype),
             pl.col("game_date_time").dt.convert_time_zone('America/New_York').dt.strftime(time_fmt).alias('start_time_ET'),
             pl.col("game_date_time").dt.convert_time_zone('America/New_York').dt.strftime(day_fmt).alias('game_date'),
             pl.when(pl.col('status_detailed_state') == 'Final').then(pl.lit('OK')).otherwise(pl.col('status_detailed_state')).alias('game_schedule_state')
@@ -805,81 +1354,12 @@ class LoadData:
         # Add Games If Year Is Current #
         if self.year == 2024:
 
-            # Initalize Load Dates + Empty List
+            # Sync Games Since The Last Date In The fastR Schedule (Week Strides, Full Window Since The Schedule Is Rebuilt)
             start_date = df['game_date'].max()
             end_date = (datetime.today() - timedelta(days=1)).strftime('%Y-%m-%d')
-            game_dfs = []
-
-            # Loop Over Dates For Game Information
-            for i in pd.date_range(start=start_date, end=end_date, freq='D'):
-                i_str = i.strftime('%Y-%m-%d')
-                sched_link = "https://api-web.nhle.com/v1/schedule/"+i_str
-                response = requests.get(sched_link).json().get('gameWeek')[0].get('games')
-                
-                for i, value in enumerate(response):
-                    if (value.get('gameType') in [2,3]) & (value.get('gameScheduleState') == 'OK') & (value.get('gameState') == 'OFF'):
-                        data = pl.DataFrame({
-                            'game_id': value.get('id'),
-                            'season': value.get('season'),
-                            'game_type_code': value.get('gameType'),
-                            'venue_name': value.get('venue').get('default'),
-                            'neutral_site': value.get('neutralSite'),
-                            'start_time_utc': value.get('startTimeUTC'),
-                            'east_offset': value.get('easternUTCOffset'),
-                            'local_offset': value.get('venueUTCOffset'),
-                            'local_timezone': value.get('venueTimezone'),
-                            'game_state': value.get('gameState'),
-                            'game_schedule_state': value.get('gameScheduleState'),
-                            'away_team_id': value.get('awayTeam').get('id'),
-                            'away_abbreviation': value.get('awayTeam').get('abbrev'),
-                            'away_team_place': value.get('awayTeam').get('placeName').get('default'),
-                            'away_logo': value.get('awayTeam').get('logo'),
-                            'away_logo_dark': value.get('awayTeam').get('darkLogo'),
-                            'away_score': value.get('awayTeam').get('score'),
-                            'home_team_id': value.get('homeTeam').get('id'),
-                            'home_abbreviation': value.get('homeTeam').get('abbrev'),
-                            'home_team_place': value.get('homeTeam').get('placeName').get('default'),
-                            'home_logo': value.get('homeTeam').get('logo'),
-                            'home_logo_dark': value.get('homeTeam').get('darkLogo'),
-                            'home_score': value.get('homeTeam').get('score'),
-                            'period': value.get('periodDescriptor').get('number'),
-                            'period_type': value.get('periodDescriptor').get('periodType'),
-                            'last_period_type': value.get('gameOutcome').get('lastPeriodType'),
-                            'gamecenter_link': value.get('gameCenterLink')
-                        })
-                    if not data.is_empty():
-                        result_df = (
-                            data
-                            .with_columns([
-                                pl.col('game_id').cast(pl.Int32),
-                                pl.col('season').cast(pl.Int32),
-                                pl.col('away_score').cast(pl.Int32),
-                                pl.col('home_score').cast(pl.Int32),
-                                pl.when(pl.col('game_type_code') == 2).then(pl.lit('R'))
-                                  .when(pl.col('game_type_code') == 3).then(pl.lit('P'))
-                                  .alias('season_type'),
-                                pl.col("start_time_utc").str.to_datetime("%Y-%m-%dT%H:%M:%SZ").dt.replace_time_zone('UTC'),
-                                pl.col('away_team_id').cast(pl.Utf8),
-                                pl.col('home_team_id').cast(pl.Utf8)
-                            ])
-                            .with_columns([
-                                pl.col("start_time_utc").dt.convert_time_zone('America/New_York').dt.strftime(time_fmt).alias('start_time_ET'),
-                                pl.col("start_time_utc").dt.convert_time_zone('America/New_York').dt.strftime(day_fmt).alias('game_date'),
-                                pl.concat_str(pl.lit(pbp_link_pre), pl.col('game_id'), pl.lit(pbp_link_suf)).alias('pbp_link'),
-                                pl.concat_str(pl.lit(shift_link), pl.col('game_id')).alias('shift_link')
-                            ])
-                            .select([
-                                'game_id', 'season', 'game_date', 'start_time_ET', 'season_type', 'game_schedule_state',
-                                'away_team_id', 'away_score', 'away_abbreviation', 'home_score', 'home_team_id', 'home_abbreviation',
-                                'pbp_link', 'shift_link', 'start_time_utc'
-                            ])
-                            .sort('game_id', 'season', 'start_time_ET')
-                        )
-
-                        game_dfs.append(result_df)
-
-                for j in game_dfs:
-                    df = df.vstack(j)
+            new_games = sync_schedule_window(f"{self.start_year}{self.year}", start_date, end_date, archive=self.archive, resume=False)
+            if new_games is not None:
+                df = df.vstack(new_games.filter(~pl.col('game_id').is_in(df['game_id'])))
 
         # Sort and Remove Dupes
         df = df.sort('game_id').unique()
@@ -899,263 +1379,64 @@ class LoadData:
         print(f"{f'{self.start_year}-{self.year}'} NHL Schedule Data Loaded in {elap_time} Seconds | Path: {par_save_url}")
 
     def load_roster(self):
-        """This function will aim to load all rosters from past seasons"""
-        # Constants:
-        bad_link = [
-            'https://api-web.nhle.com/v1/roster/ATL/20112012',
-            'https://api-web.nhle.com/v1/roster/ATL/20122013',
-            'https://api-web.nhle.com/v1/roster/ATL/20132014',
-            'https://api-web.nhle.com/v1/roster/ATL/20142015',
-            'https://api-web.nhle.com/v1/roster/ATL/20152016',
-            'https://api-web.nhle.com/v1/roster/ATL/20162017',
-            'https://api-web.nhle.com/v1/roster/ATL/20172018',
-            'https://api-web.nhle.com/v1/roster/ATL/20182019',
-            'https://api-web.nhle.com/v1/roster/ATL/20192020',
-            'https://api-web.nhle.com/v1/roster/ATL/20202021',
-            'https://api-web.nhle.com/v1/roster/ATL/20212022',
-            'https://api-web.nhle.com/v1/roster/ATL/20222023',
-            'https://api-web.nhle.com/v1/roster/ATL/20232024',
-            'https://api-web.nhle.com/v1/roster/ANA/20132014',
-            'https://api-web.nhle.com/v1/roster/ANA/20142015',
-            'https://api-web.nhle.com/v1/roster/ANA/20152016',
-            'https://api-web.nhle.com/v1/roster/ANA/20162017',
-            'https://api-web.nhle.com/v1/roster/ANA/20172018',
-            'https://api-web.nhle.com/v1/roster/ANA/20182019',
-            'https://api-web.nhle.com/v1/roster/ANA/20192020',
-            'https://api-web.nhle.com/v1/roster/ANA/20202021',
-            'https://api-web.nhle.com/v1/roster/ANA/20212022',
-            'https://api-web.nhle.com/v1/roster/ANA/20222023',
-            'https://api-web.nhle.com/v1/roster/ANA/20232024',
-            'https://api-web.nhle.com/v1/roster/ARI/20092010',
-            'https://api-web.nhle.com/v1/roster/ARI/20102011',
-            'https://api-web.nhle.com/v1/roster/ARI/20112012',
-            'https://api-web.nhle.com/v1/roster/ARI/20122013',
-            'https://api-web.nhle.com/v1/roster/ARI/20132014',
-            'https://api-web.nhle.com/v1/roster/PHX/20142015',
-            'https://api-web.nhle.com/v1/roster/PHX/20152016',
-            'https://api-web.nhle.com/v1/roster/PHX/20162017',
-            'https://api-web.nhle.com/v1/roster/PHX/20172018',
-            'https://api-web.nhle.com/v1/roster/PHX/20182019',
-            'https://api-web.nhle.com/v1/roster/PHX/20192020',
-            'https://api-web.nhle.com/v1/roster/PHX/20202021',
-            'https://api-web.nhle.com/v1/roster/PHX/20212022',
-            'https://api-web.nhle.com/v1/roster/PHX/20222023',
-            'https://api-web.nhle.com/v1/roster/PHX/20232024',
-            'https://api-web.nhle.com/v1/roster/SEA/20092010',
-            'https://api-web.nhle.com/v1/roster/SEA/20102011',
-            'https://api-web.nhle.com/v1/roster/SEA/20112012',
-            'https://api-web.nhle.com/v1/roster/SEA/20122013',
-            'https://api-web.nhle.com/v1/roster/SEA/20132014',
-            'https://api-web.nhle.com/v1/roster/SEA/20142015',
-            'https://api-web.nhle.com/v1/roster/SEA/20152016',
-            'https://api-web.nhle.com/v1/roster/SEA/20162017',
-            'https://api-web.nhle.com/v1/roster/SEA/20172018',
-            'https://api-web.nhle.com/v1/roster/SEA/20182019',
-            'https://api-web.nhle.com/v1/roster/SEA/20192020',
-            'https://api-web.nhle.com/v1/roster/SEA/20202021',
-            'https://api-web.nhle.com/v1/roster/VGK/20092010',
-            'https://api-web.nhle.com/v1/roster/VGK/20102011',
-            'https://api-web.nhle.com/v1/roster/VGK/20112012',
-            'https://api-web.nhle.com/v1/roster/VGK/20122013',
-            'https://api-web.nhle.com/v1/roster/VGK/20132014',
-            'https://api-web.nhle.com/v1/roster/VGK/20142015',
-            'https://api-web.nhle.com/v1/roster/VGK/20152016',
-            'https://api-web.nhle.com/v1/roster/VGK/20162017',
-            'https://api-web.nhle.com/v1/roster/WPG/20092010',
-            'https://api-web.nhle.com/v1/roster/WPG/20102011'
-            ]
-
-        start_time = time.time()
-
-        # Team Abbr And Season
-        tms_list = list(team_abbr_dict.values())
-        szn_lab  = (str(self.start_year)+str(self.year))
-        link_list = [f"https://api-web.nhle.com/v1/roster/{team_abbr}/{szn_lab}" for team_abbr in tms_list]
-
-        # Initalize List
-        full_df_list = []
-        slim_df_list = []
-
-        ## Begin Roster Loading
-        for link in link_list:
-            response = requests.get(link)
-            szn_lab = link[-4:]
-            team_lab = link[35:38]
-            if response.status_code == 200:
-                data = response.json()
-                flat_data = {
-                    'season': [],
-                    'team': [],
-                    'position': [],
-                    'player_id': [],
-                    'headshot': [],
-                    'firstName': [],
-                    'lastName': [],
-                    'positionCode': [],
-                    'shootsCatches': [],
-                    'sweaterNumber': [],
-                    'heightInInches': [],
-                    'weightInPounds': [],
-                    'heightInCentimeters': [],
-                    'weightInKilograms': [],
-                    'birthDate': [],
-                    'birthCity': [],
-                    'birthCountry': [],
-                    'birthStateProvince': []
-                }
-
-                for position, players in data.items():
-                    for player in players:
-                        flat_data['season'].append(szn_lab)
-                        flat_data['team'].append(team_lab)
-                        flat_data['position'].append(position)
-                        flat_data['player_id'].append(player['id'])
-                        flat_data['headshot'].append(player['headshot'])
-                        flat_data['firstName'].append(player['firstName']['default'])
-                        flat_data['lastName'].append(player['lastName']['default'])
-                        flat_data['positionCode'].append(player['positionCode'])
-                        flat_data['shootsCatches'].append(player['shootsCatches'])
-                        flat_data['sweaterNumber'].append(player.get('sweaterNumber', 100))
-                        flat_data['heightInInches'].append(player['heightInInches'])
-                        flat_data['weightInPounds'].append(player['weightInPounds'])
-                        flat_data['heightInCentimeters'].append(player['heightInCentimeters'])
-                        flat_data['weightInKilograms'].append(player['weightInKilograms'])
-                        flat_data['birthDate'].append(player['birthDate'])
-                        flat_data['birthCity'].append(player['birthCity']['default'])
-                        flat_data['birthCountry'].append(player['birthCountry'])
-                        flat_data['birthStateProvince'].append(player.get('birthStateProvince', {}).get('default', ''))
-                df = pl.DataFrame(flat_data)
-                df = (
-                    df
-                    .with_columns([
-                        pl.col('player_id').cast(pl.Utf8),
-                        pl.col('season').cast(pl.Int64),
-                        pl.when(pl.col('position') == 'forwards').then(pl.lit(1)).otherwise(pl.lit(0)).alias('pos_F'),
-                        pl.when(pl.col('position') == 'defensmen').then(pl.lit(1)).otherwise(pl.lit(0)).alias('pos_D'),
-                        pl.when(pl.col('position') == 'goalies').then(pl.lit(1)).otherwise(pl.lit(0)).alias('pos_G'),
-                        pl.when(pl.col('shootsCatches') == 'R').then(pl.lit(1)).otherwise(pl.lit(0)).alias('hand_R'),
-                        pl.when(pl.col('shootsCatches') == 'L').then(pl.lit(1)).otherwise(pl.lit(0)).alias('hand_L')
-                    ])
-                    .drop('position')
-                )
-
-                # Append Full DF To List For Compilation
-                full_df_list.append(df)
-
-                # Create Slim
-                slim_df = (
-                    df
-                    .select([
-                        pl.col('player_id').cast(pl.Utf8),
-                        pl.col('firstName'),
-                        pl.col('lastName'),
-                        pl.col('pos_F').cast(pl.Int32),
-                        pl.col('pos_D').cast(pl.Int32),
-                        pl.col('pos_G').cast(pl.Int32),
-                        pl.col('hand_R').cast(pl.Int32),
-                        pl.col('hand_L').cast(pl.Int32)])
-                    .unique()
-                )
-
-                # Append Full DF To List For Compilation
-                slim_df_list.append(slim_df)
-
-            elif(link in bad_link):
-                pass
-            else:
-                # If the request was not successful, print the status code and any error message
-                print(f"Error Bad Link: {link}")
-        
-        # Compile DF Lists
-        full_df = full_df_list[0]
-        for df in full_df_list[1:]:
-            full_df = full_df.extend(df)
-
-        slim_df = slim_df_list[0]
-        for df in slim_df_list[1:]:
-            slim_df = slim_df.extend(df)
-        
-        
-        # Save Full
-        full_df.write_csv(f'Rosters/csv/full/NHL_Roster_Full_{f"{self.start_year}{self.year}"}.csv')
-        full_df.write_parquet(f'Rosters/parquet/full/NHL_Roster_Full_{f"{self.start_year}{self.year}"}.parquet')
-
-        # Save Slim
-        slim_df.write_csv(f'Rosters/csv/slim/NHL_Roster_Slim_{f"{self.start_year}{self.year}"}.csv')
-        slim_df.write_parquet(f'Rosters/parquet/slim/NHL_Roster_Slim_{f"{self.start_year}{self.year}"}.parquet')
-        
-        # Metrics
-        end_time = time.time()
-        elap_time = round((end_time - start_time), 2)
-        print(f"{f'{self.start_year}-{self.year}'} NHL Roster Data Loaded in {elap_time} Seconds | Path: Rosters/parquet/slim/NHL_Roster_Slim_{self.start_year}{self.year}.parquet")
-
-        return slim_df
-
-    def load_pbp(self, roster_obj):
+        """This function will aim to load all rosters from past seasons (see load_rosters to load several seasons in one batch)"""
+        slim_rosters = load_rosters([self.start_year], archive=self.archive)
+        if self.start_year not in slim_rosters:
+            raise ValueError(f"No rosters loaded for {self.start_year}-{self.year}")
+        return slim_rosters[self.start_year]
+
+
+    def load_pbp(self, roster_obj, concurrency=None, workers=None, resume=False):
+        """Loads every game in the season schedule. Upcoming games download while the current game is transformed.
+            Set concurrency (e.g. fetch_concurrency) to download several games at once
+            Set workers (e.g. transform_workers) to transform games in parallel processes
+            Each game is saved as a shard when it finishes. resume=True skips games already sharded by an earlier (killed) load"""
         season = self.start_year
+        shard_dir = season_shard_dir(season)
 
         # Initialize Variables
         start_time = time.time()
         print(f"Now Loading Play By Play Data From {season}-{season+1} NHL Season")
 
-        bad_ids = []
-        shift_len = []
-        df_list = []
-
         # 1) Get Game ID's From Schedule
-        game_ids = pl.read_parquet(f"Schedule/parquet/NHL_Schedule_{str(season)+str(season+1)}.parquet").filter((~pl.col('game_id').is_in([2015020497])))['game_id'].unique().to_list()
+        game_ids = read_cached(f"Schedule/parquet/NHL_Schedule_{str(season)+str(season+1)}.parquet").filter((~pl.col('game_id').is_in([2015020497])))['game_id'].unique().to_list()
         print(game_ids[:5])
-        n_games = len(game_ids)
 
-        # 2) Loop For Tweaking API Data
-        for i in game_ids:
-            shift_start = time.time()
-            try:
-                df_list.append(append_shift_data(align_and_cast_columns(data = ping_nhl_api(i = i), sch = raw_schema), roster_data = roster_obj))
-            except ValueError as e:
-                bad_ids.append(i)
-                print(f"Error In Loading NHL API for GameID: {i} | {e}")
-                continue
-                
-            # Print Intermitent Update
-            shift_end = time.time()
-            shift_elap = shift_end - shift_start
-            shift_len.append(shift_elap)
-            average_shift_time = statistics.mean(shift_len)
-
-            if (str(i)[-3:] == "500"):
-                print(f"LOAD UPDATE: Game {i} took {round(shift_elap,2)} | Each game is taking ~{round(average_shift_time,2)} Seconds | For {n_games-500} More Games It will Take {round(((average_shift_time*(n_games-500))/60),1)} Minutes")
-            if (str(i)[-3:] == "000"):
-                print(f"LOAD UPDATE: Game {i} took {round(shift_elap,2)} | Each game is taking ~{round(average_shift_time,2)} Seconds | For {n_games-1000} More Games It will Take {round(((average_shift_time*(n_games-1000))/60),1)} Minutes")
-
-        # 3) Combine DataFrames Into One
-        data = df_list[0]
-        for df in df_list[1:]:
-            try:
-                data = data.vstack(df)
-            except ValueError as e:
-                print(f"Incomplete Data For Game ID: {df['game_id'][0]}")
-                print(f"Error: {e}")
-                continue
-                
-        data = data.sort('game_id', 'period', 'event_idx')
-
-        # 4) Save File After VStack
-        save_season_path = f"PBP/parquet/API_RAW_PBP_Data_{season}{season+1}.parquet"
-        data.write_parquet(
-            save_season_path,
-            use_pyarrow=True
-        )
+        # 2) Skip Games Finished By An Earlier Load (Or Start Clean)
+        if resume:
+            done_ids = set(read_shard_manifest(shard_dir))
+            print(f"Resuming: {len(done_ids)} Games Already Loaded")
+        else:
+            reset_game_shards(shard_dir)
+            done_ids = set()
+        os.makedirs(shard_dir, exist_ok=True)
+
+        # 3) Loop For Tweaking API Data (Each Game Saved As A Shard)
+        _, bad_ids = load_games([i for i in game_ids if i not in done_ids], roster_obj, concurrency=concurrency, archive=self.archive, workers=workers, shard_dir=shard_dir)
+
+        # 4) Compact Shards Into Season File
+        save_season_path = season_base_path(season)
+        season_ids = set(game_ids)
+        shard_ids = [i for i in read_shard_manifest(shard_dir) if i in season_ids]
+        compacted_ids = compact_game_shards(shard_dir, shard_ids, save_season_path)
+        if compacted_ids:
+            # New Base File Holds Every Game, So Nightly Deltas (And Old Partitions) Are Replaced
+            reset_season_deltas(season)
+            if self.partitioned:
+                replace_season_partitions(season, pl.read_parquet(save_season_path))
+        else:
+            print(f"No Games Compacted For {season}-{season+1} | Keeping Existing Season File And Deltas")
 
         # 5) Print Load Metrics
         season_lab = f"{season}-{season+1}"
         end_time = time.time()
         season_elapsed_time = round((end_time - start_time)/60,2)
         bad_games = len(bad_ids)
-        games_loaded = len(game_ids) - bad_games
+        games_loaded = len(game_ids) - len(done_ids) - bad_games
         szn_gpm = ((games_loaded)/(end_time - start_time)*60)
         time_stamp = datetime.fromtimestamp(end_time).strftime('%Y-%m-%d %H:%M:%S')
         print(f"Successfully Loaded And Saved {games_loaded} Games From {season_lab} Season in {season_elapsed_time} Minutes ({round(szn_gpm, 2)} GPM) | Path: {save_season_path} | Completed at {time_stamp}")
+        print(f"API Rate Limits: {api_stats()}")
 
     def add_missing_roster(self, roster_obj, id_obj):
         # Filter PBP IDs Not in Roster
@@ -1169,93 +1450,26 @@ class LoadData:
         
 # Create Update Class
 class Update:
-    def __init__(self, year = 2023):
+    def __init__(self, year = 2023, archive = archive_mode, partitioned = pbp_partitioned):
         self.year = year+1
         self.start_year = year
+        self.archive = archive
+        self.partitioned = partitioned
     
     def update_schedule(self):
         start_time = time.time()
 
         # Load Existing Schedule
-        df = pl.read_parquet(f"Schedule/parquet/NHL_Schedule_{self.start_year}{self.year}.parquet")
+        df = cast_schedule_ids(read_cached(f"Schedule/parquet/NHL_Schedule_{self.start_year}{self.year}.parquet"))
 
-        # Initalize Update Dates + Empty List
+        # Initalize Update Dates
         start_date = df['game_date'].max()
         end_date = (datetime.today() - timedelta(days=1)).strftime('%Y-%m-%d')
-        game_dfs = []
-        game_ids_new = []
-
-        # Loop Over Dates For Game Information
-        for i in pd.date_range(start=start_date, end=end_date, freq='D'):
-            i_str = i.strftime('%Y-%m-%d')
-            sched_link = "https://api-web.nhle.com/v1/schedule/"+i_str
-            response = requests.get(sched_link).json().get('gameWeek')[0].get('games')
-
-            for i, value in enumerate(response):
-                if (value.get('gameType') in [2,3]) & (value.get('gameScheduleState') == 'OK') & (value.get('gameState') == 'OFF'):
-                    data = pl.DataFrame({
-                        'game_id': value.get('id'),
-                        'season': value.get('season'),
-                        'game_type_code': value.get('gameType'),
-                        'venue_name': value.get('venue').get('default'),
-                        'neutral_site': value.get('neutralSite'),
-                        'start_time_utc': value.get('startTimeUTC'),
-                        'east_offset': value.get('easternUTCOffset'),
-                        'local_offset': value.get('venueUTCOffset'),
-                        'local_timezone': value.get('venueTimezone'),
-                        'game_state': value.get('gameState'),
-                        'game_schedule_state': value.get('gameScheduleState'),
-                        'away_team_id': value.get('awayTeam').get('id'),
-                        'away_abbreviation': value.get('awayTeam').get('abbrev'),
-                        'away_team_place': value.get('awayTeam').get('placeName').get('default'),
-                        'away_logo': value.get('awayTeam').get('logo'),
-                        'away_logo_dark': value.get('awayTeam').get('darkLogo'),
-                        'away_score': value.get('awayTeam').get('score'),
-                        'home_team_id': value.get('homeTeam').get('id'),
-                        'home_abbreviation': value.get('homeTeam').get('abbrev'),
-                        'home_team_place': value.get('homeTeam').get('placeName').get('default'),
-                        'home_logo': value.get('homeTeam').get('logo'),
-                        'home_logo_dark': value.get('homeTeam').get('darkLogo'),
-                        'home_score': value.get('homeTeam').get('score'),
-                        'period': value.get('periodDescriptor').get('number'),
-                        'period_type': value.get('periodDescriptor').get('periodType'),
-                        'last_period_type': value.get('gameOutcome').get('lastPeriodType'),
-                        'gamecenter_link': value.get('gameCenterLink')
-                    })
-                if not data.is_empty():
-                    result_df = (
-                        data
-                        .with_columns([
-                            pl.col('game_id').cast(pl.Int32),
-                            pl.col('season').cast(pl.Int32),
-                            pl.col('away_score').cast(pl.Int32),
-                            pl.col('home_score').cast(pl.Int32),
-                            pl.when(pl.col('game_type_code') == 2).then(pl.lit('R'))
-                              .when(pl.col('game_type_code') == 3).then(pl.lit('P'))
-                              .alias('season_type'),
-                            pl.col("start_time_utc").str.to_datetime("%Y-%m-%dT%H:%M:%SZ").dt.replace_time_zone('UTC'),
-                            pl.col('away_team_id').cast(pl.Utf8),
-                            pl.col('home_team_id').cast(pl.Utf8)
-                        ])
-                        .with_columns([
-                            pl.col("start_time_utc").dt.convert_time_zone('America/New_York').dt.strftime(time_fmt).alias('start_time_ET'),
-                            pl.col("start_time_utc").dt.convert_time_zone('America/New_York').dt.strftime(day_fmt).alias('game_date'),
-                            pl.concat_str(pl.lit(pbp_link_pre), pl.col('game_id'), pl.lit(pbp_link_suf)).alias('pbp_link'),
-                            pl.concat_str(pl.lit(shift_link), pl.col('game_id')).alias('shift_link')
-                        ])
-                        .select([
-                            'game_id', 'season', 'game_date', 'start_time_ET', 'season_type', 'game_schedule_state',
-                            'away_team_id', 'away_score', 'away_abbreviation', 'home_score', 'home_team_id', 'home_abbreviation',
-                            'pbp_link', 'shift_link', 'start_time_utc'
-                        ])
-                        .sort('game_id', 'season', 'start_time_ET')
-                    )
-
-                    game_dfs.append(result_df)
-                    game_ids_new.append(result_df['game_id'].unique())
 
-        for j in game_dfs:
-            df = df.vstack(j)
+        # Sync New Games (Week Strides, Skipping Windows Already Synced)
+        new_games = sync_schedule_window(f"{self.start_year}{self.year}", start_date, end_date, archive=self.archive)
+        if new_games is not None:
+            df = df.vstack(new_games.filter(~pl.col('game_id').is_in(df['game_id'])))
 
         # Sort and Remove Dupes
         df = df.sort('game_date').unique()
@@ -1276,28 +1490,35 @@ class Update:
 
     def update_roster(self):
         path = 'Rosters/parquet/all/NHL_Roster_AllSeasons_Slim.parquet'
-        existing_df = pl.read_parquet(path)
-        new_roster = LoadData(year=self.start_year).load_roster()
+        existing_df = cast_roster_ids(pl.read_parquet(path))
+        new_roster = LoadData(year=self.start_year, archive=self.archive).load_roster()
 
         final_df = existing_df.extend(new_roster).unique()
-        final_df = final_df.extend(pl.read_parquet('Rosters/parquet/slim/ADD_NHL_Roster_Slim.parquet')).unique()
+        final_df = final_df.extend(cast_roster_ids(pl.read_parquet('Rosters/parquet/slim/ADD_NHL_Roster_Slim.parquet'))).unique()
 
         # Save
         final_df.write_parquet(path)
 
         return final_df
         
-    def update_pbp(self, roster_obj):
-        "This function will update the current season PBP with games occuring between the last load and yesterday's date"
+    def update_pbp(self, roster_obj, concurrency=None, workers=None, resume=False, compact=False):
+        "This function will update the current season PBP with games occuring between the last load and yesterday's date. Set concurrency to download games asynchronously and workers to transform them in parallel processes. resume=True skips new games already sharded by an earlier (killed) update. New games are written as a delta file next to the season file; compact=True folds the deltas into it afterwards (see compact_pbp)"
         start_time = time.time()
-        # Initialize Existing Data Frame + Stats
-        df_list = []
-        df_list.append(pl.read_parquet(f'PBP/parquet/API_RAW_PBP_Data_{self.start_year}{self.year}.parquet'))
-        exist_games = df_list[0]['game_id'].unique()
-        exist_rows = df_list[0].height
+        # Initialize Existing Data Frame + Stats (Season File + Earlier Deltas)
+        base_season_path = season_base_path(self.start_year)
+        if self.partitioned:
+            # Seed The Partitions From The Season File The First Time An Update Runs Partitioned
+            if not os.path.isdir(season_partition_dir(self.start_year)):
+                replace_season_partitions(self.start_year, read_season_pbp(self.start_year))
+            exist_df = scan_pbp_dataset(seasons=[self.start_year]).select('game_id', 'game_date').collect()
+        else:
+            exist_df = read_season_pbp(self.start_year, columns=['game_id', 'game_date'])
+        exist_games = exist_df['game_id'].unique()
+        exist_rows = exist_df.height
+        shard_dir = season_shard_dir(self.start_year)
 
         # Initialize Load Dates
-        last_load = (datetime.strptime(df_list[0]['game_date'].max(), "%Y-%m-%d") + timedelta(days = 1)).strftime('%Y%m%d')
+        last_load = (datetime.strptime(exist_df['game_date'].max(), "%Y-%m-%d") + timedelta(days = 1)).strftime('%Y%m%d')
 
         print(f"Existing DataFrame has {exist_rows} from {len(exist_games)} Games | Last Updated {last_load}")
 
@@ -1307,65 +1528,52 @@ class Update:
         start_time = time.time()
         print(f"Now Loading Play By Play Data From {season}-{season+1} NHL Season")
 
-        bad_ids = []
-        shift_len = []
-
         # 1) Get Game ID's From Schedule
-        game_ids = pl.read_parquet(f'Schedule/parquet/NHL_Schedule_{self.start_year}{self.year}.parquet').select('game_id').filter(~pl.col('game_id').is_in(exist_games)).unique()['game_id'].to_list()
+        game_ids = read_cached(f'Schedule/parquet/NHL_Schedule_{self.start_year}{self.year}.parquet').select('game_id').filter(~pl.col('game_id').is_in(exist_games)).unique()['game_id'].to_list()
         print(game_ids[:5])
         n_games = len(game_ids)
 
-        # 2) Loop For Tweaking API Data
+        # 2) Loop For Tweaking API Data (Each Game Saved As A Shard)
         if n_games >= 1:
-            for i in game_ids:
-                shift_start = time.time()
-                try:
-                    df_list.append(append_shift_data(align_and_cast_columns(data = ping_nhl_api(i = i), sch = raw_schema), roster_data=roster_obj))
-                except ValueError as e:
-                    bad_ids.append(i)
-                    print(f"Error In Loading NHL API for GameID: {i} | {e}")
-                    continue
-
-                # Print Intermitent Update
-                shift_end = time.time()
-                shift_elap = shift_end - shift_start
-                shift_len.append(shift_elap)
-                average_shift_time = statistics.mean(shift_len)
-
-                if (str(i)[-3:] == "500"):
-                    print(f"LOAD UPDATE: Game {i} took {round(shift_elap,2)} | Each game is taking ~{round(average_shift_time,2)} Seconds | For {n_games-500} More Games It will Take {round(((average_shift_time*(n_games-500))/60),1)} Minutes")
-                if (str(i)[-3:] == "000"):
-                    print(f"LOAD UPDATE: Game {i} took {round(shift_elap,2)} | Each game is taking ~{round(average_shift_time,2)} Seconds | For {n_games-1000} More Games It will Take {round(((average_shift_time*(n_games-1000))/60),1)} Minutes")
-
-            # 3) Combine DataFrames Into One
-            data = df_list[0]
-            for df in df_list[1:]:
-                try:
-                    data = data.vstack(df)
-                except ValueError as e:
-                    print(f"Incomplete Data For Game ID: {df['game_id'][0]}")
-                    print(f"Error: {e}")
-                    continue
-
-            data = data.sort('game_id', 'period', 'event_idx')
-
-            # 4) Save File After VStack
-            save_season_path = f"PBP/parquet/API_RAW_PBP_Data_{season}{season+1}.parquet"
-            data.write_parquet(
-                save_season_path,
-                use_pyarrow=True
-            )
+            if resume:
+                done_ids = set(read_shard_manifest(shard_dir))
+            else:
+                reset_game_shards(shard_dir)
+                done_ids = set()
+            os.makedirs(shard_dir, exist_ok=True)
+            _, bad_ids = load_games([i for i in game_ids if i not in done_ids], roster_obj, concurrency=concurrency, archive=self.archive, workers=workers, shard_dir=shard_dir)
+
+            # 3) Write New Shards As One Delta File (The Season File Is Not Rewritten)
+            new_game_ids = set(game_ids)
+            shard_ids = [i for i in read_shard_manifest(shard_dir) if i in new_game_ids]
+            save_season_path = new_delta_path(season)
+            new_ids = compact_game_shards(shard_dir, shard_ids, save_season_path, schema_path=base_season_path)
+            if new_ids:
+                add_season_delta(season, save_season_path)
+                if self.partitioned:
+                    write_pbp_partitions(pl.read_parquet(save_season_path))
+            if compact:
+                self.compact_pbp()
 
             # 5) Print Load Metrics
             season_lab = f"{season}-{season+1}"
             end_time = time.time()
             season_elapsed_time = round((end_time - start_time)/60,2)
             bad_games = len(bad_ids)
-            games_loaded = len(df_list[1:]) - bad_games
+            games_loaded = len(new_ids)
             szn_gpm = ((games_loaded)/(end_time - start_time)*60)
             time_stamp = datetime.fromtimestamp(end_time).strftime('%Y-%m-%d %H:%M:%S')
 
             print(f"Successfully Loaded And Saved {games_loaded} Games From {season_lab} Season in {season_elapsed_time} Minutes ({round(szn_gpm, 2)} GPM) | Path: {save_season_path} | Completed at {time_stamp}")
+            print(f"API Rate Limits: {api_stats()}")
 
         else:
             print("No Games To Update")
+
+    def compact_pbp(self):
+        """Folds the nightly delta files into the season file. Meant to be run occasionally, not after every update.
+           When partitioned, the season partitions (one small file per update) are rewritten from the compacted file too"""
+        n_deltas = compact_season_pbp(self.start_year)
+        if (n_deltas > 0) & self.partitioned:
+            replace_season_partitions(self.start_year, pl.read_parquet(season_base_path(self.start_year)))
+        return n_deltas
@@ -0,0 +1,69 @@
+# ipccache.py
+# Local Arrow IPC copies of hot reference datasets (schedules, rosters), opened memory mapped.
+#
+# Layout:
+#   Cache/ipc/{name}-{source hash}-{version}.arrow   <- uncompressed IPC copy of one parquet file (local path or URL)
+#   Cache/ipc/shared/{name}-{frame hash}.arrow       <- frames handed to worker processes (i.e. the load roster)
+#
+# A parquet file is decoded once into the cache; every later reader (another process, a worker, the next CLI run) maps
+# the same file, so the OS page cache is shared and nothing is decoded again. Local sources are versioned by their
+# mtime + size, so rewriting the parquet file invalidates the copy. Remote sources (URLs) are refreshed after max_age.
+import hashlib
+import os
+import time
+
+import polars as pl
+
+# Constants - Cache Location #
+cache_root = 'Cache/ipc'
+remote_max_age = 24 * 3600   # Seconds before a cached URL is downloaded again
+
+
+def _hash(value):
+    return hashlib.sha256(str(value).encode()).hexdigest()[:12]
+
+def _write_ipc(df, path):
+    """Uncompressed (so it can be memory mapped), temp file first so readers never map half a file"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    df.write_ipc(tmp_path, compression='uncompressed')
+    os.replace(tmp_path, path)
+
+def cache_path(source, root=cache_root):
+    """IPC path for the current version of a parquet source (local path or URL)"""
+    name = os.path.splitext(os.path.basename(source))[0]
+    if source.startswith('http'):
+        key, version = source, 'remote'
+    else:
+        stat = os.stat(source)
+        key, version = os.path.abspath(source), _hash(f"{stat.st_mtime_ns}:{stat.st_size}")
+    return f"{root}/{name}-{_hash(key)}-{version}.arrow"
+
+def read_cached(source, root=cache_root, max_age=remote_max_age):
+    """Reads a parquet source through the IPC cache. The first call decodes it and writes the cache file (dropping older
+       versions of the same source), every call returns a memory mapped frame"""
+    path = cache_path(source, root)
+    fresh = os.path.exists(path)
+    if fresh & source.startswith('http'):
+        fresh = (time.time() - os.path.getmtime(path)) < max_age
+    if not fresh:
+        _write_ipc(pl.read_parquet(source), path)
+        prefix = path.rsplit('-', 1)[0] + '-'
+        for file in os.listdir(root):
+            old_path = f"{root}/{file}"
+            if old_path.startswith(prefix) & file.endswith('.arrow') & (old_path != path):
+                os.remove(old_path)
+    return pl.read_ipc(path, memory_map=True)
+
+def share_frame(df, name, root=cache_root):
+    """Writes a frame for other processes to map (see read_shared) and returns its path. Identical frames reuse one file"""
+    digest = hashlib.sha256(str(df.schema).encode())
+    row_hashes = df.hash_rows(seed=0).implode()   # Folded with polars (two seeds) so the ingestion path doesn't need numpy
+    digest.update(f"{df.height}:{row_hashes.hash(seed=0)[0]}:{row_hashes.hash(seed=1)[0]}".encode())
+    path = f"{root}/shared/{name}-{digest.hexdigest()[:16]}.arrow"
+    if not os.path.exists(path):
+        _write_ipc(df, path)
+    return path
+
+def read_shared(path):
+    return pl.read_ipc(path, memory_map=True)
@@ -5,25 +5,11 @@ from initalize import *
 start = 2009 # 2009 is earliest
 end = 2025 # 2025 is latest
 
-# Set Up Loop For Loading Inital Data (Rosters and Schedule #
-# *Want to load schedule and rosters so I can compile rosters before using in shift data*
+# Archive Mode ('record' saves raw API payloads to Archive/ | 'replay' rebuilds everything from Archive/ with no network)
+archive = archive_mode
 
-load_start = time.time()
-for k in range(start, end):
-
-    loader = LoadData(year=k)
-
-    # Load Schedule #
-    print(" ")
-    print("="*30, f"Begin Loading {k}-{k+1} Schedule And Roster Data", "="*30)
-    print(" ")
-
-    # Load Schedule #
-    loader.load_schedule()
-
-    # Load Rosters #
-    roster_slim = loader.load_roster()
-    print(" ")
+# Partitioned Layout (True also writes PBP/hive season/season_type/month partitions for pruned reads)
+partitioned = pbp_partitioned
 
 # Collapse Rosters To Create Large Roster File
 def compile_rosters(type):
@@ -31,45 +17,71 @@ def compile_rosters(type):
     df_list = []
     for i in range(2009, 2025):
         season_roster_path = f"Rosters/parquet/{type.lower()}/NHL_Roster_{type}_{i}{i+1}.parquet"
-        df_list.append(pl.read_parquet(season_roster_path))
+        df_list.append(cast_roster_ids(pl.read_parquet(season_roster_path)))
 
-    df_list.append(pl.read_parquet(f"Rosters/parquet/{type.lower()}/ADD_NHL_Roster_{type}.parquet"))
+    df_list.append(cast_roster_ids(pl.read_parquet(f"Rosters/parquet/{type.lower()}/ADD_NHL_Roster_{type}.parquet")))
 
     # Combine
     result = df_list[0]
     for df in df_list[1:]:
         result = result.extend(df)
     result = result.unique()
-    
+
     # Save
     save_path = f"Rosters/parquet/all/NHL_Roster_AllSeasons_{type}.parquet"
     result.write_parquet(save_path)
     print(f"All NHL Rosters Loaded | Path: {save_path}")
 
-print(" ")
-print("="*34, "Begin Compiling Roster Files", "="*34)
+# Guarded so transform worker processes (spawned by load_pbp) can import this file without re-running the load
+if __name__ == '__main__':
+
+    # Set Up Loop For Loading Inital Data (Rosters and Schedule #
+    # *Want to load schedule and rosters so I can compile rosters before using in shift data*
+
+    load_start = time.time()
+    for k in range(start, end):
 
-for j in ['Slim', 'Full']:
-    compile_rosters(j)
+        loader = LoadData(year=k, archive=archive)
 
-# Load Slim Rosters
-slim_rosters = pl.read_parquet("Rosters/parquet/all/NHL_Roster_AllSeasons_slim.parquet")
+        # Load Schedule #
+        print(" ")
+        print("="*30, f"Begin Loading {k}-{k+1} Schedule Data", "="*30)
+        print(" ")
 
-# Load Play By Play #
-if start < 2010:
-    start = 2010
-for k in range(start, end):
-    
-    loader = LoadData(year=k)
+        # Load Schedule #
+        loader.load_schedule()
 
+    # Load Rosters (Every Season In One Concurrent Batch) #
     print(" ")
-    print("="*28, f"Begin Loading {k}-{k+1} Play By Play Data", "="*28)
+    print("="*30, f"Begin Loading {start}-{end} Roster Data", "="*30)
     print(" ")
+    roster_slim = load_rosters(list(range(start, end)), archive=archive)
+    print(" ")
+
+    print(" ")
+    print("="*34, "Begin Compiling Roster Files", "="*34)
+
+    for j in ['Slim', 'Full']:
+        compile_rosters(j)
+
+    # Load Slim Rosters
+    slim_rosters = read_cached("Rosters/parquet/all/NHL_Roster_AllSeasons_slim.parquet")
 
-    loader.load_pbp(slim_rosters)
+    # Load Play By Play #
+    if start < 2010:
+        start = 2010
+    for k in range(start, end):
 
-# Print Load Metric #
-load_end = time.time()
-load_elap = round((load_end - load_start)/3600, 2)
-print(" ")
-print("="*15, f"Schedule, Rosters, and PBP Data From {start} to {end} Loaded in {load_elap} Hours", "="*15)
+        loader = LoadData(year=k, archive=archive, partitioned=partitioned)
+
+        print(" ")
+        print("="*28, f"Begin Loading {k}-{k+1} Play By Play Data", "="*28)
+        print(" ")
+
+        loader.load_pbp(slim_rosters, concurrency=fetch_concurrency, workers=transform_workers)
+
+    # Print Load Metric #
+    load_end = time.time()
+    load_elap = round((load_end - load_start)/3600, 2)
+    print(" ")
+    print("="*15, f"Schedule, Rosters, and PBP Data From {start} to {end} Loaded in {load_elap} Hours", "="*15)
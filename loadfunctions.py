@@ -1,5 +1,12 @@
 # Load Requirements
 from requirements import *
+from nhlclient import api_get, get_json
+from initalize import sync_schedule_window
+from geometry import clock_seconds, net_distance, net_angle
+from ipccache import read_cached
+from pbptypes import cast_schedule_ids, pbp_id_dtype
+from functools import lru_cache
+import modeling
 
 ### Schedule Load Functions ###
 
@@ -44,8 +51,8 @@ team_abbr_dict = {
     52: 'WPG'            # Winnipeg Jets
 }
 
-away_teams = pl.DataFrame([{'away_team_id': team_id, 'away_abbreviation': team_abbr} for team_id, team_abbr in team_abbr_dict.items()]).with_columns(pl.col('away_team_id').cast(pl.Utf8))
-home_teams = pl.DataFrame([{'home_team_id': team_id, 'home_abbreviation': team_abbr} for team_id, team_abbr in team_abbr_dict.items()]).with_columns(pl.col('home_team_id').cast(pl.Utf8))
+away_teams = pl.DataFrame([{'away_team_id': team_id, 'away_abbreviation': team_abbr} for team_id, team_abbr in team_abbr_dict.items()]).with_columns(pl.col('away_team_id').cast(pbp_id_dtype))
+home_teams = pl.DataFrame([{'home_team_id': team_id, 'home_abbreviation': team_abbr} for team_id, team_abbr in team_abbr_dict.items()]).with_columns(pl.col('home_team_id').cast(pbp_id_dtype))
 
 # Time Zone Conversions
 est = pytz.timezone('US/Eastern')
@@ -71,8 +78,8 @@ def load_fast_schedule(i = 2023):
     .with_columns([
         pl.col('game_id').cast(pl.Int32),
         pl.col('season_full').cast(pl.Int32).alias('season'),
-        pl.col('away_team_id').cast(pl.Utf8),
-        pl.col('home_team_id').cast(pl.Utf8),
+        pl.col('away_team_id').cast(pbp_id_dtype),
+        pl.col('home_team_id').cast(pbp_id_dtype),
         pl.col("game_date_time").dt.convert_time_zone('America/New_York').dt.strftime(time_fmt).alias('start_time_ET'),
         pl.col("game_date_time").dt.convert_time_zone('America/New_York').dt.strftime(day_fmt).alias('game_date'),
         pl.when(pl.col('status_detailed_state') == 'Final').then(pl.lit('OK')).otherwise(pl.col('status_detailed_state')).alias('game_schedule_state')
@@ -98,117 +105,50 @@ def load_fast_schedule(i = 2023):
     df.write_parquet(par_save_url)
     print(f"{szn_start}-{i} NHL Season Schedule Saved | Path: {csv_save_url}")
 
-for year in range(2010, 2024):
-    load_fast_schedule(i = year)
-
-# Dates For Scrape:
-max_date = pl.read_parquet("Schedule/parquet/NHL_Schedule_20232024.parquet")['game_date'].max()
-yday = (datetime.today() - timedelta(days=1)).strftime('%Y-%m-%d')
+# Dates For Scrape (Read From The Saved Schedules On First Use, Not At Import)
+@lru_cache(maxsize=None)
+def schedule_date_range():
+    """(min, max) game_date over the saved 2009-2010 and 2023-2024 schedules"""
+    min_date = read_cached("Schedule/parquet/NHL_Schedule_20092010.parquet")['game_date'].min()
+    max_date = read_cached("Schedule/parquet/NHL_Schedule_20232024.parquet")['game_date'].max()
+    return min_date, max_date
 
 # 2) Load Schedule From Current API (All Data)
-def load_current_schedule(start = max_date, end = yday):
+def load_current_schedule(start = None, end = None):
     """This function will take a start date and end date and load any NHL Game IDs From The NHL Schedule between those dates
 
         INPUTS:
-        start and end are dates stored in Y%-m%-d% format
+        start and end are dates stored in Y%-m%-d% format (default: last saved game date to yesterday)
     """
 
     # 1) Initialize Variables (Start Date, End Date, List of IDs, Existing DF)
-    start_date = start
-    end_date = end
+    start_date = start if start is not None else schedule_date_range()[1]
+    end_date = end if end is not None else (datetime.today() - timedelta(days=1)).strftime('%Y-%m-%d')
     print(f"Now Loading NHL Games From {start_date} to {end_date} And Appending To Schedule")
     
-    # DF List
-    game_dfs = []
-
     #Load/Save
     load_link = 'Schedule/parquet/NHL_Schedule_20232024'
-    exist_df = pl.read_parquet(f'{load_link}.parquet')
-
-    # 2) Loop Over Date Range To Get API Response For Schedule
-    for i in pd.date_range(start=start_date, end=end_date, freq='D'):
-        i_str = i.strftime('%Y-%m-%d')
-        sched_link = "https://api-web.nhle.com/v1/schedule/"+i_str
-        response = requests.get(sched_link).json().get('gameWeek')[0].get('games')
- 
-        for i, value in enumerate(response):
-            if (value.get('gameType') in [2,3]) & (value.get('gameScheduleState') == 'OK') & (value.get('gameState') == 'OFF'):
-                data = pl.DataFrame({
-                    'game_id': value.get('id'),
-                    'season': value.get('season'),
-                    'game_type_code': value.get('gameType'),
-                    'venue_name': value.get('venue').get('default'),
-                    'neutral_site': value.get('neutralSite'),
-                    'start_time_utc': value.get('startTimeUTC'),
-                    'east_offset': value.get('easternUTCOffset'),
-                    'local_offset': value.get('venueUTCOffset'),
-                    'local_timezone': value.get('venueTimezone'),
-                    'game_state': value.get('gameState'),
-                    'game_schedule_state': value.get('gameScheduleState'),
-                    'away_team_id': value.get('awayTeam').get('id'),
-                    'away_abbreviation': value.get('awayTeam').get('abbrev'),
-                    'away_team_place': value.get('awayTeam').get('placeName').get('default'),
-                    'away_logo': value.get('awayTeam').get('logo'),
-                    'away_logo_dark': value.get('awayTeam').get('darkLogo'),
-                    'away_score': value.get('awayTeam').get('score'),
-                    'home_team_id': value.get('homeTeam').get('id'),
-                    'home_abbreviation': value.get('homeTeam').get('abbrev'),
-                    'home_team_place': value.get('homeTeam').get('placeName').get('default'),
-                    'home_logo': value.get('homeTeam').get('logo'),
-                    'home_logo_dark': value.get('homeTeam').get('darkLogo'),
-                    'home_score': value.get('homeTeam').get('score'),
-                    'period': value.get('periodDescriptor').get('number'),
-                    'period_type': value.get('periodDescriptor').get('periodType'),
-                    'last_period_type': value.get('gameOutcome').get('lastPeriodType'),
-                    'gamecenter_link': value.get('gameCenterLink')
-                })
-            if not data.is_empty():
-                result_df = (
-                    data
-                    .with_columns([
-                        pl.col('game_id').cast(pl.Int32),
-                        pl.col('season').cast(pl.Int32),
-                        pl.col('away_score').cast(pl.Int32),
-                        pl.col('home_score').cast(pl.Int32),
-                        pl.when(pl.col('game_type_code') == 2).then(pl.lit('R'))
-                          .when(pl.col('game_type_code') == 3).then(pl.lit('P'))
-                          .alias('season_type'),
-                        pl.col("start_time_utc").str.to_datetime("%Y-%m-%dT%H:%M:%SZ").dt.replace_time_zone('UTC'),
-                        pl.col('away_team_id').cast(pl.Utf8),
-                        pl.col('home_team_id').cast(pl.Utf8)
-                    ])
-                    .with_columns([
-                        pl.col("start_time_utc").dt.convert_time_zone('America/New_York').dt.strftime(time_fmt).alias('start_time_ET'),
-                        pl.col("start_time_utc").dt.convert_time_zone('America/New_York').dt.strftime(day_fmt).alias('game_date'),
-                        pl.concat_str(pl.lit(pbp_link_pre), pl.col('game_id'), pl.lit(pbp_link_suf)).alias('pbp_link'),
-                        pl.concat_str(pl.lit(shift_link), pl.col('game_id')).alias('shift_link')
-                    ])
-                    .select([
-                        'game_id', 'season', 'game_date', 'start_time_ET', 'season_type', 'game_schedule_state',
-                        'away_team_id', 'away_score', 'away_abbreviation', 'home_score', 'home_team_id', 'home_abbreviation',
-                        'pbp_link', 'shift_link', 'start_time_utc'
-                    ])
-                    .sort('game_id', 'season', 'start_time_ET')
-                )
+    exist_df = cast_schedule_ids(pl.read_parquet(f'{load_link}.parquet'))
 
-                game_dfs.append(result_df)
+    # 2) Sync Date Range In Week Strides (Shared With Update.update_schedule)
+    new_games = sync_schedule_window('20232024', start_date, end_date)
 
     # Build + Manipulate Final DataFrame
     result_df = exist_df
-    for df in game_dfs:
-        result_df = result_df.vstack(df)
+    if new_games is not None:
+        result_df = result_df.vstack(new_games.filter(~pl.col('game_id').is_in(exist_df['game_id'])))
     
     result_df = result_df.unique()
 
     # Save
     result_df.write_parquet('Schedule/parquet/NHL_Schedule_20232024.parquet')
     result_df.write_csv('Schedule/csv/NHL_Schedule_20232024.csv')
-load_current_schedule()
 
 # 3) Load Today's Schedule From Current API
-def load_todays_schedule(dte = datetime.today().strftime("%Y-%m-%d")):
+def load_todays_schedule(dte = None):
+    dte = dte if dte is not None else datetime.today().strftime("%Y-%m-%d")
     sched_link = "https://api-web.nhle.com/v1/schedule/"+dte
-    response = requests.get(sched_link).json().get('gameWeek')[0].get('games')
+    response = get_json(sched_link).get('gameWeek')[0].get('games')
 
     # DF List
     game_dfs = []
@@ -249,8 +189,8 @@ def load_todays_schedule(dte = datetime.today().strftime("%Y-%m-%d")):
                       .when(pl.col('game_type_code') == 3).then(pl.lit('P'))
                       .alias('season_type'),
                     pl.col("start_time_utc").str.to_datetime("%Y-%m-%dT%H:%M:%SZ").dt.replace_time_zone('UTC'),
-                    pl.col('away_team_id').cast(pl.Utf8),
-                    pl.col('home_team_id').cast(pl.Utf8)
+                    pl.col('away_team_id').cast(pbp_id_dtype),
+                    pl.col('home_team_id').cast(pbp_id_dtype)
                 ])
                 .with_columns([
                     pl.col("start_time_utc").dt.convert_time_zone('America/New_York').dt.strftime(time_fmt).alias('start_time_ET'),
@@ -372,7 +312,7 @@ def historical_roster_load():
     combinations = list(product(tms_list[0], szn_list))
 
     # Create a DataFrame
-    df = pd.DataFrame(combinations, columns=['teams', 'year'])
+    df = modeling.pd.DataFrame(combinations, columns=['teams', 'year'])
     df = df.explode('teams').drop_duplicates()
     df['link'] = "https://api-web.nhle.com/v1/roster/"+df['teams']+'/'+df['year']
     df.dropna(inplace=True)
@@ -380,7 +320,7 @@ def historical_roster_load():
     ## Begin Roster Loading
     rosters = []
     for link in df['link']:
-        response = requests.get(link)
+        response = api_get(link)
         szn_lab = link[-4:]
         team_lab = link[35:38]
         if response.status_code == 200:
@@ -497,7 +437,11 @@ def historical_roster_load():
     print(f"Total PlayerIDs Slim Rosters Data Frame: {len(slim_df['player_id'].unique())}")
 
     return final_df, slim_df, goalies_full, goalies_slim
-roster_full, roster_slim, goalies_full, goalies_slim = historical_roster_load()
+
+@lru_cache(maxsize=None)
+def roster_tables():
+    """(roster_full, roster_slim, goalies_full, goalies_slim), built by historical_roster_load the first time a caller needs them"""
+    return historical_roster_load()
 
 # 2) Load Missing Player ID's From PBP IDs (May need to have some sort of loop to do this and fill rosters in)
 #def missing_roster_load():
@@ -525,14 +469,6 @@ roster_full, roster_slim, goalies_full, goalies_slim = historical_roster_load()
 
 ## TWEAK FUNCTIONS ##
 
-# Helper: Convert HH:MM to Seconds
-def min_to_sec(time_str):
-    """This function will help to convert time's formatted like MM:SS to a round seconds number"""
-    if time_str is None:
-        return None
-    
-    minutes, seconds = map(int, time_str.split(':'))
-    return minutes * 60 + seconds
 # Helper: Create Normalized Schema
 raw_schema = {
     'id': 'i32',
@@ -596,7 +532,7 @@ def ping_nhl_api(i):
     pbp_link = pbp_link_pre+str(i)+pbp_link_suf
 
     # 2) Get Game Data From Response
-    pbp_response = requests.get(pbp_link).json()
+    pbp_response = get_json(pbp_link)
     game_data = pl.DataFrame({
             'id': pbp_response.get('id'),
             'season': pbp_response.get('season'),
@@ -775,7 +711,7 @@ def align_and_cast_columns(data, sch):
     # Create Game and Period Seconds Remaining from timeInPeriod, timeRemaining: 'period', 'period_seconds', 'period_seconds_remaining', 'game_seconds', 'game_seconds_remaining'
     data = (
         data
-        .with_columns(pl.when(pl.col('timeInPeriod').is_null()).then(pl.lit(None)).otherwise(pl.col('timeInPeriod').map_elements(min_to_sec)).alias('period_seconds'))
+        .with_columns(clock_seconds('timeInPeriod').alias('period_seconds'))
         .with_columns([
             (1200 - pl.col('period_seconds')).alias('period_seconds_remaining'),
             (pl.col('period_seconds') + ((pl.col('period')-1)*1200)).alias('game_seconds'),
@@ -933,28 +869,10 @@ def align_and_cast_columns(data, sch):
     )
 
     # Create Event Distance Calculation
-    data = data.with_columns(
-        pl.when(pl.col('x_abs') >= 0).then(pl.Series.sqrt((89 - pl.Series.abs(data['x_abs']))**2 + data['y_abs']**2))
-          .when(pl.col('x_abs') <  0).then(pl.Series.sqrt((pl.Series.abs(data['x_abs']) + 89)**2 + data['y_abs']**2))
-          .alias('event_distance')
-    )
+    data = data.with_columns(net_distance('x_abs', 'y_abs').alias('event_distance'))
 
     # Create Event Angle Calculation
-    data = (
-        data
-        .with_columns(
-        pl.when(data['x_abs'] >= 0)
-          .then(pl.Series.arctan(data['y_abs'] / (89 - pl.Series.abs(data['x_abs'])))
-                .map_elements(lambda x: abs(x * (180 / pi))))
-          .when(data['x_abs'] < 0)
-          .then(pl.Series.arctan(data['y_abs'] / (pl.Series.abs(data['x_abs']) + 89))
-                .map_elements(lambda x: abs(x * (180 / pi))))
-          .alias('event_angle')
-        )
-        .with_columns(
-            pl.when(pl.col('x_abs') > 89).then((180 - pl.col('event_angle'))).otherwise(pl.col('event_angle')).alias('event_angle')
-        )
-    )
+    data = data.with_columns(net_angle('x_abs', 'y_abs').alias('event_angle'))
 
     return data
 
@@ -973,7 +891,7 @@ def append_shift_data(data):
     )
 
     shift_link = "https://api.nhle.com/stats/rest/en/shiftcharts?cayenneExp=gameId="+str(i)
-    shift_response = requests.get(shift_link).json()
+    shift_response = get_json(shift_link)
 
     # Assuming "data" is the key containing nested data
     data_list = shift_response.get('data', [])
@@ -1043,7 +961,7 @@ def append_shift_data(data):
             ])
             #.unique()
             # Separate Goalies
-            .join(roster_slim.with_columns([
+            .join(roster_tables()[1].with_columns([
                 (pl.col('player_id').cast(pl.Utf8).alias('player_id')),
                 (pl.col('pos_G').cast(pl.Int32).alias('pos_G'))
             ])
@@ -1237,22 +1155,20 @@ def append_shift_data(data):
     return result_df
 
 ## APPLY AND SAVE FUNCTIONS ##
-max_load_date = pl.read_parquet("Schedule/parquet/NHL_Schedule_20232024.parquet")['game_date'].max()
-min_load_date = pl.read_parquet("Schedule/parquet/NHL_Schedule_20092010.parquet")['game_date'].min()
-
 # 1) Get Game ID's Needed to Load PBP - Default is All
-def get_game_ids(start = '2009-10-01', end = max_load_date):
+def get_game_ids(start = '2009-10-01', end = None):
     """This will load every game id from 2011-2012 Season to 2023-2024 abd will be used to load play by play
     
     INPUTS:
     season_start = Earliest year of season (i.e., 2010-2011 Season is 2010)
     season_end = Latest year of season (i.e., 2023-2024 Season is 2024)"""
 
-    # 1) Get Game ID's From Schedule
+    # 1) Get Game ID's From Schedule (Default End Is The Last Saved Game Date)
+    end = end if end is not None else schedule_date_range()[1]
     season_ids = []
     for i in range(2010, 2024):
         season_ids.append(
-            pl.read_parquet(f"Schedule/parquet/NHL_Schedule_{str(i)+str(i+1)}.parquet")
+            read_cached(f"Schedule/parquet/NHL_Schedule_{str(i)+str(i+1)}.parquet")
             .filter((pl.col('game_date') >= start) & (pl.col('game_date') <= end))['game_id']
             )
 
@@ -1273,7 +1189,7 @@ def load_season_pbp(season = 2023):
     df_list = []
     
     # 1) Get Game ID's From Schedule
-    game_ids = pl.read_parquet(f"Schedule/parquet/NHL_Schedule_{str(season)+str(season+1)}.parquet").filter((~pl.col('game_id').is_in([2015020497])))['game_id'].unique().to_list()
+    game_ids = read_cached(f"Schedule/parquet/NHL_Schedule_{str(season)+str(season+1)}.parquet").filter((~pl.col('game_id').is_in([2015020497])))['game_id'].unique().to_list()
     n_games = len(game_ids)
 
     # 2) Loop For Tweaking API Data
@@ -1281,7 +1197,7 @@ def load_season_pbp(season = 2023):
         shift_start = time.time()
         try:
             df_list.append(append_shift_data(align_and_cast_columns(data = ping_nhl_api(i = i), sch = raw_schema)))
-        except ValueError as e:
+        except (ValueError, requests.RequestException) as e:
             bad_ids.append(i)
             print(f"Error In Loading NHL API for GameID: {i} | {e}")
             continue
@@ -1325,5 +1241,10 @@ def load_season_pbp(season = 2023):
     time_stamp = datetime.fromtimestamp(end_time).strftime('%Y-%m-%d %H:%M:%S')
     print(f"Successfully Loaded And Saved {games_loaded} Games From {season_lab} Season in {season_elapsed_time} Minutes ({round(szn_gpm, 2)} GPM) | Path: {save_season_path} | Completed at {time_stamp}")
 
-for i in range(2015,2016):
-    load_season_pbp(season = i)
\ No newline at end of file
+# Guarded So Importing This File Does No Network Or Disk Work
+if __name__ == '__main__':
+    for year in range(2010, 2024):
+        load_fast_schedule(i = year)
+    load_current_schedule()
+    for i in range(2015,2016):
+        load_season_pbp(season = i)
\ No newline at end of file
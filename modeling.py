@@ -0,0 +1,56 @@
+# modeling.py
+# Modeling / plotting import layer. Nothing heavy is imported when this module is: each name below resolves the
+# first time it is accessed (i.e. modeling.XGBClassifier), so only processes that train, impute or plot pay for it.
+#
+#   import modeling
+#   classifier = modeling.XGBClassifier()
+import importlib
+
+from requirements import *
+
+# Constants - Lazy Names (name -> (module, attribute or None for the module itself)) #
+lazy_imports = {
+    # Pandas
+    'pd': ('pandas', None),
+    'np': ('numpy', None),
+    # Plotting
+    'matplotlib': ('matplotlib', None),
+    'plt': ('matplotlib.pyplot', None),
+    # Modeling
+    'sklearn': ('sklearn', None),
+    'train_test_split': ('sklearn.model_selection', 'train_test_split'),
+    'GridSearchCV': ('sklearn.model_selection', 'GridSearchCV'),
+    'LabelEncoder': ('sklearn.preprocessing', 'LabelEncoder'),
+    'xgb': ('xgboost', None),
+    'XGBClassifier': ('xgboost', 'XGBClassifier'),
+    # HyperTuning
+    'optuna': ('optuna', None),
+    'TPESampler': ('optuna.samplers', 'TPESampler'),
+}
+lazy_imports.update({metric: ('sklearn.metrics', metric) for metric in [
+    'r2_score', 'classification_report', 'confusion_matrix', 'precision_recall_fscore_support', 'mean_squared_error',
+    'accuracy_score', 'roc_curve', 'roc_auc_score', 'auc', 'make_scorer', 'precision_score', 'recall_score', 'log_loss',
+    'f1_score']})
+
+
+def __getattr__(name):
+    """Imports a lazy name on first access and keeps it as a module global, so later lookups skip this hook"""
+    if name not in lazy_imports:
+        raise AttributeError(f"module 'modeling' has no attribute '{name}'")
+    module_name, attr = lazy_imports[name]
+    value = importlib.import_module(module_name)
+    if attr is not None:
+        value = getattr(value, attr)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(lazy_imports))
+
+def set_display_options():
+    """Full-width pandas/polars printing for notebooks (was set globally at import in requirements.py)"""
+    pd = __getattr__('pd')
+    pd.set_option('display.max_columns', None)
+    pd.set_option('display.max_rows', None)
+    pl.Config.set_tbl_rows(n=-1)
+    pl.Config.set_tbl_cols(n=-1)
@@ -0,0 +1,97 @@
+# nhlclient.py
+# Shared HTTP client for every NHL API call. One pooled session keeps connections (and TLS sessions)
+# alive per host, so repeat calls to api-web.nhle.com / api.nhle.com skip the handshake.
+# Every call goes through the host's adaptive rate limiter (ratelimit.py) and is retried on 429/5xx.
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ratelimit import get_limiter, limiter_stats, backoff_delay, retry_after_delay, max_retries, retry_statuses
+
+# Constants - Connection Pools Per Host #
+host_pool_sizes = {
+    'api-web.nhle.com': 32,     # Play By Play, Schedule, Rosters, Player Landing
+    'api.nhle.com': 32          # Shift Charts, Stats REST
+}
+default_pool_size = 10          # Any other host (i.e. raw.githubusercontent.com)
+
+# Constants - Request Defaults #
+default_timeout = (5, 30)       # (connect, read) in seconds
+default_headers = {
+    'Accept': 'application/json',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'User-Agent': 'NHL-Data/1.0 (+https://github.com/twinfield10/NHL-Data)'
+}
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _build_session():
+    """Creates a session with a keep-alive connection pool mounted for each NHL host"""
+    session = requests.Session()
+    session.headers.update(default_headers)
+    session.mount('https://', HTTPAdapter(pool_connections=len(host_pool_sizes)+1, pool_maxsize=default_pool_size))
+    for host, size in host_pool_sizes.items():
+        session.mount(f'https://{host}/', HTTPAdapter(pool_connections=1, pool_maxsize=size))
+    return session
+
+def get_session():
+    """Returns the process wide session, creating it on first use. Sessions are safe to share between fetch threads"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+def set_pool_size(host, size):
+    """Changes the connection pool size for a host. The session is rebuilt on the next request"""
+    global _session
+    with _session_lock:
+        host_pool_sizes[host] = size
+        if _session is not None:
+            _session.close()
+        _session = None
+
+def api_get(link, timeout=None, retries=max_retries, **kwargs):
+    """GET through the shared session and the host's rate limiter. Returns the requests.Response so callers can check status_code
+        1) 429/5xx responses and connection errors are retried with jittered exponential backoff, honouring Retry-After
+        2) Once retries run out the last response is returned (or the connection error raised)"""
+    limiter = get_limiter(urlsplit(link).hostname)
+    for attempt in range(retries+1):
+        try:
+            with limiter.slot():
+                response = get_session().get(link, timeout=timeout or default_timeout, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            limiter.record_failure()
+            if attempt == retries:
+                raise
+            limiter.record_retry()
+            time.sleep(backoff_delay(attempt))
+            continue
+
+        if response.status_code not in retry_statuses:
+            limiter.record_success()
+            return response
+
+        limiter.record_failure(response.status_code)
+        if attempt == retries:
+            return response
+        limiter.record_retry()
+        delay = retry_after_delay(response)
+        time.sleep(backoff_delay(attempt) if delay is None else delay)
+
+def get_json(link, timeout=None):
+    """GET through the shared session, returning the parsed JSON. Raises requests.HTTPError if the request still fails after retries"""
+    response = api_get(link, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+def api_stats():
+    """Current rate, in-flight cap and retry counts per host"""
+    return limiter_stats()
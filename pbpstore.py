@@ -0,0 +1,190 @@
+# pbpstore.py
+# One logical play by play dataset per season, stored as:
+#   PBP/parquet/API_RAW_PBP_Data_{season}.parquet                      <- base file (full load / last compaction)
+#   PBP/parquet/delta/{season}/API_RAW_PBP_Delta_{season}_{stamp}.parquet  <- one small file per nightly update
+#   PBP/parquet/delta/{season}/manifest.json                           <- delta files readers should include
+#
+# Nightly updates only write a delta, so their cost follows the number of new games. compact_season_pbp folds
+# the deltas back into the base file and is run occasionally. Readers go through read/scan_season_pbp.
+#
+# Optional partitioned layout (written when the loaders run with partitioned=True, read with scan_pbp_dataset):
+#   PBP/hive/season={season}/season_type={R|P}/month={m}/part-{uuid}.parquet
+# Filters on season, season_type or game_date only open the matching partitions, and every write lands in new,
+# uniquely named files so parallel writers never touch an existing partition file. Partition files must share one
+# layout, so a season partitioned before the compact dtypes (pbptypes.py) is rebuilt with replace_season_partitions.
+import json
+import os
+import shutil
+import uuid
+from datetime import datetime
+
+import polars as pl
+import requests
+
+from nhlclient import get_json
+from pbptypes import cast_pbp_types
+
+# Constants - Locations #
+pbp_root = 'PBP/parquet'
+remote_pbp_root = 'https://raw.githubusercontent.com/twinfield10/NHL-Data/main/PBP/parquet'
+hive_root = 'PBP/hive'
+
+# Constants - Partitioned Layout #
+hive_partitions = ['season', 'season_type', 'month']
+hive_schema = {'season': pl.Int32, 'season_type': pl.Utf8, 'month': pl.Int8}
+
+
+def season_label(season):
+    return f"{season}{season+1}"
+
+def season_base_path(season, root=pbp_root):
+    return f"{root}/API_RAW_PBP_Data_{season_label(season)}.parquet"
+
+def season_delta_dir(season, root=pbp_root):
+    return f"{root}/delta/{season_label(season)}"
+
+def list_season_deltas(season, root=pbp_root):
+    """Returns the paths (or URLs) of every delta in the season manifest, oldest first"""
+    manifest_path = f"{season_delta_dir(season, root)}/manifest.json"
+    if root.startswith('http'):
+        try:
+            manifest = get_json(manifest_path)
+        except requests.HTTPError:
+            return []
+    else:
+        if not os.path.exists(manifest_path):
+            return []
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    return [f"{season_delta_dir(season, root)}/{file}" for file in manifest.get('deltas', [])]
+
+def _write_manifest(season, deltas, root=pbp_root):
+    """Swaps in a new manifest atomically so readers see either the old or the new delta list"""
+    delta_dir = season_delta_dir(season, root)
+    os.makedirs(delta_dir, exist_ok=True)
+    with open(f"{delta_dir}/manifest.json.tmp", 'w') as f:
+        json.dump({'deltas': deltas}, f, indent=1)
+    os.replace(f"{delta_dir}/manifest.json.tmp", f"{delta_dir}/manifest.json")
+
+def new_delta_path(season, root=pbp_root):
+    """Path for the next delta file of a season (not registered until add_season_delta)"""
+    stamp = datetime.now().strftime('%Y%m%d%H%M%S')
+    return f"{season_delta_dir(season, root)}/API_RAW_PBP_Delta_{season_label(season)}_{stamp}.parquet"
+
+def add_season_delta(season, delta_path, root=pbp_root):
+    """Registers a written delta file so readers include it"""
+    deltas = [os.path.basename(p) for p in list_season_deltas(season, root)]
+    deltas.append(os.path.basename(delta_path))
+    _write_manifest(season, deltas, root)
+
+def scan_season_pbp(season, root=pbp_root):
+    """LazyFrame over the season base file plus every delta. Works with local or remote (URL) roots.
+       Columns come back in their compact dtypes (pbptypes.py) even from files written before them"""
+    return pl.concat(
+        [cast_pbp_types(pl.scan_parquet(p)) for p in [season_base_path(season, root)] + list_season_deltas(season, root)],
+        how='vertical'
+    )
+
+def scan_pbp_seasons(seasons, root=pbp_root):
+    """LazyFrame over several seasons (base files + deltas) as one dataset. Filter on season to read only some of them"""
+    return pl.concat([scan_season_pbp(season, root) for season in seasons], how='vertical')
+
+def read_season_pbp(season, root=pbp_root, columns=None):
+    """Reads the season base file plus every delta as one DataFrame sorted like the base file. Works with local or remote (URL) roots"""
+    paths = [season_base_path(season, root)] + list_season_deltas(season, root)
+    if len(paths) == 1:
+        return cast_pbp_types(pl.read_parquet(paths[0], columns=columns))
+    data = pl.concat([cast_pbp_types(pl.read_parquet(p, columns=columns)) for p in paths], how='vertical')
+    if (columns is None) or all(c in columns for c in ['game_id', 'period', 'event_idx']):
+        data = data.sort('game_id', 'period', 'event_idx')
+    return data
+
+def reset_season_deltas(season, root=pbp_root):
+    """Drops every delta of a season (i.e. after a full reload rewrote the base file)"""
+    deltas = list_season_deltas(season, root)
+    if deltas:
+        _write_manifest(season, [], root)
+    for p in deltas:
+        os.remove(p)
+
+def compact_season_pbp(season, root=pbp_root):
+    """Folds every delta into the season base file, then removes the deltas. Returns the number of deltas compacted"""
+    deltas = list_season_deltas(season, root)
+    if not deltas:
+        return 0
+
+    base_path = season_base_path(season, root)
+    (
+        scan_season_pbp(season, root)
+        .sort('game_id', 'period', 'event_idx')
+        .sink_parquet(base_path + '.tmp')
+    )
+    os.replace(base_path + '.tmp', base_path)
+
+    # Clear Manifest Before Deleting Files So Readers Never See A Missing Delta
+    _write_manifest(season, [], root)
+    for p in deltas:
+        os.remove(p)
+
+    print(f"Compacted {len(deltas)} Deltas Into {base_path}")
+    return len(deltas)
+
+
+## PARTITIONED LAYOUT ##
+
+def season_partition_dir(season, root=hive_root):
+    return f"{root}/season={season_label(season)}"
+
+def write_pbp_partitions(data, root=hive_root):
+    """Writes play by play into season/season_type/month partitions as new uniquely named files (existing files are never
+       touched, so concurrent writers are safe). Returns the paths written"""
+    paths = []
+    parts = cast_pbp_types(data).with_columns(pl.col('game_date').str.slice(5, 2).cast(pl.Int8).alias('month')).partition_by(hive_partitions, as_dict=True)
+    for (season, season_type, month), part in parts.items():
+        part_dir = f"{root}/season={season}/season_type={season_type}/month={month}"
+        os.makedirs(part_dir, exist_ok=True)
+        path = f"{part_dir}/part-{uuid.uuid4().hex}.parquet"
+        part.drop('month').write_parquet(path + '.tmp')
+        os.replace(path + '.tmp', path)
+        paths.append(path)
+    return paths
+
+def replace_season_partitions(season, data, root=hive_root):
+    """Rewrites every partition of a season (i.e. after a full load or compaction). New files land before the old ones are removed"""
+    season_dir = season_partition_dir(season, root)
+    old_paths = [os.path.join(d, f) for d, _, files in os.walk(season_dir) for f in files]
+    paths = write_pbp_partitions(data, root)
+    for p in old_paths:
+        os.remove(p)
+    print(f"Wrote {len(paths)} Partition Files Under {season_dir}")
+    return paths
+
+def reset_season_partitions(season, root=hive_root):
+    season_dir = season_partition_dir(season, root)
+    if os.path.isdir(season_dir):
+        shutil.rmtree(season_dir)
+
+def date_range_months(start_date, end_date):
+    """Calendar months (1-12) touched by a YYYY-MM-DD date range"""
+    year, month = int(start_date[:4]), int(start_date[5:7])
+    months = set()
+    while (year, month) <= (int(end_date[:4]), int(end_date[5:7])) and len(months) < 12:
+        months.add(month)
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return sorted(months)
+
+def scan_pbp_dataset(root=hive_root, seasons=None, season_types=None, start_date=None, end_date=None):
+    """LazyFrame over the partitioned layout with the same columns as the season files (local roots only).
+       seasons (start years), season_types ('R'/'P') and the game_date range prune partitions before any file is opened"""
+    data = pl.scan_parquet(f"{root}/**/*.parquet", hive_partitioning=True, hive_schema=hive_schema)
+    if seasons is not None:
+        data = data.filter(pl.col('season').is_in([int(season_label(season)) for season in seasons]))
+    if season_types is not None:
+        data = data.filter(pl.col('season_type').is_in(season_types))
+    if (start_date is not None) & (end_date is not None):
+        data = data.filter(pl.col('month').is_in(date_range_months(start_date, end_date)))
+    if start_date is not None:
+        data = data.filter(pl.col('game_date') >= start_date)
+    if end_date is not None:
+        data = data.filter(pl.col('game_date') <= end_date)
+    return cast_pbp_types(data.drop('month'))
@@ -0,0 +1,104 @@
+# pbptypes.py
+# Compact dtypes for the play by play columns: fixed category sets for the low cardinality columns (stored as polars Enum
+# columns instead of Utf8) and UInt32 player/team ids (instead of numbers held as text).
+#
+# Enum values are stored as small integer codes into the category list, so the season files and in-memory frames shrink
+# and the many == / is_in filters in applymodels.py compare integers. The codes are positional, which makes the lists a
+# format: only ever APPEND new values (i.e. a new team or event type) and bump pbp_enum_version. Reordering or removing a
+# value would change the meaning of files already written.
+#
+# Player names are not stored on the play by play. The rosters (player_id, firstName, lastName, ...) are the player
+# dimension table: join on the UInt32 ids to label players.
+import polars as pl
+
+# Constants - Version Of The Category Sets Below #
+pbp_enum_version = 1
+
+# Constants - Category Sets #
+event_type_categories = ['FACEOFF', 'SHOT', 'STOPPAGE', 'HIT', 'BLOCKED_SHOT', 'MISSED_SHOT', 'GIVEAWAY', 'TAKEAWAY', 'PENALTY',
+                         'GOAL', 'PERIOD_START', 'PERIOD_END', 'DELAYED_PENALTY', 'GAME_END', 'SHOOTOUT_COMPLETE', 'FAILED_SHOT']
+secondary_type_categories = ['Snap', 'Between Legs', 'Wrap-Around', 'Tip-In', 'Poked', 'Batted', 'Deflected', 'Wrist', 'Slap',
+                             'Backhand', 'Penalty Shot']
+period_type_categories = ['REG', 'OT', 'SO']
+season_type_categories = ['R', 'P']
+event_team_type_categories = ['home', 'away']
+event_zone_categories = ['O', 'D', 'N']
+team_categories = ['ANA', 'ARI', 'ATL', 'BOS', 'BUF', 'CAR', 'CBJ', 'CGY', 'CHI', 'COL', 'DAL', 'DET', 'EDM', 'FLA', 'LAK', 'MIN',
+                   'MTL', 'NJD', 'NSH', 'NYI', 'NYR', 'OTT', 'PHI', 'PHX', 'PIT', 'SEA', 'SJS', 'STL', 'TBL', 'TOR', 'UTA', 'VAN',
+                   'VGK', 'WPG', 'WSH']
+
+# Strength States: Every {home}v{away} Skater Count (E = Empty Net, Also Covers The Ev1/1vE Penalty Shot States Set In applymodels)
+skater_counts = [str(n) for n in range(8)] + ['E']
+strength_categories = [f"{home}v{away}" for home in skater_counts for away in skater_counts]
+
+pbp_enum_dtypes = {
+    'event_type': pl.Enum(event_type_categories),
+    'secondary_type': pl.Enum(secondary_type_categories),
+    'period_type': pl.Enum(period_type_categories),
+    'season_type': pl.Enum(season_type_categories),
+    'event_team_type': pl.Enum(event_team_type_categories),
+    'event_zone': pl.Enum(event_zone_categories),
+    'strength_state': pl.Enum(strength_categories),
+    'true_strength_state': pl.Enum(strength_categories),
+    'event_team_abbr': pl.Enum(team_categories),
+    'home_abbreviation': pl.Enum(team_categories),
+    'away_abbreviation': pl.Enum(team_categories)
+}
+
+# Constants - Player/Team Id Columns #
+pbp_id_dtype = pl.UInt32
+pbp_id_columns = (['event_team_id', 'away_id', 'home_id', 'event_goalie_id', 'servedby_player_id',
+                   'event_player_1_id', 'event_player_2_id', 'event_player_3_id', 'event_player_4_id', 'home_goalie', 'away_goalie'] +
+                  [f"{team}_{n}_on_id" for team in ['home', 'away'] for n in range(1, 7)])
+
+# Schedule Team Id Columns (Same Dtype As The Play By Play Ids, So The Two Join Directly)
+schedule_id_columns = ['away_team_id', 'home_team_id']
+
+# Name Columns Written Before The Roster Dimension Table (Dropped On Read)
+pbp_name_columns = ['home_goalie_name', 'away_goalie_name'] + [f"{team}_{n}_on_name" for team in ['home', 'away'] for n in range(1, 7)]
+
+
+def unknown_enum_values(df):
+    """{column: values not in its category set} for an eager frame (empty when every value is covered)"""
+    unknown = {}
+    for col, dtype in pbp_enum_dtypes.items():
+        if (col in df.columns) and (df.schema[col] != dtype):
+            values = df.get_column(col).drop_nulls().unique().cast(pl.Utf8)
+            missing = values.filter(~values.is_in(dtype.categories)).to_list()
+            if missing:
+                unknown[col] = missing
+    return unknown
+
+def cast_pbp_types(data):
+    """Casts the low cardinality columns present in data (DataFrame or LazyFrame) to their Enum dtype and the id columns to
+       UInt32, and drops the old player name columns. Columns already in their compact dtype pass through, so season files
+       written before this layout and new files can be read together.
+       Eager frames (a game being ingested) with a value outside the category sets keep the game: the value is nulled and a
+       warning names it (append it to the list above and bump pbp_enum_version). LazyFrames (stored files) still fail on it"""
+    eager = isinstance(data, pl.DataFrame)
+    if eager:
+        unknown = unknown_enum_values(data)
+        if unknown:
+            game_ids = data.get_column('game_id').unique().to_list() if 'game_id' in data.columns else []
+            print(f"WARNING: Values Missing From pbptypes v{pbp_enum_version} Category Sets Set To Null | Game ID: {game_ids} | {unknown}")
+    cols = data.collect_schema().names()
+    return (
+        data
+        .drop([col for col in pbp_name_columns if col in cols])
+        .with_columns([pl.col(col).cast(dtype, strict=not eager) for col, dtype in pbp_enum_dtypes.items() if col in cols] +
+                      [pl.col(col).cast(pbp_id_dtype) for col in pbp_id_columns if col in cols])
+    )
+
+def pbp_schema(schema):
+    """A file schema (list of (name, dtype)) as cast_pbp_types would leave it, so a season file written before the compact
+       dtypes and a new shard compare as the same layout"""
+    return [(name, pbp_enum_dtypes.get(name, pbp_id_dtype if name in pbp_id_columns else dtype))
+            for name, dtype in schema if name not in pbp_name_columns]
+
+def cast_roster_ids(roster):
+    """Roster (player dimension) frame with player_id as UInt32, whichever dtype its file was written with"""
+    return roster.with_columns(pl.col('player_id').cast(pbp_id_dtype))
+
+def cast_schedule_ids(schedule):
+    """Schedule frame with the team ids as UInt32 (like home_id / away_id on the play by play), whichever dtype its file was written with"""
+    return schedule.with_columns([pl.col(col).cast(pbp_id_dtype) for col in schedule_id_columns])
@@ -0,0 +1,154 @@
+# ratelimit.py
+# Per-host adaptive rate limiting for the NHL API.
+#
+# Each host gets a token bucket (requests per second) plus a cap on requests in flight. Both follow AIMD:
+#   1) 429 / 5xx / connection errors -> rate and in-flight cap are cut by backoff_factor
+#   2) every healthy_window healthy responses -> rate grows by rate_step and the cap by 1
+# so a load settles at the fastest throughput the host tolerates without hand tuning.
+import random
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# Constants - Limiter Defaults #
+initial_rate = 20.0        # Requests per second a host starts at
+min_rate = 1.0
+max_rate = 200.0
+rate_step = 2.0            # Requests per second added after each healthy window
+initial_concurrency = 16   # Requests in flight a host starts at
+min_concurrency = 1
+max_concurrency = 64
+backoff_factor = 0.5       # Rate and concurrency multiplier after a throttle/error
+healthy_window = 50        # Healthy responses needed before ramping up
+
+# Constants - Retry Defaults #
+max_retries = 5
+retry_statuses = {429, 500, 502, 503, 504}
+backoff_base = 0.5         # Seconds, doubled every attempt
+backoff_cap = 60.0         # Longest single wait in seconds
+
+
+class HostLimiter:
+    """Token bucket + adaptive in-flight cap for a single host"""
+    def __init__(self, host, rate=initial_rate, concurrency=initial_concurrency):
+        self.host = host
+        self.rate = rate
+        self.concurrency = concurrency
+        self.tokens = rate
+        self.last_refill = time.monotonic()
+        self.in_flight = 0
+        self.healthy = 0
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+        self.errors = 0
+        self.cond = threading.Condition()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def acquire(self):
+        """Blocks until there is a free in-flight slot and a token"""
+        with self.cond:
+            while True:
+                self._refill()
+                if (self.in_flight < self.concurrency) & (self.tokens >= 1):
+                    self.tokens -= 1
+                    self.in_flight += 1
+                    self.requests += 1
+                    return
+                wait = (1 - self.tokens) / self.rate if self.tokens < 1 else None
+                self.cond.wait(timeout=wait)
+
+    def release(self):
+        with self.cond:
+            self.in_flight -= 1
+            self.cond.notify_all()
+
+    @contextmanager
+    def slot(self):
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def record_success(self):
+        """Additive increase once a full window of responses came back healthy"""
+        with self.cond:
+            self.healthy += 1
+            if self.healthy >= healthy_window:
+                self.healthy = 0
+                self.rate = min(max_rate, self.rate + rate_step)
+                self.concurrency = min(max_concurrency, self.concurrency + 1)
+                self.cond.notify_all()
+
+    def record_failure(self, status_code=None):
+        """Multiplicative decrease on a 429, 5xx or connection error"""
+        with self.cond:
+            self.healthy = 0
+            if status_code == 429:
+                self.throttled += 1
+            else:
+                self.errors += 1
+            self.rate = max(min_rate, self.rate * backoff_factor)
+            self.concurrency = max(min_concurrency, int(self.concurrency * backoff_factor))
+            self.tokens = min(self.tokens, self.rate)
+
+    def record_retry(self):
+        with self.cond:
+            self.retries += 1
+
+    def stats(self):
+        with self.cond:
+            return {
+                'rate': round(self.rate, 2),
+                'concurrency': self.concurrency,
+                'in_flight': self.in_flight,
+                'requests': self.requests,
+                'retries': self.retries,
+                'throttled': self.throttled,
+                'errors': self.errors
+            }
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(host):
+    """Returns the process wide limiter for a host, creating it on first use"""
+    limiter = _limiters.get(host)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.setdefault(host, HostLimiter(host))
+    return limiter
+
+def limiter_stats():
+    """Current rate, in-flight cap and retry counts for every host seen so far"""
+    return {host: limiter.stats() for host, limiter in list(_limiters.items())}
+
+def backoff_delay(attempt):
+    """Full jitter exponential backoff: uniform between 0 and base * 2^attempt (capped)"""
+    return random.uniform(0, min(backoff_cap, backoff_base * (2 ** attempt)))
+
+def retry_after_delay(response):
+    """Seconds requested by a Retry-After header (delta seconds or HTTP date). None if absent or unreadable"""
+    value = response.headers.get('Retry-After')
+    if value is None:
+        return None
+    try:
+        return min(backoff_cap, max(0.0, float(value)))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return min(backoff_cap, max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds()))
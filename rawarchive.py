@@ -0,0 +1,64 @@
+# rawarchive.py
+# Content-addressed, gzip compressed archive of raw NHL API payloads.
+#
+# Layout:
+#   Archive/objects/ab/cdef....json.gz   <- payload bytes, named by sha256 of the uncompressed content
+#   Archive/refs/{endpoint}/{key}        <- text file holding the sha256 of the payload for that key
+#
+# Identical payloads (i.e. re-downloading a final game) are only stored once, and writes are atomic
+# (temp file + os.replace) so concurrent fetch threads never leave a half written object behind.
+import gzip
+import hashlib
+import os
+import uuid
+
+# Constants - Archive Location + Endpoints #
+archive_root = 'Archive'
+archive_endpoints = ['pbp', 'shifts', 'roster', 'schedule']
+
+
+class ArchiveMissError(ValueError):
+    """Raised in replay mode when a payload was never archived"""
+
+
+def _object_path(digest):
+    return os.path.join(archive_root, 'objects', digest[:2], digest[2:] + '.json.gz')
+
+def _ref_path(endpoint, key):
+    return os.path.join(archive_root, 'refs', endpoint, str(key))
+
+def _atomic_write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+def archive_put(endpoint, key, content):
+    """Stores raw payload bytes for endpoint/key and returns their sha256"""
+    digest = hashlib.sha256(content).hexdigest()
+    obj_path = _object_path(digest)
+    if not os.path.exists(obj_path):
+        _atomic_write(obj_path, gzip.compress(content))
+    _atomic_write(_ref_path(endpoint, key), digest.encode())
+    return digest
+
+def archive_get(endpoint, key):
+    """Returns the raw payload bytes for endpoint/key, or None if it was never archived"""
+    ref_path = _ref_path(endpoint, key)
+    if not os.path.exists(ref_path):
+        return None
+    with open(ref_path, 'rb') as f:
+        digest = f.read().decode().strip()
+    with open(_object_path(digest), 'rb') as f:
+        return gzip.decompress(f.read())
+
+def archive_has(endpoint, key):
+    return os.path.exists(_ref_path(endpoint, key))
+
+def archive_keys(endpoint):
+    """Lists every archived key for an endpoint"""
+    ref_dir = os.path.join(archive_root, 'refs', endpoint)
+    if not os.path.isdir(ref_dir):
+        return []
+    return sorted(k for k in os.listdir(ref_dir) if not k.endswith('.tmp'))
@@ -1,19 +1,18 @@
 # requirements.py
-
-# Pandas
-import pandas as pd
-pd.set_option('display.max_columns', None)
-pd.set_option('display.max_rows', None)
-import numpy as np
+# Core import layer shared by every entry point (ingestion, update, model application). Only what the nightly
+# load/update path needs is imported here. Pandas, numpy, plotting, sklearn, xgboost and optuna live in modeling.py
+# and are imported on first use. Check the cost with: python startuptime.py
 
 # Polars (Arrow)
-from pyarrow.dataset import dataset
 import polars as pl
-pl.Config.set_tbl_rows(n=-1)
-pl.Config.set_tbl_cols(n=-1)
 
 # Hit API
 import requests
+import asyncio
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED, ALL_COMPLETED
+import multiprocessing
 
 # Tools
 from itertools import chain, product
@@ -23,25 +22,13 @@ from math import pi
 import time
 import statistics
 
-# Plotting
-import matplotlib
-import matplotlib.pyplot as plt
-
-# Modeling
-import sklearn
-from sklearn.model_selection import train_test_split, GridSearchCV
-from sklearn.metrics import r2_score, classification_report, confusion_matrix, precision_recall_fscore_support, mean_squared_error, accuracy_score, roc_curve, roc_auc_score, auc, make_scorer, precision_score, recall_score, log_loss, f1_score
-from sklearn.preprocessing import LabelEncoder
-import xgboost as xgb
-from xgboost import XGBClassifier
-
-
-# HyperTuning
-import optuna
-from optuna.samplers import TPESampler
-
 # Save
 import pickle
 import json
+try:
+    import orjson # Optional: faster JSON decoding of API payloads
+except ImportError:
+    orjson = None
+import io
 import os
-import pathlib
\ No newline at end of file
+import pathlib
@@ -1,14 +1,16 @@
 from requirements import *
+from nhlclient import api_get
+from pbpstore import read_season_pbp
+from pbptypes import cast_roster_ids, pbp_id_dtype
 
 def get_pids(yr):
-    pbp_link = f"PBP/parquet/API_RAW_PBP_Data_{yr}{yr+1}.parquet"
     roster_link = 'Rosters/parquet/all/NHL_Roster_AllSeasons_Full.parquet'
 
     # Load Slim PBP
-    pbp_skater = pl.read_parquet(pbp_link).select('event_player_1_id').rename({"event_player_1_id": "player_id"}).unique()
-    pbp_goalie = pl.read_parquet(pbp_link).select('event_goalie_id').rename({"event_goalie_id": "player_id"}).unique()
+    pbp_skater = read_season_pbp(yr, columns=['event_player_1_id']).rename({"event_player_1_id": "player_id"}).unique()
+    pbp_goalie = read_season_pbp(yr, columns=['event_goalie_id']).rename({"event_goalie_id": "player_id"}).unique()
     pbp = pbp_skater.extend(pbp_goalie).unique()
-    roster = pl.read_parquet(roster_link).select('player_id').unique()
+    roster = cast_roster_ids(pl.read_parquet(roster_link)).select('player_id').unique()
 
     non_matching_values = pbp.join(roster, on=['player_id'], how='anti')['player_id'].unique().to_list()
     print(len(non_matching_values))
@@ -21,7 +23,7 @@ full_df_list = []
 slim_df_list = []
 for i in player_ids:
     link = f'https://api-web.nhle.com/v1/player/{i}/landing'
-    response = requests.get(link)
+    response = api_get(link)
     
     if response.status_code == 200:
         data = response.json()
@@ -69,7 +71,7 @@ for i in player_ids:
         df = (
             df
             .with_columns([
-                pl.col('player_id').cast(pl.Utf8),
+                pl.col('player_id').cast(pbp_id_dtype),
                 pl.col('season').cast(pl.Int64),
                 pl.when(pl.col('position').is_in(['R', 'C', 'L'])).then(pl.lit(1)).otherwise(pl.lit(0)).alias('pos_F'),
                 pl.when(pl.col('position') == 'D').then(pl.lit(1)).otherwise(pl.lit(0)).alias('pos_D'),
@@ -85,7 +87,7 @@ for i in player_ids:
         slim_df = (
             df
             .select([
-                pl.col('player_id').cast(pl.Utf8),
+                pl.col('player_id').cast(pbp_id_dtype),
                 pl.col('firstName'),
                 pl.col('lastName'),
                 pl.col('pos_F').cast(pl.Int32),
@@ -124,9 +126,9 @@ print(slim_df)
 def compile_rosters(type):
     print(f"Now Compiling {type} Rosters From All NHL Seasons")
     season_roster_path = f"Rosters/parquet/all/NHL_Roster_AllSeasons_{type}.parquet"
-    df = pl.read_parquet(season_roster_path)
+    df = cast_roster_ids(pl.read_parquet(season_roster_path))
 
-    new = pl.read_parquet(f"Rosters/parquet/{type.lower()}/ADD_NHL_Roster_{type}.parquet")
+    new = cast_roster_ids(pl.read_parquet(f"Rosters/parquet/{type.lower()}/ADD_NHL_Roster_{type}.parquet"))
     df = df.extend(new).unique()
     
     # Save
@@ -0,0 +1,70 @@
+# startuptime.py
+# Import-time check for the entry points, measured with python -X importtime in a fresh interpreter per module.
+#
+# Ingestion entry points must not pull in the modeling stack (see requirements.py / modeling.py); this exits non-zero
+# if one does, or if an import takes longer than --budget-ms.
+#   python startuptime.py
+#   python startuptime.py --modules initalize applymodels --top 15 --budget-ms 1500
+import argparse
+import os
+import subprocess
+import sys
+
+# Constants - Startup Defaults #
+startup_modules = ['requirements', 'initalize', 'updatedata', 'loaddata', 'loadfunctions', 'applymodels']
+ingestion_modules = ['requirements', 'initalize', 'updatedata', 'loaddata']
+heavy_packages = ['pandas', 'numpy', 'pyarrow.dataset', 'matplotlib', 'sklearn', 'xgboost', 'optuna']
+startup_top = 10
+
+
+def import_times(module):
+    """{imported module: (self us, cumulative us)} from python -X importtime -c 'import module'"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+def heavy_imports(times):
+    return sorted({pkg for pkg in heavy_packages for name in times if (name == pkg) | name.startswith(f"{pkg}.")})
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Import time of each entry point (python -X importtime)')
+    parser.add_argument('--modules', nargs='+', default=startup_modules)
+    parser.add_argument('--top', type=int, default=startup_top, help='slowest top level packages to list per module')
+    parser.add_argument('--budget-ms', type=float, default=None, help='fail if any module takes longer to import')
+    args = parser.parse_args()
+
+    failures = []
+    for module in args.modules:
+        times = import_times(module)
+        total_ms = times[module][1] / 1000
+
+        # 1) Slowest Top Level Packages (Cumulative, So Submodules Are Counted Once Under Their Package; site Is Interpreter Startup)
+        packages = {}
+        for name, (_, cumulative_us) in times.items():
+            root = name.split('.')[0]
+            if (root != module) & (root != 'site') & (name == root):
+                packages[root] = cumulative_us
+        slowest = sorted(packages.items(), key=lambda kv: kv[1], reverse=True)[:args.top]
+
+        print(f"{module}: {round(total_ms, 1)} ms")
+        for name, cumulative_us in slowest:
+            print(f"  {name:>24}: {round(cumulative_us / 1000, 1)} ms")
+
+        # 2) Guards
+        heavy = heavy_imports(times)
+        if (module in ingestion_modules) & (len(heavy) > 0):
+            failures.append(f"{module} imports modeling packages at startup: {', '.join(heavy)}")
+        if (args.budget_ms is not None) and (total_ms > args.budget_ms):
+            failures.append(f"{module} took {round(total_ms, 1)} ms to import (budget {args.budget_ms} ms)")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
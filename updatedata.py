@@ -3,12 +3,15 @@
 from initalize import *
 
 update_year = 2024
+archive = archive_mode # 'replay' rebuilds from Archive/ with no network
+partitioned = pbp_partitioned # True also appends new games to the PBP/hive partitions
 
-update_start = time.time()
+# Guarded so transform worker processes (spawned by update_pbp) can import this file without re-running the update
+if __name__ == '__main__':
+    update_start = time.time()
 
-updater = Update(year=update_year)
-
-updater.update_schedule()
-roster_data = updater.update_roster()
-updater.update_pbp(roster_obj = roster_data)
+    updater = Update(year=update_year, archive=archive, partitioned=partitioned)
 
+    updater.update_schedule()
+    roster_data = updater.update_roster()
+    updater.update_pbp(roster_obj = roster_data, concurrency = fetch_concurrency, workers = transform_workers)